@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
@@ -33,26 +33,67 @@ class Settings(BaseSettings):
     OPENROUTER_API_KEY: str
     OPENROUTER_MODEL: str = "x-ai/grok-4-fast:free"
 
+    # LLM HTTP Client
+    LLM_HTTP_TIMEOUT: float = 60.0
+    LLM_HTTP2_ENABLED: bool = True
+    LLM_HTTP_MAX_CONNECTIONS: int = 20
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+
+    # LLM Response Cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_BACKEND: str = "tiered"  # "memory", "redis" or "tiered"
+    LLM_CACHE_TTL: int = 86400
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+
+    # Result Stream
+    RESULT_STREAM_KEEP_ALIVE: float = 15.0  # Seconds between SSE keep-alive comments
+
+    # Result Cache
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_TTL: int = 86400  # Completed and failed results
+    RESULT_CACHE_PENDING_TTL: int = 2  # Queued and processing statuses
+
     # Application
     APP_ENV: str = "development"
 
     # Upload
     MAX_FILE_SIZE: int = 10485760  # 10MB
+    UPLOAD_CHUNK_SIZE: int = 1048576  # 1MB
     UPLOAD_DIR: str = "./uploads"
     REFERENCE_DOCS_DIR: str = "./reference_docs"
 
+    # PDF Extraction
+    PDF_EXTRACT_WORKERS: int = 0  # 0 = one process per CPU
+    PDF_PARALLEL_MIN_PAGES: int = 64
+
     # ChromaDB
     CHROMA_PERSIST_DIR: str = "./chroma_db"
+    RAG_INGEST_BATCH_SIZE: int = 64  # Chunks embedded and written per call
+    RAG_CHUNK_MAX_TOKENS: int = 210  # Estimated; margin below the 256 wordpiece limit
+    RAG_CHUNK_OVERLAP_TOKENS: int = 30
+
+    # Embeddings
+    RAG_EMBEDDING_FUNCTION: str = "default"  # "default" (all-MiniLM-L6-v2) or "hashing"
+    RAG_HASHING_EMBEDDING_DIMENSIONS: int = 384
+    RAG_EMBEDDING_CACHE_ENABLED: bool = True
+    # Defaults to embedding_cache.sqlite3 in CHROMA_PERSIST_DIR
+    RAG_EMBEDDING_CACHE_PATH: Optional[str] = None
 
     # Celery
     CELERY_BROKER_URL: str
     CELERY_RESULT_BACKEND: str
+    CELERY_PERSISTENT_EVENT_LOOP: bool = True  # One long-lived loop per worker process
 
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
-    RATE_LIMIT_BACKEND: str = "memory"  # "memory" or "redis"
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory", "redis" or "hybrid"
+    RATE_LIMIT_ALGORITHM: str = "sliding_window"  # "sliding_window" or "gcra"
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_PER_HOUR: int = 1000
+    RATE_LIMIT_MAX_KEYS: int = 100000  # In-memory backend, least recently used evicted
+    RATE_LIMIT_SWEEP_INTERVAL: float = 60.0  # Seconds between expired key sweeps
+    RATE_LIMIT_LEASE_SIZE: int = 10  # Hybrid backend, requests reserved per Redis call
     ORIGINAL_RATE_LIMIT_EXCLUDE_PATHS: str = Field(
         default="/health,/docs,/openapi.json", alias="RATE_LIMIT_EXCLUDE_PATHS"
     )
@@ -17,6 +17,13 @@ from app.core.rate_limiter import (
     get_rate_limiter,
     set_rate_limiter,
 )
+from app.core.llm_cache import (
+    CompletionCacheBackend,
+    InMemoryCompletionCache,
+    RedisCompletionCache,
+    TieredCompletionCache,
+    create_completion_cache,
+)
 
 __all__ = [
     "FileUploadException",
@@ -35,4 +42,9 @@ __all__ = [
     "rate_limit",
     "get_rate_limiter",
     "set_rate_limiter",
+    "CompletionCacheBackend",
+    "InMemoryCompletionCache",
+    "RedisCompletionCache",
+    "TieredCompletionCache",
+    "create_completion_cache",
 ]
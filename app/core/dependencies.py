@@ -1,8 +1,12 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database.session import get_db
-from app.repositories.document import DocumentRepository
-from app.repositories.evaluation import EvaluationRepository
+from app.database.session import get_async_db, get_db
+from app.repositories.document import AsyncDocumentRepository, DocumentRepository
+from app.repositories.evaluation import (
+    AsyncEvaluationRepository,
+    EvaluationRepository,
+)
 
 
 def get_document_repository(db: Session = Depends(get_db)) -> DocumentRepository:
@@ -11,3 +15,15 @@ def get_document_repository(db: Session = Depends(get_db)) -> DocumentRepository
 
 def get_evaluation_repository(db: Session = Depends(get_db)) -> EvaluationRepository:
     return EvaluationRepository(db)
+
+
+def get_async_document_repository(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncDocumentRepository:
+    return AsyncDocumentRepository(db)
+
+
+def get_async_evaluation_repository(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncEvaluationRepository:
+    return AsyncEvaluationRepository(db)
@@ -0,0 +1,23 @@
+from app.core.embeddings.cache import (
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    EmbeddingCacheStats,
+    model_key,
+    text_key,
+)
+from app.core.embeddings.hashing import HashingEmbeddingFunction
+from app.core.embeddings.instance import (
+    create_embedding_cache,
+    create_embedding_function,
+)
+
+__all__ = [
+    "CachedEmbeddingFunction",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "model_key",
+    "text_key",
+    "HashingEmbeddingFunction",
+    "create_embedding_cache",
+    "create_embedding_function",
+]
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Sequence, Tuple
+import numpy as np
+from chromadb.api.types import Documents, Embedding, EmbeddingFunction, Embeddings
+
+# Keys per SELECT, below SQLite's limit on bound parameters
+_LOOKUP_BATCH = 500
+
+
+def text_key(text: str) -> bytes:
+    """SHA-256 digest of a text, its key within a model's embeddings"""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def model_key(embedding_function: EmbeddingFunction) -> str:
+    """Identifies the model and its settings, e.g. `hashing:{"dimensions": 384}`"""
+    config = json.dumps(embedding_function.get_config(), sort_keys=True)
+    return f"{embedding_function.name()}:{config}"
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class EmbeddingCache:
+    """
+    Embeddings stored in SQLite, keyed by model and text hash
+
+    Vectors are kept as float32 bytes. The database runs in WAL mode, so
+    the API, workers and the ingestion script can share one file.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize embedding cache
+
+        Args:
+            path: SQLite database file, created if missing
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        # Shared by the threads of asyncio.to_thread and the ingestion
+        # pipeline; every use holds the lock
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # A crash may lose the last writes but never corrupts the file,
+            # which is fine for a cache
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, "
+                "text_sha256 BLOB NOT NULL, "
+                "vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, text_sha256)"
+                ") WITHOUT ROWID"
+            )
+
+    def get_many(self, model: str, keys: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        """Cached embeddings of the keys found"""
+        found: Dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start : start + _LOOKUP_BATCH]
+                rows = self._connection.execute(
+                    "SELECT text_sha256, vector FROM embeddings "
+                    f"WHERE model = ? AND text_sha256 IN ({','.join('?' * len(batch))})",
+                    (model, *batch),
+                )
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def set_many(self, model: str, items: Iterable[Tuple[bytes, Embedding]]) -> None:
+        """Store embeddings in one transaction"""
+        rows = [
+            (model, key, np.asarray(embedding, dtype=np.float32).tobytes())
+            for key, embedding in items
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_sha256, vector) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM embeddings")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()[0]
+
+
+class CachedEmbeddingFunction:
+    """
+    Embedding function that only sends texts missing from the cache to the
+    wrapped model
+
+    Not handed to ChromaDB: collections are configured with the model
+    itself, and callers pass the embeddings computed here explicitly.
+    """
+
+    def __init__(self, embedding_function: EmbeddingFunction, cache: EmbeddingCache):
+        """
+        Initialize cached embedding function
+
+        Args:
+            embedding_function: Model computing the embeddings on a miss
+            cache: Where embeddings are looked up and stored
+        """
+        self.embedding_function = embedding_function
+        self.cache = cache
+        self.model = model_key(embedding_function)
+        self.stats = EmbeddingCacheStats()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        keys = [text_key(text) for text in input]
+        found = self.cache.get_many(self.model, keys)
+
+        # Each distinct missing text is embedded once per call
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, input):
+            if key not in found:
+                missing.setdefault(key, text)
+
+        if missing:
+            embeddings = self.embedding_function(list(missing.values()))
+            computed = dict(zip(missing, embeddings))
+            self.cache.set_many(self.model, computed.items())
+            found.update(computed)
+
+        self.stats.misses += len(missing)
+        self.stats.hits += len(keys) - len(missing)
+        return [found[key] for key in keys]
@@ -0,0 +1,55 @@
+import hashlib
+import re
+from typing import Any, Dict
+import numpy as np
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+from chromadb.utils.embedding_functions import register_embedding_function
+
+_WORD = re.compile(r"\w+")
+
+
+@register_embedding_function
+class HashingEmbeddingFunction(EmbeddingFunction[Documents]):
+    """
+    Deterministic local embedder for offline tests and benchmarks
+
+    Words are hashed into a fixed number of signed buckets and the counts
+    normalized to unit length, so texts sharing words get similar vectors.
+    Nothing is downloaded and the same text always gives the same vector,
+    but it matches words, not meaning.
+    """
+
+    def __init__(self, dimensions: int = 384):
+        """
+        Initialize hashing embedder
+
+        Args:
+            dimensions: Length of the vectors
+        """
+        self.dimensions = dimensions
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [self._embed(text) for text in input]
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for word in _WORD.findall(text.lower()):
+            digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            # Low bits pick the bucket, the top bit the sign, so collisions
+            # tend to cancel out rather than add up
+            vector[value % self.dimensions] += 1.0 if value >> 63 else -1.0
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def name() -> str:
+        return "hashing"
+
+    def get_config(self) -> Dict[str, Any]:
+        return {"dimensions": self.dimensions}
+
+    @staticmethod
+    def build_from_config(config: Dict[str, Any]) -> "HashingEmbeddingFunction":
+        return HashingEmbeddingFunction(config.get("dimensions", 384))
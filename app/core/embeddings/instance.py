@@ -0,0 +1,33 @@
+from pathlib import Path
+from typing import Optional
+from chromadb.api.types import Documents, EmbeddingFunction
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+from app.config import settings
+from app.core.embeddings.cache import EmbeddingCache
+from app.core.embeddings.hashing import HashingEmbeddingFunction
+
+EMBEDDING_CACHE_FILE = "embedding_cache.sqlite3"
+
+
+def create_embedding_function() -> EmbeddingFunction[Documents]:
+    """Build the embedding model configured in settings"""
+    if settings.RAG_EMBEDDING_FUNCTION == "default":
+        return DefaultEmbeddingFunction()
+
+    if settings.RAG_EMBEDDING_FUNCTION == "hashing":
+        return HashingEmbeddingFunction(settings.RAG_HASHING_EMBEDDING_DIMENSIONS)
+
+    raise ValueError(f"Unknown embedding function: {settings.RAG_EMBEDDING_FUNCTION}")
+
+
+def create_embedding_cache() -> Optional[EmbeddingCache]:
+    """Open the embedding cache configured in settings"""
+    if not settings.RAG_EMBEDDING_CACHE_ENABLED:
+        return None
+
+    # Next to the vectors and the ingest manifest by default, rather than
+    # wherever the process happens to start
+    path = settings.RAG_EMBEDDING_CACHE_PATH or (
+        Path(settings.CHROMA_PERSIST_DIR) / EMBEDDING_CACHE_FILE
+    )
+    return EmbeddingCache(Path(path))
@@ -0,0 +1,174 @@
+import asyncio
+from typing import Dict, Optional, Set
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+from app.core.redis_client import redis_client
+from app.schemas.evaluation import EvaluationEvent
+
+# Seconds the listener waits for a message before checking it should go on
+_LISTENER_POLL_TIMEOUT = 1.0
+# Seconds the listener waits before reading again after a Redis error
+_LISTENER_RETRY_DELAY = 1.0
+
+
+class EvaluationSubscription:
+    """Status events of one evaluation, handed over by the shared listener"""
+
+    def __init__(self, events: "EvaluationEvents", channel: str):
+        self.events = events
+        self.channel = channel
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def next_event(self, timeout: float) -> Optional[EvaluationEvent]:
+        """
+        Wait for the next event
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            The event, or None if nothing was published within the timeout
+        """
+        try:
+            data = await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return EvaluationEvent.model_validate_json(data)
+
+    async def close(self) -> None:
+        """Stop receiving events"""
+        await self.events.unsubscribe(self)
+
+
+class EvaluationEvents:
+    """
+    Publishes evaluation status transitions from the worker and lets API
+    clients subscribe to them, so waiting clients need no polling queries
+
+    Publishing is best-effort: Redis errors are logged and never fail an
+    evaluation, since the database stays the source of truth. Subscribers
+    of a process share one pub/sub connection, whose listener hands each
+    message to the queues of the evaluation's subscriptions, so open
+    streams do not each hold a Redis connection.
+    """
+
+    def __init__(self, redis_client: Redis):
+        """
+        Initialize evaluation events
+
+        Args:
+            redis_client: Async Redis client instance
+        """
+        self.redis = redis_client
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pubsub: Optional[PubSub] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._subscriptions: Dict[str, Set[EvaluationSubscription]] = {}
+
+    def _get_channel(self, evaluation_id: str) -> str:
+        """Generate Redis channel name with prefix"""
+        return f"evaluation_events:{evaluation_id}"
+
+    async def publish(self, event: EvaluationEvent) -> None:
+        try:
+            await self.redis.publish(
+                self._get_channel(event.id), event.model_dump_json(exclude_none=True)
+            )
+        except RedisError as e:
+            print(f"Evaluation event publish failed: {str(e)}")
+
+    def _attach(self) -> None:
+        """Set up the pub/sub connection for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Whatever a previous loop left is bound to it and unusable here
+        self._loop = loop
+        self._pubsub = self.redis.pubsub()
+        self._listener = None
+        self._lock = asyncio.Lock()
+        self._subscriptions = {}
+
+    async def subscribe(self, evaluation_id: str) -> EvaluationSubscription:
+        """
+        Subscribe to an evaluation's events; the caller must close it
+
+        Subscribe before reading the current status, so a transition
+        published in between is not missed.
+        """
+        self._attach()
+        channel = self._get_channel(evaluation_id)
+        subscription = EvaluationSubscription(self, channel)
+        async with self._lock:
+            subscriptions = self._subscriptions.setdefault(channel, set())
+            if not subscriptions:
+                await self._pubsub.subscribe(**{channel: self._dispatch})
+            subscriptions.add(subscription)
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen(self._pubsub))
+        return subscription
+
+    async def unsubscribe(self, subscription: EvaluationSubscription) -> None:
+        """Remove a subscription, and its channel once nobody listens to it"""
+        if self._lock is None:
+            return
+        async with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if not subscriptions or subscription not in subscriptions:
+                return
+            subscriptions.discard(subscription)
+            if subscriptions:
+                return
+            del self._subscriptions[subscription.channel]
+            try:
+                await self._pubsub.unsubscribe(subscription.channel)
+            except RedisError:
+                pass
+
+    def _dispatch(self, message: dict) -> None:
+        for subscription in self._subscriptions.get(message["channel"], ()):
+            subscription.messages.put_nowait(message["data"])
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        """Read messages, which pubsub hands to _dispatch, until closed"""
+        while self._pubsub is pubsub:
+            try:
+                await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=_LISTENER_POLL_TIMEOUT
+                )
+            except RedisError as e:
+                # The connection resubscribes when it reconnects
+                print(f"Evaluation event listener failed: {str(e)}")
+                await asyncio.sleep(_LISTENER_RETRY_DELAY)
+
+    async def close(self) -> None:
+        """Stop the listener and release the pub/sub connection"""
+        pubsub, listener = self._pubsub, self._listener
+        # Also ends the listener at its next poll should the cancellation
+        # below be lost
+        self._loop = None
+        self._pubsub = None
+        self._listener = None
+        self._lock = None
+        self._subscriptions = {}
+        if listener is not None:
+            listener.cancel()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+        if pubsub is not None:
+            await pubsub.aclose()
+
+
+def format_sse(event: EvaluationEvent) -> str:
+    """Serialize an event as a Server-Sent Events message"""
+    return f"event: status\ndata: {event.model_dump_json(exclude_none=True)}\n\n"
+
+
+# Comment line that keeps idle connections open through proxies
+SSE_KEEP_ALIVE = ": keep-alive\n\n"
+
+evaluation_events = EvaluationEvents(redis_client)
@@ -48,3 +48,9 @@ class RAGServiceException(Exception):
     """Exception raised for RAG service errors"""
 
     pass
+
+
+class PDFParseException(Exception):
+    """Exception raised when text cannot be extracted from a PDF"""
+
+    pass
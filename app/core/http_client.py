@@ -0,0 +1,66 @@
+import asyncio
+from typing import Optional
+import httpx
+from app.config import settings
+
+http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled keep-alive client configured from settings"""
+    return httpx.AsyncClient(
+        timeout=settings.LLM_HTTP_TIMEOUT,
+        http2=settings.LLM_HTTP2_ENABLED,
+        limits=httpx.Limits(
+            max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use
+
+    Pooled connections are bound to the event loop that opened them, so a
+    client created on a loop that is no longer running is replaced instead
+    of reused.
+    """
+    global http_client, _http_client_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if (
+        http_client is None
+        or http_client.is_closed
+        or (loop is not None and _http_client_loop not in (None, loop))
+    ):
+        http_client = create_http_client()
+        _http_client_loop = None
+
+    if _http_client_loop is None:
+        _http_client_loop = loop
+
+    return http_client
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """Open the process-wide HTTP client on the running loop"""
+    return get_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the process-wide HTTP client and release pooled connections"""
+    global http_client, _http_client_loop
+
+    client = http_client
+    http_client = None
+    _http_client_loop = None
+
+    if client is not None and not client.is_closed:
+        await client.aclose()
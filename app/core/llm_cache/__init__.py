@@ -0,0 +1,21 @@
+from app.core.llm_cache.base import (
+    CachedCompletion,
+    CacheStats,
+    CompletionCacheBackend,
+    make_cache_key,
+)
+from app.core.llm_cache.memory import InMemoryCompletionCache
+from app.core.llm_cache.redis import RedisCompletionCache
+from app.core.llm_cache.tiered import TieredCompletionCache
+from app.core.llm_cache.instance import create_completion_cache
+
+__all__ = [
+    "CachedCompletion",
+    "CacheStats",
+    "CompletionCacheBackend",
+    "make_cache_key",
+    "InMemoryCompletionCache",
+    "RedisCompletionCache",
+    "TieredCompletionCache",
+    "create_completion_cache",
+]
@@ -0,0 +1,89 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Optional, TypedDict
+
+
+class CachedCompletion(TypedDict):
+    completion: str
+    latency: float
+    total_tokens: int
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+    saved_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+def make_cache_key(model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+    """Content-addressed key for a completion request"""
+    payload = json.dumps(
+        {
+            "model": model,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompletionCacheBackend(ABC):
+    """Abstract base class for LLM completion cache backends"""
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Optional[CachedCompletion]:
+        """
+        Look up a cached completion and record the hit or miss
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached completion, or None on a miss
+        """
+        entry = await self._load(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self.stats.saved_seconds += entry.get("latency", 0.0)
+        self.stats.saved_tokens += entry.get("total_tokens", 0)
+        return entry
+
+    @abstractmethod
+    async def _load(self, key: str) -> Optional[CachedCompletion]:
+        """Load an entry without touching the counters"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, entry: CachedCompletion) -> None:
+        """Store a completion"""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Drop a completion, e.g. when its content turned out to be unusable"""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop all cached completions"""
+        pass
@@ -0,0 +1,30 @@
+from typing import Optional
+from app.config import settings
+from app.core.redis_client import redis_client
+from app.core.llm_cache.base import CompletionCacheBackend
+from app.core.llm_cache.memory import InMemoryCompletionCache
+from app.core.llm_cache.redis import RedisCompletionCache
+from app.core.llm_cache.tiered import TieredCompletionCache
+
+
+def create_completion_cache() -> Optional[CompletionCacheBackend]:
+    """Build the completion cache configured in settings"""
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+
+    if settings.LLM_CACHE_BACKEND == "memory":
+        return InMemoryCompletionCache(
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES, ttl=settings.LLM_CACHE_TTL
+        )
+
+    shared = RedisCompletionCache(redis_client, ttl=settings.LLM_CACHE_TTL)
+    if settings.LLM_CACHE_BACKEND == "redis":
+        return shared
+
+    if settings.LLM_CACHE_BACKEND == "tiered":
+        local = InMemoryCompletionCache(
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES, ttl=settings.LLM_CACHE_TTL
+        )
+        return TieredCompletionCache(local=local, shared=shared)
+
+    raise ValueError(f"Unknown LLM cache backend: {settings.LLM_CACHE_BACKEND}")
@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from app.core.llm_cache.base import CachedCompletion, CompletionCacheBackend
+
+
+class InMemoryCompletionCache(CompletionCacheBackend):
+    """In-process LRU completion cache with TTL and size-based eviction"""
+
+    def __init__(self, max_entries: int = 1024, ttl: int = 86400):
+        """
+        Initialize in-memory completion cache
+
+        Args:
+            max_entries: Maximum number of completions kept before evicting
+                the least recently used one
+            ttl: Time to live of each entry in seconds
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, Tuple[float, CachedCompletion]] = OrderedDict()
+
+    async def _load(self, key: str) -> Optional[CachedCompletion]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+
+        expires_at, entry = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CachedCompletion) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, entry)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,65 @@
+import json
+from typing import Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from app.core.llm_cache.base import CachedCompletion, CompletionCacheBackend
+
+
+class RedisCompletionCache(CompletionCacheBackend):
+    """
+    Redis-based completion cache shared across processes
+
+    Entries expire after the TTL; size-based eviction is left to the Redis
+    server's maxmemory policy. Redis errors are treated as cache misses so an
+    unavailable cache never fails an evaluation.
+    """
+
+    def __init__(self, redis_client: Redis, ttl: int = 86400):
+        """
+        Initialize Redis completion cache
+
+        Args:
+            redis_client: Async Redis client instance
+            ttl: Time to live of each entry in seconds
+        """
+        super().__init__()
+        self.redis = redis_client
+        self.ttl = ttl
+
+    def _get_key(self, key: str) -> str:
+        """Generate Redis key with prefix"""
+        return f"llm_cache:{key}"
+
+    async def _load(self, key: str) -> Optional[CachedCompletion]:
+        try:
+            raw = await self.redis.get(self._get_key(key))
+        except RedisError as e:
+            print(f"LLM cache read failed: {str(e)}")
+            return None
+
+        if raw is None:
+            return None
+
+        try:
+            return json.loads(raw)
+        except (TypeError, ValueError):
+            return None
+
+    async def set(self, key: str, entry: CachedCompletion) -> None:
+        try:
+            await self.redis.set(self._get_key(key), json.dumps(entry), ex=self.ttl)
+        except RedisError as e:
+            print(f"LLM cache write failed: {str(e)}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.redis.delete(self._get_key(key))
+        except RedisError as e:
+            print(f"LLM cache delete failed: {str(e)}")
+
+    async def clear(self) -> None:
+        try:
+            async for redis_key in self.redis.scan_iter(match=self._get_key("*")):
+                await self.redis.delete(redis_key)
+        except RedisError as e:
+            print(f"LLM cache clear failed: {str(e)}")
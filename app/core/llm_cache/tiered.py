@@ -0,0 +1,41 @@
+from typing import Optional
+from app.core.llm_cache.base import CachedCompletion, CompletionCacheBackend
+
+
+class TieredCompletionCache(CompletionCacheBackend):
+    """Two-level cache: a fast local tier in front of a shared tier"""
+
+    def __init__(self, local: CompletionCacheBackend, shared: CompletionCacheBackend):
+        """
+        Initialize tiered completion cache
+
+        Args:
+            local: In-process tier checked first
+            shared: Shared tier (e.g. Redis) checked on a local miss
+        """
+        super().__init__()
+        self.local = local
+        self.shared = shared
+
+    async def _load(self, key: str) -> Optional[CachedCompletion]:
+        entry = await self.local.get(key)
+        if entry is not None:
+            return entry
+
+        entry = await self.shared.get(key)
+        if entry is not None:
+            # Promote to the local tier for the next lookup
+            await self.local.set(key, entry)
+        return entry
+
+    async def set(self, key: str, entry: CachedCompletion) -> None:
+        await self.local.set(key, entry)
+        await self.shared.set(key, entry)
+
+    async def delete(self, key: str) -> None:
+        await self.local.delete(key)
+        await self.shared.delete(key)
+
+    async def clear(self) -> None:
+        await self.local.clear()
+        await self.shared.clear()
@@ -1,14 +1,21 @@
-from app.core.rate_limiter.base import RateLimiterBackend
+from app.core.rate_limiter.base import RateLimit, RateLimiterBackend, RateLimitResult
 from app.core.rate_limiter.memory import InMemoryRateLimiter
 from app.core.rate_limiter.redis import RedisRateLimiter
+from app.core.rate_limiter.gcra import InMemoryGCRARateLimiter, RedisGCRARateLimiter
+from app.core.rate_limiter.hybrid import HybridRateLimiter
 from app.core.rate_limiter.middleware import RateLimitMiddleware
 from app.core.rate_limiter.decorator import rate_limit
 from app.core.rate_limiter.instance import get_rate_limiter, set_rate_limiter
 
 __all__ = [
+    "RateLimit",
     "RateLimiterBackend",
+    "RateLimitResult",
     "InMemoryRateLimiter",
     "RedisRateLimiter",
+    "InMemoryGCRARateLimiter",
+    "RedisGCRARateLimiter",
+    "HybridRateLimiter",
     "RateLimitMiddleware",
     "rate_limit",
     "get_rate_limiter",
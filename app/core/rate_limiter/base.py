@@ -1,11 +1,86 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """One limit tier: at most `limit` requests per `window` seconds"""
+
+    limit: int
+    window: int
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    """
+    Outcome of checking a request against one or more tiers
+
+    `limit`, `window`, `remaining` and `retry_after` describe the binding
+    tier: the one that rejected the request with the longest wait, or, when
+    allowed, the one with the fewest requests left.
+    """
+
+    allowed: bool
+    limit: int
+    window: int
+    remaining: int
+    retry_after: Optional[int] = None
+
+
+def binding_result(results: Sequence[RateLimitResult]) -> RateLimitResult:
+    """Pick the result of the tier that decides the request"""
+    if len(results) == 1:
+        return results[0]
+    denied = [result for result in results if not result.allowed]
+    if denied:
+        return max(denied, key=lambda result: result.retry_after or 0)
+    return min(results, key=lambda result: result.remaining)
+
+
+class BackgroundSweeper:
+    """
+    Periodic cleanup_expired calls for in-memory backends
+
+    Subclasses set `sweep_interval`, define `cleanup_expired` and start
+    with `_sweeper = None`.
+    """
+
+    sweep_interval: float
+    _sweeper: Optional[asyncio.Task]
+
+    async def cleanup_expired(self) -> None:
+        raise NotImplementedError
+
+    def start_sweeper(self) -> None:
+        """Run cleanup_expired every sweep_interval seconds in the background"""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+
+    async def stop_sweeper(self) -> None:
+        """Cancel the background sweeper and wait for it to finish"""
+        if self._sweeper is None:
+            return
+        self._sweeper.cancel()
+        try:
+            await self._sweeper
+        except asyncio.CancelledError:
+            pass
+        self._sweeper = None
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.cleanup_expired()
+            except Exception as e:
+                print(f"Rate limiter sweep failed: {str(e)}")
 
 
 class RateLimiterBackend(ABC):
     """Abstract base class for rate limiter backends"""
 
-    @abstractmethod
     async def is_allowed(
         self, key: str, limit: int, window: int
     ) -> tuple[bool, Optional[int]]:
@@ -20,6 +95,23 @@ class RateLimiterBackend(ABC):
         Returns:
             Tuple of (is_allowed, retry_after_seconds)
         """
+        result = await self.check(key, [RateLimit(limit, window)])
+        return result.allowed, result.retry_after
+
+    @abstractmethod
+    async def check(self, key: str, limits: Sequence[RateLimit]) -> RateLimitResult:
+        """
+        Check a request against every tier in one backend operation
+
+        The request is recorded in all tiers only if all of them allow it.
+
+        Args:
+            key: Unique identifier for the rate limit (e.g., IP address, user ID)
+            limits: Tiers to enforce together, e.g. per minute and per hour
+
+        Returns:
+            Result of the binding tier
+        """
         pass
 
     @abstractmethod
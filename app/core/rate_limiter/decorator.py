@@ -1,7 +1,7 @@
 from functools import wraps
 from typing import Callable, Optional
 from fastapi import Request, HTTPException, status
-from app.core.rate_limiter.base import RateLimiterBackend
+from app.core.rate_limiter.base import RateLimit, RateLimiterBackend
 
 
 def rate_limit(
@@ -61,30 +61,27 @@ def rate_limit(
             # Get rate limit key
             key = actual_key_func(request)
 
-            # Check rate limit
-            is_allowed, retry_after = await backend.is_allowed(key, limit, window)
+            # Check rate limit and get remaining requests in one call
+            result = await backend.check(key, [RateLimit(limit, window)])
 
-            if not is_allowed:
+            if not result.allowed:
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail="Rate limit exceeded",
                     headers={
                         "X-RateLimit-Limit": str(limit),
                         "X-RateLimit-Remaining": "0",
-                        "Retry-After": str(retry_after),
+                        "Retry-After": str(result.retry_after),
                     },
                 )
 
-            # Get remaining requests
-            remaining = await backend.get_remaining(key, limit)
-
             # Call original function
             response = await func(*args, **kwargs)
 
             # Add rate limit headers if response supports it
             if hasattr(response, "headers"):
                 response.headers["X-RateLimit-Limit"] = str(limit)
-                response.headers["X-RateLimit-Remaining"] = str(remaining - 1)
+                response.headers["X-RateLimit-Remaining"] = str(result.remaining)
                 response.headers["X-RateLimit-Window"] = str(window)
 
             return response
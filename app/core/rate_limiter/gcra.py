@@ -0,0 +1,284 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence
+from redis.asyncio import Redis
+from app.core.rate_limiter.base import (
+    BackgroundSweeper,
+    RateLimit,
+    RateLimiterBackend,
+    RateLimitResult,
+    binding_result,
+)
+
+# Absorbs float rounding when converting a time debt into a request count
+_EPSILON = 1e-9
+
+
+def _remaining(tier: RateLimit, debt: float) -> int:
+    """Requests still allowed when the theoretical arrival time is `debt` ahead"""
+    interval = tier.window / tier.limit
+    return max(0, tier.limit - math.ceil(max(0.0, debt) / interval - _EPSILON))
+
+
+class InMemoryGCRARateLimiter(BackgroundSweeper, RateLimiterBackend):
+    """
+    In-memory rate limiter using the generic cell rate algorithm (GCRA)
+
+    Each request advances a key's theoretical arrival time (TAT) by
+    window / limit; a request is rejected while the TAT is more than one
+    window ahead of now. Only one TAT per tier is stored per key, so memory
+    and CPU do not grow with the limit, unlike the timestamp-per-request
+    sliding window. Keys are capped at `max_keys` in least recently used
+    order, and a background sweeper drops keys whose TATs have all passed.
+    """
+
+    def __init__(self, max_keys: int = 100_000, sweep_interval: float = 60.0):
+        """
+        Initialize in-memory GCRA rate limiter
+
+        Args:
+            max_keys: Maximum number of tracked keys before evicting the
+                least recently used one
+            sweep_interval: Seconds between background sweeps of expired keys
+        """
+        self.max_keys = max_keys
+        self.sweep_interval = sweep_interval
+        # key -> tier -> theoretical arrival time
+        self._state: OrderedDict[str, Dict[RateLimit, float]] = OrderedDict()
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def check(self, key: str, limits: Sequence[RateLimit]) -> RateLimitResult:
+        """
+        Check a request against every tier using GCRA
+
+        Args:
+            key: Unique identifier for the rate limit
+            limits: Tiers to enforce together
+
+        Returns:
+            Result of the binding tier
+        """
+        # No awaits below, so the read-modify-write is atomic on the event loop
+        now = time.monotonic()
+        tats = self._state.get(key)
+        if tats is None:
+            tats = {}
+        else:
+            self._state.move_to_end(key)
+
+        results = []
+        new_tats = {}
+        for tier in limits:
+            if tier.limit <= 0:
+                results.append(
+                    RateLimitResult(False, tier.limit, tier.window, 0, tier.window)
+                )
+                continue
+
+            new_tat = max(tats.get(tier, now), now) + tier.window / tier.limit
+            allow_at = new_tat - tier.window
+            if now < allow_at:
+                results.append(
+                    RateLimitResult(
+                        False, tier.limit, tier.window, 0, math.ceil(allow_at - now)
+                    )
+                )
+                continue
+
+            new_tats[tier] = new_tat
+            results.append(
+                RateLimitResult(
+                    True, tier.limit, tier.window, _remaining(tier, new_tat - now)
+                )
+            )
+
+        result = binding_result(results)
+        if result.allowed:
+            tats.update(new_tats)
+            if key not in self._state:
+                self._state[key] = tats
+                if len(self._state) > self.max_keys:
+                    self._state.popitem(last=False)
+        return result
+
+    async def reset(self, key: str) -> None:
+        """Reset rate limit for a key"""
+        self._state.pop(key, None)
+
+    async def get_remaining(self, key: str, limit: int) -> int:
+        """Get remaining requests for a key in the tier with this limit"""
+        for tier, tat in self._state.get(key, {}).items():
+            if tier.limit == limit:
+                return _remaining(tier, tat - time.monotonic())
+        return limit
+
+    async def cleanup_expired(self, batch_size: int = 1000) -> None:
+        """
+        Drop tiers whose TAT has passed; they are equivalent to fresh ones
+
+        Keys are swept in batches, yielding to the event loop in between.
+
+        Args:
+            batch_size: Keys examined between yields
+        """
+        keys = list(self._state)
+
+        for start in range(0, len(keys), batch_size):
+            now = time.monotonic()
+            for key in keys[start : start + batch_size]:
+                tats = self._state.get(key)
+                if tats is None:
+                    continue
+                for tier in [tier for tier, tat in tats.items() if tat <= now]:
+                    del tats[tier]
+                if not tats:
+                    del self._state[key]
+
+            await asyncio.sleep(0)
+
+
+# GCRA for every tier as one atomic script on the Redis server clock.
+#
+# KEYS[1]: hash of TATs, one field per tier named "limit/window"
+# ARGV: limit and window in seconds per tier
+# Returns {allowed, binding tier index, remaining, retry_after}
+GCRA_SCRIPT = """
+local key = KEYS[1]
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local allowed = 1
+local binding = 0
+local binding_remaining = nil
+local binding_retry_after = 0
+local updates = {}
+local ttl = 1
+
+for i = 1, #ARGV, 2 do
+    local tier = (i - 1) / 2
+    local limit = tonumber(ARGV[i])
+    local window = tonumber(ARGV[i + 1])
+    local retry_after = nil
+    local remaining = 0
+
+    if limit <= 0 then
+        retry_after = window
+    else
+        local interval = window / limit
+        local field = ARGV[i] .. '/' .. ARGV[i + 1]
+        local tat = tonumber(redis.call('HGET', key, field)) or now
+        local new_tat = math.max(tat, now) + interval
+        local allow_at = new_tat - window
+
+        if now < allow_at then
+            retry_after = math.ceil(allow_at - now)
+        else
+            table.insert(updates, field)
+            table.insert(updates, string.format('%.6f', new_tat))
+            ttl = math.max(ttl, math.ceil(new_tat - now))
+            remaining = limit - math.ceil((new_tat - now) / interval - 1e-9)
+        end
+    end
+
+    if retry_after then
+        if allowed == 1 or retry_after > binding_retry_after then
+            binding = tier
+            binding_retry_after = retry_after
+        end
+        allowed = 0
+    elseif allowed == 1 then
+        if binding_remaining == nil or remaining < binding_remaining then
+            binding = tier
+            binding_remaining = remaining
+        end
+    end
+end
+
+if allowed == 0 then
+    return {0, binding, 0, binding_retry_after}
+end
+
+redis.call('HSET', key, unpack(updates))
+if redis.call('TTL', key) < ttl then
+    redis.call('EXPIRE', key, ttl)
+end
+return {1, binding, binding_remaining, 0}
+"""
+
+
+class RedisGCRARateLimiter(RateLimiterBackend):
+    """
+    Redis-based rate limiter using GCRA
+
+    Stores one small hash per key with a TAT per tier, regardless of the
+    limit, instead of a sorted set member per request, and expires it once
+    every TAT has passed.
+    """
+
+    def __init__(self, redis_client: Redis):
+        """
+        Initialize Redis GCRA rate limiter
+
+        Args:
+            redis_client: Async Redis client instance
+        """
+        self.redis = redis_client
+        self._gcra = redis_client.register_script(GCRA_SCRIPT)
+
+    def _get_key(self, key: str) -> str:
+        """Generate Redis key with prefix"""
+        return f"rate_limit_gcra:{key}"
+
+    async def load_scripts(self) -> None:
+        """Load the Lua script into the Redis script cache at startup"""
+        await self.redis.script_load(GCRA_SCRIPT)
+
+    async def check(self, key: str, limits: Sequence[RateLimit]) -> RateLimitResult:
+        """
+        Check a request against every tier using GCRA, in a single atomic
+        script call
+
+        Args:
+            key: Unique identifier for the rate limit
+            limits: Tiers to enforce together
+
+        Returns:
+            Result of the binding tier
+        """
+        args = []
+        for tier in limits:
+            args += [tier.limit, tier.window]
+
+        allowed, index, remaining, retry_after = await self._gcra(
+            keys=[self._get_key(key)], args=args
+        )
+
+        tier = limits[index]
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=tier.limit,
+            window=tier.window,
+            remaining=remaining,
+            retry_after=None if allowed else retry_after,
+        )
+
+    async def reset(self, key: str) -> None:
+        """Reset rate limit for a key"""
+        await self.redis.delete(self._get_key(key))
+
+    async def get_remaining(self, key: str, limit: int) -> int:
+        """Get remaining requests for a key in the tier with this limit"""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(self._get_key(key))
+        pipe.time()
+        tats, (seconds, microseconds) = await pipe.execute()
+
+        now = seconds + microseconds / 1_000_000
+        for field, tat in tats.items():
+            tier_limit, window = (int(part) for part in field.split("/"))
+            if tier_limit == limit:
+                return _remaining(RateLimit(tier_limit, window), float(tat) - now)
+        return limit
@@ -0,0 +1,223 @@
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Sequence
+from redis.asyncio import Redis
+from app.core.rate_limiter.base import (
+    RateLimit,
+    RateLimiterBackend,
+    RateLimitResult,
+    binding_result,
+)
+
+# Hand out up to a lease of quota per tier from fixed window counters, on the
+# Redis server clock.
+#
+# KEYS[1]: hash with a "limit/window" count and "limit/window:index" field
+#          per tier
+# ARGV[1]: lease size, ARGV[2..]: limit and window in seconds per tier
+# Returns {window index, granted, left unleased, ms until window end} per tier
+LEASE_SCRIPT = """
+local key = KEYS[1]
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local lease = tonumber(ARGV[1])
+local leases = {}
+local ttl = 1
+
+for i = 2, #ARGV, 2 do
+    local limit = tonumber(ARGV[i])
+    local window = tonumber(ARGV[i + 1])
+    local field = ARGV[i] .. '/' .. ARGV[i + 1]
+    local index = math.floor(now / window)
+    local ends_in = (index + 1) * window - now
+
+    local state = redis.call('HMGET', key, field, field .. ':index')
+    local used = 0
+    if tonumber(state[2]) == index then
+        used = tonumber(state[1]) or 0
+    end
+
+    local granted = math.max(0, math.min(lease, limit - used))
+    redis.call('HSET', key, field, used + granted, field .. ':index', index)
+    ttl = math.max(ttl, math.ceil(ends_in))
+
+    table.insert(leases, index)
+    table.insert(leases, granted)
+    table.insert(leases, math.max(0, limit - used - granted))
+    table.insert(leases, math.ceil(ends_in * 1000))
+end
+
+if redis.call('TTL', key) < ttl then
+    redis.call('EXPIRE', key, ttl)
+end
+return leases
+"""
+
+
+@dataclass(slots=True)
+class _Lease:
+    """Quota reserved by this process for one tier of one key"""
+
+    index: int
+    tokens: int
+    unleased: int
+    expires_at: float
+
+
+class HybridRateLimiter(RateLimiterBackend):
+    """
+    Redis-backed rate limiter that decides locally using leased quota
+
+    Each tier is a fixed window counter in Redis. Instead of one round trip
+    per request, a process reserves up to `lease_size` requests of a window
+    at a time and spends them in memory; Redis is only called again once a
+    lease runs out. A window that Redis reports as used up is also rejected
+    locally until it ends.
+
+    Replicas never admit more than the limit per window between them, but
+    quota leased by one replica is unavailable to the others, so up to
+    (replicas - 1) * lease_size requests per window may be rejected early.
+    Like any fixed window, up to twice the limit can pass around a window
+    boundary.
+    """
+
+    def __init__(
+        self, redis_client: Redis, lease_size: int = 10, max_keys: int = 100_000
+    ):
+        """
+        Initialize hybrid rate limiter
+
+        Args:
+            redis_client: Async Redis client instance
+            lease_size: Requests reserved per tier in one Redis call
+            max_keys: Maximum number of keys with local leases before
+                evicting the least recently used one
+        """
+        self.redis = redis_client
+        self.lease_size = lease_size
+        self.max_keys = max_keys
+        self._lease = redis_client.register_script(LEASE_SCRIPT)
+        self._leases: OrderedDict[str, Dict[RateLimit, _Lease]] = OrderedDict()
+
+    def _get_key(self, key: str) -> str:
+        """Generate Redis key with prefix"""
+        return f"rate_limit_lease:{key}"
+
+    async def load_scripts(self) -> None:
+        """Load the Lua script into the Redis script cache at startup"""
+        await self.redis.script_load(LEASE_SCRIPT)
+
+    async def _acquire(
+        self, key: str, leases: Dict[RateLimit, _Lease], tiers: Sequence[RateLimit]
+    ) -> None:
+        """Lease quota for the given tiers in one script call"""
+        args = [self.lease_size]
+        for tier in tiers:
+            args += [tier.limit, tier.window]
+
+        # Measure expiry from before the call, so a lease never outlives the
+        # Redis window it was taken from
+        sent_at = time.monotonic()
+        response = await self._lease(keys=[self._get_key(key)], args=args)
+
+        for i, tier in enumerate(tiers):
+            index, granted, unleased, ends_in_ms = response[4 * i : 4 * i + 4]
+            lease = leases.get(tier)
+            if lease is not None and lease.index == index:
+                # Another check leased from the same window meanwhile
+                lease.tokens += granted
+                lease.unleased = min(lease.unleased, unleased)
+            else:
+                leases[tier] = _Lease(
+                    index, granted, unleased, sent_at + ends_in_ms / 1000
+                )
+
+    async def check(self, key: str, limits: Sequence[RateLimit]) -> RateLimitResult:
+        """
+        Check a request against every tier, calling Redis only for tiers
+        whose local lease is used up or expired
+
+        Args:
+            key: Unique identifier for the rate limit
+            limits: Tiers to enforce together
+
+        Returns:
+            Result of the binding tier
+        """
+        leases = self._leases.get(key)
+        if leases is None:
+            # Registered before leasing, so concurrent first requests for a
+            # key share its leases and no quota taken from Redis is stranded
+            leases = self._leases[key] = {}
+            if len(self._leases) > self.max_keys:
+                self._leases.popitem(last=False)
+        else:
+            self._leases.move_to_end(key)
+
+        now = time.monotonic()
+        stale = []
+        for tier in limits:
+            lease = leases.get(tier)
+            if lease is None or lease.expires_at <= now:
+                stale.append(tier)
+            elif lease.tokens == 0 and lease.unleased > 0:
+                stale.append(tier)
+
+        if stale:
+            try:
+                await self._acquire(key, leases, stale)
+            except BaseException:
+                if not leases and self._leases.get(key) is leases:
+                    del self._leases[key]
+                raise
+            now = time.monotonic()
+
+        results = []
+        for tier in limits:
+            lease = leases[tier]
+            if lease.tokens > 0:
+                remaining = lease.tokens - 1 + lease.unleased
+                results.append(
+                    RateLimitResult(True, tier.limit, tier.window, remaining)
+                )
+            else:
+                # The window is used up, across all replicas
+                retry_after = max(1, math.ceil(lease.expires_at - now))
+                results.append(
+                    RateLimitResult(False, tier.limit, tier.window, 0, retry_after)
+                )
+
+        result = binding_result(results)
+        if result.allowed:
+            for tier in limits:
+                leases[tier].tokens -= 1
+        return result
+
+    async def reset(self, key: str) -> None:
+        """Reset rate limit for a key"""
+        self._leases.pop(key, None)
+        await self.redis.delete(self._get_key(key))
+
+    async def get_remaining(self, key: str, limit: int) -> int:
+        """
+        Get remaining requests for a key in the tier with this limit, as of
+        this process's last lease
+        """
+        now = time.monotonic()
+        for tier, lease in self._leases.get(key, {}).items():
+            if tier.limit == limit and lease.expires_at > now:
+                return lease.tokens + lease.unleased
+        return limit
+
+    async def cleanup_expired(self) -> None:
+        """Drop keys whose leases have all expired"""
+        now = time.monotonic()
+        for key in list(self._leases):
+            leases = self._leases[key]
+            # Empty while its first lease is on the way
+            if leases and all(lease.expires_at <= now for lease in leases.values()):
+                del self._leases[key]
@@ -1,83 +1,156 @@
 import asyncio
+import math
 import time
-from collections import defaultdict
-from typing import Dict, List, Optional
-from app.core.rate_limiter.base import RateLimiterBackend
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Deque, Optional, Sequence
+from app.core.rate_limiter.base import (
+    BackgroundSweeper,
+    RateLimit,
+    RateLimiterBackend,
+    RateLimitResult,
+    binding_result,
+)
 
 
-class InMemoryRateLimiter(RateLimiterBackend):
-    """In-memory rate limiter using sliding window algorithm"""
+class InMemoryRateLimiter(BackgroundSweeper, RateLimiterBackend):
+    """
+    In-memory rate limiter using sliding window algorithm
 
-    def __init__(self):
-        self._requests: Dict[str, List[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+    Each key keeps a deque of request timestamps in arrival order, so expired
+    ones are popped from the left and the newest are counted from the right.
+    Keys are kept in least recently used order and capped at `max_keys`, so
+    memory stays bounded when many distinct clients (e.g. an IP scan) hit
+    the API; a background sweeper drops keys whose requests have all expired.
 
-    async def is_allowed(
-        self, key: str, limit: int, window: int
-    ) -> tuple[bool, Optional[int]]:
+    A check runs without awaiting, so it is atomic on the event loop and
+    needs no lock; concurrent requests never wait on each other.
+    """
+
+    def __init__(self, max_keys: int = 100_000, sweep_interval: float = 60.0):
+        """
+        Initialize in-memory rate limiter
+
+        Args:
+            max_keys: Maximum number of tracked keys before evicting the
+                least recently used one
+            sweep_interval: Seconds between background sweeps of expired keys
         """
-        Check if request is allowed using sliding window algorithm
+        self.max_keys = max_keys
+        self.sweep_interval = sweep_interval
+        self._requests: OrderedDict[str, Deque[float]] = OrderedDict()
+        self._max_window = 0
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def check(self, key: str, limits: Sequence[RateLimit]) -> RateLimitResult:
+        """
+        Check a request against every tier using one sliding window log
+
+        All tiers share the key's timestamps, pruned to the longest window.
 
         Args:
             key: Unique identifier for the rate limit
-            limit: Maximum number of requests allowed
-            window: Time window in seconds
+            limits: Tiers to enforce together
 
         Returns:
-            Tuple of (is_allowed, retry_after_seconds)
+            Result of the binding tier
         """
-        async with self._lock:
-            current_time = time.time()
-            cutoff_time = current_time - window
+        current_time = time.monotonic()
+        max_window = max(tier.window for tier in limits)
+        self._max_window = max(self._max_window, max_window)
+
+        timestamps = self._requests.get(key)
+        if timestamps is None:
+            timestamps = deque()
+        else:
+            self._requests.move_to_end(key)
 
             # Remove expired timestamps
-            self._requests[key] = [ts for ts in self._requests[key] if ts > cutoff_time]
+            cutoff_time = current_time - max_window
+            while timestamps and timestamps[0] <= cutoff_time:
+                timestamps.popleft()
 
-            # Check if under limit
-            if len(self._requests[key]) < limit:
-                self._requests[key].append(current_time)
-                return True, None
+        results = []
+        for tier in limits:
+            if tier.window == max_window:
+                count = len(timestamps)
+            else:
+                # Count the newest timestamps inside this tier's window; no
+                # more than `limit` are needed to decide
+                cutoff_time = current_time - tier.window
+                count = 0
+                for ts in islice(reversed(timestamps), tier.limit):
+                    if ts <= cutoff_time:
+                        break
+                    count += 1
+
+            if count < tier.limit:
+                results.append(
+                    RateLimitResult(
+                        True, tier.limit, tier.window, tier.limit - count - 1
+                    )
+                )
+                continue
 
-            # Calculate retry_after
-            if self._requests[key]:
-                oldest_request = min(self._requests[key])
-                retry_after = window - (current_time - oldest_request)
+            if tier.limit > 0:
+                # Wait until enough requests leave the window
+                freed_at = timestamps[-tier.limit] + tier.window
+                retry_after = max(0, math.ceil(freed_at - current_time))
             else:
-                # Edge case: limit is 0, no requests stored
-                retry_after = window
+                # Edge case: limit is 0, nothing can ever be freed
+                retry_after = tier.window
+            results.append(
+                RateLimitResult(False, tier.limit, tier.window, 0, retry_after)
+            )
 
-            return False, max(0, retry_after)
+        result = binding_result(results)
+        if result.allowed:
+            timestamps.append(current_time)
+            if key not in self._requests:
+                self._requests[key] = timestamps
+                if len(self._requests) > self.max_keys:
+                    self._requests.popitem(last=False)
+        return result
 
     async def reset(self, key: str) -> None:
         """Reset rate limit for a key"""
-        async with self._lock:
-            if key in self._requests:
-                del self._requests[key]
+        self._requests.pop(key, None)
 
     async def get_remaining(self, key: str, limit: int) -> int:
         """Get remaining requests for a key"""
-        async with self._lock:
-            current_count = len(self._requests.get(key, []))
-            return max(0, limit - current_count)
+        current_count = len(self._requests.get(key, ()))
+        return max(0, limit - current_count)
 
-    async def cleanup_expired(self, window: int) -> None:
+    async def cleanup_expired(
+        self, window: Optional[int] = None, batch_size: int = 1000
+    ) -> None:
         """
         Cleanup expired entries to prevent memory bloat
-        Should be called periodically by a background task
+
+        Keys are swept in batches, yielding to the event loop in between, so
+        a large table does not stall request handling.
+
+        Args:
+            window: Longest window in seconds; defaults to the longest one
+                checked so far
+            batch_size: Keys examined between yields
         """
-        async with self._lock:
-            current_time = time.time()
-            cutoff_time = current_time - window
+        window = window if window is not None else self._max_window
+        keys = list(self._requests)
+
+        for start in range(0, len(keys), batch_size):
+            cutoff_time = time.monotonic() - window
+            for key in keys[start : start + batch_size]:
+                timestamps = self._requests.get(key)
+                if timestamps is None:
+                    continue
 
-            keys_to_delete = []
-            for key, timestamps in self._requests.items():
                 # Filter out expired timestamps
-                valid_timestamps = [ts for ts in timestamps if ts > cutoff_time]
-                if valid_timestamps:
-                    self._requests[key] = valid_timestamps
-                else:
-                    keys_to_delete.append(key)
-
-            # Remove empty keys
-            for key in keys_to_delete:
-                del self._requests[key]
+                while timestamps and timestamps[0] <= cutoff_time:
+                    timestamps.popleft()
+
+                # Remove empty keys
+                if not timestamps:
+                    del self._requests[key]
+
+            await asyncio.sleep(0)
@@ -1,19 +1,27 @@
-from typing import Callable, Optional, Union
+from typing import Callable, Optional, Sequence, Union
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from app.core.rate_limiter.base import RateLimiterBackend
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.rate_limiter.base import RateLimit, RateLimiterBackend
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware for rate limiting"""
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware for rate limiting
+
+    Takes the decision and the remaining count from a single backend call
+    and adds the rate limit headers to the response start message, so the
+    response body, streaming or not, passes through untouched.
+    """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         backend: Union[RateLimiterBackend, Callable[[], Optional[RateLimiterBackend]]],
         limit: int = 100,
         window: int = 60,
+        limits: Optional[Sequence[RateLimit]] = None,
         key_func: Optional[Callable[[Request], str]] = None,
         exclude_paths: Optional[list[str]] = None,
     ):
@@ -21,81 +29,82 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Initialize rate limit middleware
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             backend: Rate limiter backend (memory or Redis)
             limit: Maximum requests per window
             window: Time window in seconds
+            limits: Tiers enforced together in one backend call, e.g. per
+                minute and per hour; overrides limit and window
             key_func: Function to extract rate limit key from request
             exclude_paths: List of paths to exclude from rate limiting
         """
-        super().__init__(app)
+        self.app = app
         self.backend = backend
-        self.limit = limit
-        self.window = window
-        self.key_func = key_func or self._default_key_func
-        self.exclude_paths = exclude_paths or []
-
-    def _default_key_func(self, request: Request) -> str:
-        """Default key function using client IP"""
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
+        self.limits = list(limits) if limits else [RateLimit(limit, window)]
+        self.key_func = key_func
+        self.exclude_paths = tuple(exclude_paths or [])
+
+    def _default_key(self, scope: Scope) -> str:
+        """Default key using client IP, read straight from the ASGI scope"""
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
     def _should_exclude(self, path: str) -> bool:
         """Check if path should be excluded from rate limiting"""
-        for exclude_path in self.exclude_paths:
-            if path.startswith(exclude_path):
-                return True
-        return False
+        return path.startswith(self.exclude_paths)
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with rate limiting"""
-
-        # Skip rate limiting for excluded paths
-        if self._should_exclude(request.url.path):
-            return await call_next(request)
+        if scope["type"] != "http" or self._should_exclude(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         if callable(self.backend):
             self.backend = self.backend()
 
         if not self.backend:
             print("Rate limiter backend not set, skipping rate limiting")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Get rate limit key
-        key = self.key_func(request)
-
-        # Check rate limit
-        is_allowed, retry_after = await self.backend.is_allowed(
-            key, self.limit, self.window
-        )
+        if self.key_func:
+            key = self.key_func(Request(scope))
+        else:
+            key = self._default_key(scope)
 
-        # Get remaining requests
-        remaining = await self.backend.get_remaining(key, self.limit)
+        # Check every tier at once; headers report the binding one
+        result = await self.backend.check(key, self.limits)
 
-        if not is_allowed:
+        if not result.allowed:
             # Rate limit exceeded
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "detail": "Rate limit exceeded",
-                    "retry_after": retry_after,
+                    "retry_after": result.retry_after,
                 },
                 headers={
-                    "X-RateLimit-Limit": str(self.limit),
+                    "X-RateLimit-Limit": str(result.limit),
                     "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(retry_after),
-                    "Retry-After": str(retry_after),
+                    "X-RateLimit-Window": str(result.window),
+                    "X-RateLimit-Reset": str(result.retry_after),
+                    "Retry-After": str(result.retry_after),
                 },
             )
-
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(self.limit)
-        response.headers["X-RateLimit-Remaining"] = str(remaining - 1)
-        response.headers["X-RateLimit-Window"] = str(self.window)
-
-        return response
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(result.limit)
+                headers["X-RateLimit-Remaining"] = str(result.remaining)
+                headers["X-RateLimit-Window"] = str(result.window)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -1,7 +1,71 @@
-import time
-from typing import Optional
+import uuid
+from typing import Sequence
 from redis.asyncio import Redis
-from app.core.rate_limiter.base import RateLimiterBackend
+from app.core.rate_limiter.base import RateLimit, RateLimiterBackend, RateLimitResult
+
+# Prune, count every tier, conditionally insert and set the TTL in one
+# atomic step. Timestamps come from the Redis server clock, so replicas with
+# skewed clocks share one consistent window.
+#
+# KEYS[1]: sorted set of request timestamps, shared by all tiers
+# ARGV[1]: unique member, ARGV[2..]: limit and window in seconds per tier
+# Returns {allowed, binding tier index, remaining, retry_after}
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local max_window = 0
+for i = 2, #ARGV, 2 do
+    max_window = math.max(max_window, tonumber(ARGV[i + 1]))
+end
+redis.call('ZREMRANGEBYSCORE', key, 0, now - max_window)
+
+local allowed = 1
+local binding = 0
+local binding_remaining = nil
+local binding_retry_after = 0
+
+for i = 2, #ARGV, 2 do
+    local tier = (i - 2) / 2
+    local limit = tonumber(ARGV[i])
+    local window = tonumber(ARGV[i + 1])
+    local window_start = '(' .. (now - window)
+    local count = redis.call('ZCOUNT', key, window_start, '+inf')
+
+    if count >= limit then
+        local retry_after = window
+        if limit > 0 then
+            -- Wait until enough requests leave the window
+            local freed = redis.call(
+                'ZRANGEBYSCORE', key, window_start, '+inf',
+                'WITHSCORES', 'LIMIT', count - limit, 1
+            )
+            retry_after = math.floor(tonumber(freed[2]) + window - now) + 1
+        end
+        if allowed == 1 or retry_after > binding_retry_after then
+            binding = tier
+            binding_retry_after = retry_after
+        end
+        allowed = 0
+    elseif allowed == 1 then
+        local remaining = limit - count - 1
+        if binding_remaining == nil or remaining < binding_remaining then
+            binding = tier
+            binding_remaining = remaining
+        end
+    end
+end
+
+if allowed == 0 then
+    return {0, binding, 0, binding_retry_after}
+end
+
+redis.call('ZADD', key, now, ARGV[1])
+redis.call('EXPIRE', key, max_window)
+return {1, binding, binding_remaining, 0}
+"""
 
 
 class RedisRateLimiter(RateLimiterBackend):
@@ -15,58 +79,47 @@ class RedisRateLimiter(RateLimiterBackend):
             redis_client: Async Redis client instance
         """
         self.redis = redis_client
+        self._sliding_window = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
 
     def _get_key(self, key: str) -> str:
         """Generate Redis key with prefix"""
         return f"rate_limit:{key}"
 
-    async def is_allowed(
-        self, key: str, limit: int, window: int
-    ) -> tuple[bool, Optional[int]]:
+    async def load_scripts(self) -> None:
         """
-        Check if request is allowed using Redis sorted set
+        Load the Lua script into the Redis script cache at startup, so
+        requests only send EVALSHA; it is reloaded if the cache is flushed
+        """
+        await self.redis.script_load(SLIDING_WINDOW_SCRIPT)
+
+    async def check(self, key: str, limits: Sequence[RateLimit]) -> RateLimitResult:
+        """
+        Check a request against every tier using one Redis sorted set, in a
+        single atomic script call
 
         Args:
             key: Unique identifier for the rate limit
-            limit: Maximum number of requests allowed
-            window: Time window in seconds
+            limits: Tiers to enforce together
 
         Returns:
-            Tuple of (is_allowed, retry_after_seconds)
+            Result of the binding tier
         """
-        redis_key = self._get_key(key)
-        current_time = time.time()
-        cutoff_time = current_time - window
-
-        # Use pipeline for atomic operations
-        pipe = self.redis.pipeline()
-
-        # Remove expired entries
-        pipe.zremrangebyscore(redis_key, 0, cutoff_time)
-
-        # Count current requests
-        pipe.zcard(redis_key)
-
-        # Execute pipeline
-        _, current_count = await pipe.execute()
-
-        # Check if limit exceeded
-        if current_count >= limit:
-            # Get oldest request timestamp
-            oldest = await self.redis.zrange(redis_key, 0, 0, withscores=True)
-            if oldest:
-                oldest_timestamp = oldest[0][1]
-                retry_after = int(oldest_timestamp + window - current_time) + 1
-                return False, retry_after
-            return False, window
-
-        # Add current request
-        await self.redis.zadd(redis_key, {str(current_time): current_time})
-
-        # Set expiration on key
-        await self.redis.expire(redis_key, window)
-
-        return True, None
+        args = [uuid.uuid4().hex]
+        for tier in limits:
+            args += [tier.limit, tier.window]
+
+        allowed, index, remaining, retry_after = await self._sliding_window(
+            keys=[self._get_key(key)], args=args
+        )
+
+        tier = limits[index]
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=tier.limit,
+            window=tier.window,
+            remaining=remaining,
+            retry_after=None if allowed else retry_after,
+        )
 
     async def reset(self, key: str) -> None:
         """Reset rate limit for a key"""
@@ -4,3 +4,20 @@ from app.config import settings
 redis_client = Redis.from_url(
     url=settings.REDIS_URL, encoding="utf-8", decode_responses=True
 )
+
+
+async def reset_redis_client() -> None:
+    """
+    Replace the shared client's connection pool with an empty one
+
+    Pooled connections and the pool's lock are bound to the event loop that
+    used them, so a caller about to close its loop resets the client and the
+    next loop opens fresh connections instead of failing on stale ones.
+    """
+    pool = redis_client.connection_pool
+    redis_client.connection_pool = pool.__class__(
+        connection_class=pool.connection_class,
+        max_connections=pool.max_connections,
+        **pool.connection_kwargs,
+    )
+    await pool.disconnect()
@@ -0,0 +1,82 @@
+from typing import Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from app.config import settings
+from app.core.redis_client import redis_client
+from app.schemas.evaluation import EvaluationResponse
+
+
+class EvaluationResultCache:
+    """
+    Redis read-through cache of pre-serialized /result responses
+
+    Completed and failed results never change, so they are kept for the long
+    TTL and served without touching the database. Queued and processing
+    statuses get a short TTL, which bounds how stale a poll can be. Redis
+    errors are treated as cache misses so the database stays the fallback.
+    """
+
+    def __init__(self, redis_client: Redis, ttl: int = 86400, pending_ttl: int = 2):
+        """
+        Initialize evaluation result cache
+
+        Args:
+            redis_client: Async Redis client instance
+            ttl: Time to live of completed and failed results in seconds
+            pending_ttl: Time to live of queued and processing statuses
+        """
+        self.redis = redis_client
+        self.ttl = ttl
+        self.pending_ttl = pending_ttl
+
+    def _get_key(self, evaluation_id: str) -> str:
+        """Generate Redis key with prefix"""
+        return f"evaluation_result:{evaluation_id}"
+
+    async def get(self, evaluation_id: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Returns:
+            The response body as JSON, or None on a miss
+        """
+        try:
+            return await self.redis.get(self._get_key(evaluation_id))
+        except RedisError as e:
+            print(f"Result cache read failed: {str(e)}")
+            return None
+
+    async def set(self, response: EvaluationResponse) -> str:
+        """
+        Serialize and store a response
+
+        Returns:
+            The serialized response body
+        """
+        body = response.model_dump_json()
+        ttl = self.ttl if response.is_final else self.pending_ttl
+        try:
+            await self.redis.set(self._get_key(response.id), body, ex=ttl)
+        except RedisError as e:
+            print(f"Result cache write failed: {str(e)}")
+        return body
+
+    async def delete(self, evaluation_id: str) -> None:
+        try:
+            await self.redis.delete(self._get_key(evaluation_id))
+        except RedisError as e:
+            print(f"Result cache delete failed: {str(e)}")
+
+
+def get_result_cache() -> Optional[EvaluationResultCache]:
+    """Result cache configured in settings, or None when disabled"""
+    if not settings.RESULT_CACHE_ENABLED:
+        return None
+    return result_cache
+
+
+result_cache = EvaluationResultCache(
+    redis_client,
+    ttl=settings.RESULT_CACHE_TTL,
+    pending_ttl=settings.RESULT_CACHE_PENDING_TTL,
+)
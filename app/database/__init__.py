@@ -1,4 +1,19 @@
 from app.database.base import Base
-from app.database.session import get_db, engine, SessionLocal
+from app.database.session import (
+    get_db,
+    get_async_db,
+    engine,
+    async_engine,
+    SessionLocal,
+    AsyncSessionLocal,
+)
 
-__all__ = ["Base", "get_db", "engine", "SessionLocal"]
+__all__ = [
+    "Base",
+    "get_db",
+    "get_async_db",
+    "engine",
+    "async_engine",
+    "SessionLocal",
+    "AsyncSessionLocal",
+]
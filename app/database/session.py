@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from app.config import settings
 
 username = settings.POSTGRESQL_USER
@@ -9,8 +10,11 @@ host = settings.POSTGRESQL_HOST
 port = settings.POSTGRESQL_PORT
 database = settings.POSTGRESQL_DATABASE
 
+database_url = f"postgresql+psycopg://{username}:{password}@{host}:{port}/{database}"
+
+# Sync engine for the Celery worker and Alembic
 engine = create_engine(
-    f"postgresql+psycopg://{username}:{password}@{host}:{port}/{database}",
+    database_url,
     pool_pre_ping=True,
     pool_size=20,
     max_overflow=0,
@@ -19,6 +23,19 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the API, so DB round trips don't block the event loop
+async_engine = create_async_engine(
+    database_url,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=0,
+    pool_timeout=300,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -26,3 +43,8 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
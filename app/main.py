@@ -2,12 +2,21 @@ from contextlib import asynccontextmanager
 from typing import Optional
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.rate_limiter.base import RateLimiterBackend
+from app.core.rate_limiter.base import (
+    BackgroundSweeper,
+    RateLimit,
+    RateLimiterBackend,
+)
 from app.core.rate_limiter.instance import get_rate_limiter, set_rate_limiter
 from app.core.rate_limiter.middleware import RateLimitMiddleware
 from app.core.redis_client import redis_client
+from app.core.evaluation_events import evaluation_events
+from app.core.http_client import open_http_client, close_http_client
+from app.database.session import async_engine
 from app.core.rate_limiter.memory import InMemoryRateLimiter
 from app.core.rate_limiter.redis import RedisRateLimiter
+from app.core.rate_limiter.gcra import InMemoryGCRARateLimiter, RedisGCRARateLimiter
+from app.core.rate_limiter.hybrid import HybridRateLimiter
 from app.routes import upload, evaluate, result
 from app.config import settings
 
@@ -20,19 +29,57 @@ async def lifespan(app: FastAPI):
 
     # Startup
     if settings.RATE_LIMIT_ENABLED:
+        gcra = settings.RATE_LIMIT_ALGORITHM == "gcra"
         if settings.RATE_LIMIT_BACKEND == "memory":
-            rate_limiter_backend = InMemoryRateLimiter()
+            memory_backend = InMemoryGCRARateLimiter if gcra else InMemoryRateLimiter
+            rate_limiter_backend = memory_backend(
+                max_keys=settings.RATE_LIMIT_MAX_KEYS,
+                sweep_interval=settings.RATE_LIMIT_SWEEP_INTERVAL,
+            )
+            rate_limiter_backend.start_sweeper()
             set_rate_limiter(rate_limiter_backend)
-            print("In-Memory Rate Limiter initialized")
+            print(
+                f"In-Memory Rate Limiter initialized ({settings.RATE_LIMIT_ALGORITHM})"
+            )
         elif settings.RATE_LIMIT_BACKEND == "redis":
-            rate_limiter_backend = RedisRateLimiter(redis_client)
+            rate_limiter_backend = (
+                RedisGCRARateLimiter(redis_client)
+                if gcra
+                else RedisRateLimiter(redis_client)
+            )
+            await rate_limiter_backend.load_scripts()
+            set_rate_limiter(rate_limiter_backend)
+            print(f"Redis Rate Limiter initialized ({settings.RATE_LIMIT_ALGORITHM})")
+        elif settings.RATE_LIMIT_BACKEND == "hybrid":
+            # Fixed windows with quota leased from Redis, decided locally
+            rate_limiter_backend = HybridRateLimiter(
+                redis_client,
+                lease_size=settings.RATE_LIMIT_LEASE_SIZE,
+                max_keys=settings.RATE_LIMIT_MAX_KEYS,
+            )
+            await rate_limiter_backend.load_scripts()
             set_rate_limiter(rate_limiter_backend)
-            print("Redis Rate Limiter initialized")
+            print(
+                f"Hybrid Rate Limiter initialized "
+                f"(lease size {settings.RATE_LIMIT_LEASE_SIZE})"
+            )
+
+    await open_http_client()
 
     yield
 
     # Shutdown
-    if settings.RATE_LIMIT_ENABLED and settings.RATE_LIMIT_BACKEND == "redis":
+    if isinstance(rate_limiter_backend, BackgroundSweeper):
+        await rate_limiter_backend.stop_sweeper()
+
+    await evaluation_events.close()
+    await close_http_client()
+    await async_engine.dispose()
+
+    if settings.RATE_LIMIT_ENABLED and settings.RATE_LIMIT_BACKEND in (
+        "redis",
+        "hybrid",
+    ):
         # Close Redis connection if using Redis backend
         if hasattr(rate_limiter_backend, "redis"):
             await rate_limiter_backend.redis.close()
@@ -60,11 +107,16 @@ if settings.RATE_LIMIT_ENABLED:
     app.add_middleware(
         RateLimitMiddleware,
         backend=get_rate_limiter,
-        limit=settings.RATE_LIMIT_PER_MINUTE,
-        window=60,
+        limits=[
+            RateLimit(settings.RATE_LIMIT_PER_MINUTE, 60),
+            RateLimit(settings.RATE_LIMIT_PER_HOUR, 3600),
+        ],
         exclude_paths=settings.RATE_LIMIT_EXCLUDED_PATHS,
     )
-    print(f"Rate Limiting middleware added: {settings.RATE_LIMIT_PER_MINUTE} req/min")
+    print(
+        f"Rate Limiting middleware added: {settings.RATE_LIMIT_PER_MINUTE} req/min, "
+        f"{settings.RATE_LIMIT_PER_HOUR} req/hour"
+    )
 
 # Include routers
 app.include_router(upload.router)
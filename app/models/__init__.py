@@ -1,4 +1,11 @@
 from app.models.document import Document, DocumentType
+from app.models.document_text import DocumentText
 from app.models.evaluation import Evaluation, EvaluationStatus
 
-__all__ = ["Document", "DocumentType", "Evaluation", "EvaluationStatus"]
+__all__ = [
+    "Document",
+    "DocumentType",
+    "DocumentText",
+    "Evaluation",
+    "EvaluationStatus",
+]
@@ -0,0 +1,28 @@
+from sqlalchemy import UUID, Column, Integer, Float, Text, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.database.base import Base
+from uuid_extensions import uuid7 as generate_uuid7
+
+
+class DocumentText(Base):
+    __tablename__ = "document_texts"
+
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, index=True, default=generate_uuid7
+    )
+    document_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("documents.id"),
+        nullable=False,
+        unique=True,
+        index=True,
+    )
+    content = Column(Text, nullable=False)
+    page_count = Column(Integer, nullable=False)
+    extraction_time = Column(Float, nullable=False)  # seconds
+    extracted_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return (
+            f"<DocumentText(document_id={self.document_id}, pages={self.page_count})>"
+        )
@@ -47,6 +47,9 @@ class Evaluation(Base):
     cv_detailed_scores = Column(JSON, nullable=True)
     project_detailed_scores = Column(JSON, nullable=True)
 
+    # Outputs of completed pipeline stages, kept until results are saved
+    stage_outputs = Column(JSON, nullable=True)
+
     error_message = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0)
 
@@ -1,4 +1,12 @@
-from app.repositories.document import DocumentRepository
-from app.repositories.evaluation import EvaluationRepository
+from app.repositories.document import AsyncDocumentRepository, DocumentRepository
+from app.repositories.evaluation import (
+    AsyncEvaluationRepository,
+    EvaluationRepository,
+)
 
-__all__ = ["DocumentRepository", "EvaluationRepository"]
+__all__ = [
+    "DocumentRepository",
+    "EvaluationRepository",
+    "AsyncDocumentRepository",
+    "AsyncEvaluationRepository",
+]
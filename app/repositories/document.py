@@ -1,7 +1,11 @@
 from datetime import datetime
 from typing import Optional, List
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.document import Document, DocumentType
+from app.models.document_text import DocumentText
 
 
 class DocumentRepository:
@@ -54,3 +58,87 @@ class DocumentRepository:
         document.deleted_at = datetime.now()
         self.db.commit()
         return True
+
+    def get_text(self, document_id: str) -> Optional[DocumentText]:
+        return (
+            self.db.query(DocumentText)
+            .filter(DocumentText.document_id == document_id)
+            .first()
+        )
+
+    def get_text_by_content_hash(self, content_hash: str) -> Optional[DocumentText]:
+        return (
+            self.db.query(DocumentText)
+            .join(Document, DocumentText.document_id == Document.id)
+            .filter(Document.content_hash == content_hash)
+            .first()
+        )
+
+    def save_text(self, document: Document, obj_in: dict) -> DocumentText:
+        db_obj = DocumentText(document_id=document.id, **obj_in)
+        self.db.add(db_obj)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Another worker extracted the same document first
+            self.db.rollback()
+            return self.get_text(str(document.id))
+        self.db.refresh(db_obj)
+        return db_obj
+
+
+class AsyncDocumentRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(
+        self, id: str, exclude_soft_deleted: bool = True
+    ) -> Optional[Document]:
+        filters = [Document.id == id]
+        if exclude_soft_deleted:
+            filters.append(Document.deleted_at.is_(None))
+        return await self.db.scalar(select(Document).filter(*filters).limit(1))
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        document_type: Optional[DocumentType] = None,
+        exclude_soft_deleted: bool = True,
+    ) -> List[Document]:
+        filters = []
+        if document_type:
+            filters.append(Document.document_type == document_type)
+        if exclude_soft_deleted:
+            filters.append(Document.deleted_at.is_(None))
+        result = await self.db.scalars(
+            select(Document).filter(*filters).offset(skip).limit(limit)
+        )
+        return list(result.all())
+
+    async def get_by_filename(
+        self, filename: str, exclude_soft_deleted: bool = True
+    ) -> Optional[Document]:
+        filters = [Document.filename == filename]
+        if exclude_soft_deleted:
+            filters.append(Document.deleted_at.is_(None))
+        return await self.db.scalar(select(Document).filter(*filters).limit(1))
+
+    async def create(self, obj_in: dict) -> Document:
+        db_obj = Document(**obj_in)
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def update(self, document: Document, obj_in: dict) -> Document:
+        for field, value in obj_in.items():
+            setattr(document, field, value)
+        await self.db.commit()
+        await self.db.refresh(document)
+        return document
+
+    async def delete(self, document: Document) -> bool:
+        document.deleted_at = datetime.now()
+        await self.db.commit()
+        return True
@@ -1,4 +1,6 @@
-from typing import Optional, List
+from typing import Any, Optional, List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 from app.models.evaluation import Evaluation, EvaluationStatus
@@ -72,6 +74,15 @@ class EvaluationRepository:
         self.db.refresh(evaluation)
         return evaluation
 
+    def save_checkpoint(
+        self, evaluation: Evaluation, stage: str, output: Any
+    ) -> Evaluation:
+        # Assign a new dict so the JSON column change is detected
+        evaluation.stage_outputs = {**(evaluation.stage_outputs or {}), stage: output}
+        self.db.commit()
+        self.db.refresh(evaluation)
+        return evaluation
+
     def save_results(self, evaluation: Evaluation, results: dict) -> Evaluation:
         evaluation.cv_match_rate = results.get("cv_match_rate")
         evaluation.cv_feedback = results.get("cv_feedback")
@@ -80,8 +91,58 @@ class EvaluationRepository:
         evaluation.overall_summary = results.get("overall_summary")
         evaluation.cv_detailed_scores = results.get("cv_detailed_scores")
         evaluation.project_detailed_scores = results.get("project_detailed_scores")
+        evaluation.stage_outputs = None
         evaluation.status = EvaluationStatus.COMPLETED.value
         evaluation.completed_at = datetime.now()
         self.db.commit()
         self.db.refresh(evaluation)
         return evaluation
+
+
+class AsyncEvaluationRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(
+        self, id: str, exclude_soft_deleted: bool = True
+    ) -> Optional[Evaluation]:
+        filters = [Evaluation.id == id]
+        if exclude_soft_deleted:
+            filters.append(Evaluation.deleted_at.is_(None))
+        return await self.db.scalar(select(Evaluation).filter(*filters).limit(1))
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[EvaluationStatus] = None,
+        exclude_soft_deleted: bool = True,
+    ) -> List[Evaluation]:
+        filters = []
+        if status:
+            filters.append(Evaluation.status == status)
+        if exclude_soft_deleted:
+            filters.append(Evaluation.deleted_at.is_(None))
+        result = await self.db.scalars(
+            select(Evaluation).filter(*filters).offset(skip).limit(limit)
+        )
+        return list(result.all())
+
+    async def create(self, obj_in: dict) -> Evaluation:
+        db_obj = Evaluation(**obj_in)
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def update(self, evaluation: Evaluation, obj_in: dict) -> Evaluation:
+        for field, value in obj_in.items():
+            setattr(evaluation, field, value)
+        await self.db.commit()
+        await self.db.refresh(evaluation)
+        return evaluation
+
+    async def delete(self, evaluation: Evaluation) -> bool:
+        evaluation.deleted_at = datetime.now()
+        await self.db.commit()
+        return True
@@ -1,10 +1,21 @@
+from typing import AsyncIterator, Optional
 from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi.responses import Response, StreamingResponse
 from pydantic import UUID7
-from app.schemas.evaluation import EvaluationResponse, EvaluationResult
-from app.repositories.evaluation import EvaluationRepository
-from app.core.dependencies import get_evaluation_repository
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.schemas.evaluation import EvaluationEvent, EvaluationResponse
+from app.repositories.evaluation import AsyncEvaluationRepository
+from app.core.dependencies import get_async_evaluation_repository
+from app.database.session import get_async_db
+from app.core.evaluation_events import (
+    SSE_KEEP_ALIVE,
+    EvaluationSubscription,
+    evaluation_events,
+    format_sse,
+)
 from app.core.exceptions import EvaluationNotFoundException
-from app.models.evaluation import EvaluationStatus
+from app.core.result_cache import EvaluationResultCache, get_result_cache
 
 router = APIRouter(prefix="/result", tags=["result"])
 
@@ -12,31 +23,24 @@ router = APIRouter(prefix="/result", tags=["result"])
 @router.get("/{id}/", response_model=EvaluationResponse)
 async def get_evaluation_result(
     id: UUID7 = Path(..., description="Evaluation ID"),
-    eval_repo: EvaluationRepository = Depends(get_evaluation_repository),
+    eval_repo: AsyncEvaluationRepository = Depends(get_async_evaluation_repository),
+    result_cache: Optional[EvaluationResultCache] = Depends(get_result_cache),
 ):
     try:
-        evaluation = eval_repo.get(str(id))
+        # Serve the pre-serialized response without touching the database
+        if result_cache:
+            cached = await result_cache.get(str(id))
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
+        evaluation = await eval_repo.get(str(id))
         if not evaluation:
             raise EvaluationNotFoundException(str(id))
 
-        response = EvaluationResponse(
-            id=str(evaluation.id),
-            status=evaluation.status,
-        )
-
-        if evaluation.status == EvaluationStatus.FAILED.value:
-            response.error_message = evaluation.error_message
-
-        if evaluation.status == EvaluationStatus.COMPLETED.value:
-            response.result = EvaluationResult(
-                cv_match_rate=evaluation.cv_match_rate,
-                cv_feedback=evaluation.cv_feedback,
-                project_score=evaluation.project_score,
-                project_feedback=evaluation.project_feedback,
-                overall_summary=evaluation.overall_summary,
-                cv_detailed_scores=evaluation.cv_detailed_scores,
-                project_detailed_scores=evaluation.project_detailed_scores,
-            )
+        response = EvaluationResponse.from_evaluation(evaluation)
+        if result_cache:
+            body = await result_cache.set(response)
+            return Response(content=body, media_type="application/json")
 
         return response
     except HTTPException as http_exc:
@@ -45,3 +49,65 @@ async def get_evaluation_result(
         raise HTTPException(
             status_code=500, detail=f"Failed to retrieve result: {str(e)}"
         )
+
+
+async def stream_evaluation_events(
+    current: EvaluationEvent, subscription: EvaluationSubscription
+) -> AsyncIterator[str]:
+    """Send the current status, then every transition until a final one"""
+    yield format_sse(current)
+    event = current
+    while not event.is_final:
+        next_event = await subscription.next_event(
+            timeout=settings.RESULT_STREAM_KEEP_ALIVE
+        )
+        if next_event is None:
+            yield SSE_KEEP_ALIVE
+            continue
+        event = next_event
+        yield format_sse(event)
+
+
+@router.get("/{id}/stream")
+async def stream_evaluation_result(
+    id: UUID7 = Path(..., description="Evaluation ID"),
+    # Closed once this function returns, so the pooled DB connection is not
+    # held while the stream only waits on Redis
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
+    """
+    Push status transitions as Server-Sent Events instead of polling
+    /result/{id}/; the stream ends after the completed or failed event
+    """
+    subscription = None
+    try:
+        subscription = await evaluation_events.subscribe(str(id))
+
+        evaluation = await AsyncEvaluationRepository(db).get(str(id))
+        if not evaluation:
+            raise EvaluationNotFoundException(str(id))
+
+        current = EvaluationEvent(
+            **EvaluationResponse.from_evaluation(evaluation).model_dump()
+        )
+    except Exception as e:
+        if subscription is not None:
+            await subscription.close()
+        if isinstance(e, HTTPException):
+            raise e
+        raise HTTPException(
+            status_code=500, detail=f"Failed to stream result: {str(e)}"
+        )
+
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for message in stream_evaluation_events(current, subscription):
+                yield message
+        finally:
+            await subscription.close()
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,6 +2,7 @@ from app.schemas.document import DocumentResponse, DocumentCreate, UploadRespons
 from app.schemas.evaluation import (
     EvaluationCreate,
     EvaluationResponse,
+    EvaluationEvent,
     EvaluationQueueResponse,
     EvaluationResult,
 )
@@ -12,6 +13,7 @@ __all__ = [
     "UploadResponse",
     "EvaluationCreate",
     "EvaluationResponse",
+    "EvaluationEvent",
     "EvaluationQueueResponse",
     "EvaluationResult",
 ]
@@ -1,3 +1,4 @@
+from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict, field_validator
 from datetime import datetime
@@ -14,6 +15,7 @@ class DocumentCreate(DocumentBase):
     file_path: str
     file_size: int
     mime_type: str
+    content_hash: Optional[str] = None
 
 
 class DocumentResponse(DocumentBase):
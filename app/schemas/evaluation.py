@@ -6,7 +6,7 @@ from pydantic import (
     field_validator,
 )
 from typing import Optional, Dict
-from app.models.evaluation import EvaluationStatus
+from app.models.evaluation import Evaluation, EvaluationStatus
 
 
 class EvaluationCreate(BaseModel):
@@ -40,6 +40,40 @@ class EvaluationResponse(BaseModel):
             return str(v)
         return v
 
+    @classmethod
+    def from_evaluation(cls, evaluation: Evaluation) -> "EvaluationResponse":
+        response = cls(
+            id=str(evaluation.id),
+            status=evaluation.status,
+        )
+
+        if evaluation.status == EvaluationStatus.FAILED.value:
+            response.error_message = evaluation.error_message
+
+        if evaluation.status == EvaluationStatus.COMPLETED.value:
+            response.result = EvaluationResult(
+                cv_match_rate=evaluation.cv_match_rate,
+                cv_feedback=evaluation.cv_feedback,
+                project_score=evaluation.project_score,
+                project_feedback=evaluation.project_feedback,
+                overall_summary=evaluation.overall_summary,
+                cv_detailed_scores=evaluation.cv_detailed_scores,
+                project_detailed_scores=evaluation.project_detailed_scores,
+            )
+
+        return response
+
+    @property
+    def is_final(self) -> bool:
+        return self.status in (EvaluationStatus.COMPLETED, EvaluationStatus.FAILED)
+
+
+class EvaluationEvent(EvaluationResponse):
+    """Status transition pushed to /result/{id}/stream subscribers"""
+
+    # Pipeline stage now running, while status is processing
+    stage: Optional[str] = None
+
 
 class EvaluationQueueResponse(BaseModel):
     id: str
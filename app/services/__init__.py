@@ -1,5 +1,19 @@
-from app.services.llm_service import LLMService
-from app.services.rag_service import RAGService
-from app.services.evaluation_service import EvaluationService
+from importlib import import_module
 
-__all__ = ["LLMService", "RAGService", "EvaluationService"]
+# Services are imported on first access, so loading one module of this
+# package, e.g. the ingestion pipeline, does not also load ChromaDB and the
+# LLM client
+_EXPORTS = {
+    "LLMService": "llm_service",
+    "ContextQuery": "rag_service",
+    "RAGService": "rag_service",
+    "EvaluationService": "evaluation_service",
+}
+
+__all__ = ["LLMService", "ContextQuery", "RAGService", "EvaluationService"]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"app.services.{_EXPORTS[name]}"), name)
@@ -1,11 +1,40 @@
 import asyncio
-from typing import Dict
+import time
+from typing import Dict, Optional
 from app.services.llm_service import LLMService
-from app.services.rag_service import RAGService
-from app.utils.pdf_parser import extract_text_from_pdf
+from app.services.rag_service import ContextQuery, RAGService
+from app.utils.pdf_parser import extract_pdf_text
+from app.models.document import Document
 from app.repositories.document import DocumentRepository
 from app.repositories.evaluation import EvaluationRepository
-from app.models.evaluation import EvaluationStatus
+from app.models.evaluation import Evaluation, EvaluationStatus
+from app.core.evaluation_events import evaluation_events
+from app.core.result_cache import get_result_cache
+from app.schemas.evaluation import EvaluationEvent, EvaluationResponse
+
+# Rubric lookups use constant queries, so RAGService memoizes their results
+CV_RUBRIC_QUERY = ContextQuery(
+    "CV evaluation criteria scoring rubric",
+    "cv_scoring_rubric",
+    top_k=2,
+    static=True,
+)
+PROJECT_RUBRIC_QUERY = ContextQuery(
+    "Project evaluation criteria scoring rubric",
+    "project_scoring_rubric",
+    top_k=2,
+    static=True,
+)
+STATIC_CONTEXT_QUERIES = [CV_RUBRIC_QUERY, PROJECT_RUBRIC_QUERY]
+
+# Checkpointed pipeline stages; a retry skips the ones already stored
+STAGE_CONTEXTS = "contexts"
+STAGE_CV_EVALUATION = "cv_evaluation"
+STAGE_PROJECT_EVALUATION = "project_evaluation"
+
+# Progress stages reported to status stream subscribers
+STAGE_TEXT_EXTRACTION = "text_extraction"
+STAGE_SUMMARY = "summary"
 
 
 class EvaluationService:
@@ -13,6 +42,70 @@ class EvaluationService:
         self.llm_service = LLMService()
         self.rag_service = RAGService()
         self.rag_service.initialize_collection()
+        self.events = evaluation_events
+        self.result_cache = get_result_cache()
+
+    async def warm_up(self) -> None:
+        """
+        Pay model loading and static retrieval costs up front, so the
+        first evaluation in a worker runs as fast as later ones
+        """
+        await asyncio.to_thread(self.rag_service.warm_up)
+        await self.rag_service.precompute_contexts(STATIC_CONTEXT_QUERIES)
+
+    async def publish_status(self, evaluation: Evaluation) -> None:
+        """
+        Refresh the cached /result response and tell status stream
+        subscribers about a status change
+        """
+        response = EvaluationResponse.from_evaluation(evaluation)
+        if self.result_cache:
+            await self.result_cache.set(response)
+        await self.events.publish(EvaluationEvent(**response.model_dump()))
+
+    async def publish_progress(
+        self, evaluation_id: str, stage: Optional[str] = None
+    ) -> None:
+        """Tell status stream subscribers which stage is running"""
+        await self.events.publish(
+            EvaluationEvent(
+                id=evaluation_id, status=EvaluationStatus.PROCESSING, stage=stage
+            )
+        )
+
+    async def load_document_text(
+        self, document: Document, doc_repo: DocumentRepository
+    ) -> Optional[str]:
+        """
+        Text extraction stage: parse a document's PDF once and reuse the
+        persisted text on every later evaluation and retry
+        """
+        document_text = await asyncio.to_thread(doc_repo.get_text, str(document.id))
+        if not document_text and document.content_hash:
+            # Same bytes were uploaded before: reuse that extraction
+            document_text = await asyncio.to_thread(
+                doc_repo.get_text_by_content_hash, document.content_hash
+            )
+        if document_text:
+            return document_text.content
+
+        started_at = time.perf_counter()
+        pdf_text = await asyncio.to_thread(extract_pdf_text, document.file_path)
+        extraction_time = time.perf_counter() - started_at
+
+        if not pdf_text or not pdf_text["text"]:
+            return None
+
+        document_text = await asyncio.to_thread(
+            doc_repo.save_text,
+            document,
+            {
+                "content": pdf_text["text"],
+                "page_count": pdf_text["page_count"],
+                "extraction_time": extraction_time,
+            },
+        )
+        return document_text.content
 
     async def process_evaluation(
         self,
@@ -20,66 +113,111 @@ class EvaluationService:
         doc_repo: DocumentRepository,
         eval_repo: EvaluationRepository,
     ) -> Dict:
-        """Main evaluation pipeline"""
+        """
+        Main evaluation pipeline
+
+        Repository calls use a sync session, so they run in worker threads
+        to keep other evaluations on the event loop moving.
+        """
 
         # Get evaluation record
-        evaluation = eval_repo.get(evaluation_id)
+        evaluation = await asyncio.to_thread(eval_repo.get, evaluation_id)
         if not evaluation:
             raise ValueError(f"Evaluation {evaluation_id} not found")
 
         # Update status to processing
-        eval_repo.update_status(evaluation, EvaluationStatus.PROCESSING)
+        await asyncio.to_thread(
+            eval_repo.update_status, evaluation, EvaluationStatus.PROCESSING
+        )
+        await self.publish_status(evaluation)
 
         try:
-            # Get documents
-            cv_doc = doc_repo.get(str(evaluation.cv_document_id))
-            project_doc = doc_repo.get(str(evaluation.project_document_id))
-
-            # Extract text from documents
-            cv_text = extract_text_from_pdf(cv_doc.file_path)
-            project_text = extract_text_from_pdf(project_doc.file_path)
-
-            if not cv_text or not project_text:
-                raise ValueError("Failed to extract text from one or both documents")
-
-            # Retrieve relevant context from RAG
-            job_desc_context = self.rag_service.retrieve_context(
-                query=cv_text[:500],  # Use CV snippet as query
-                document_type="job_description",
-                top_k=3,
-            )
+            # Resume from the stages a previous attempt completed
+            checkpoint = evaluation.stage_outputs or {}
+            cv_evaluation = checkpoint.get(STAGE_CV_EVALUATION)
+            project_evaluation = checkpoint.get(STAGE_PROJECT_EVALUATION)
 
-            cv_rubric_context = self.rag_service.retrieve_context(
-                query="CV evaluation criteria scoring rubric",
-                document_type="cv_scoring_rubric",
-                top_k=2,
-            )
+            if cv_evaluation is None or project_evaluation is None:
+                # Get documents
+                cv_doc = await asyncio.to_thread(
+                    doc_repo.get, str(evaluation.cv_document_id)
+                )
+                project_doc = await asyncio.to_thread(
+                    doc_repo.get, str(evaluation.project_document_id)
+                )
 
-            case_study_context = self.rag_service.retrieve_context(
-                query=project_text[:500], document_type="case_study_brief", top_k=3
-            )
+                # Extract text from documents (cached after the first run)
+                await self.publish_progress(evaluation_id, STAGE_TEXT_EXTRACTION)
+                cv_text = await self.load_document_text(cv_doc, doc_repo)
+                project_text = await self.load_document_text(project_doc, doc_repo)
 
-            project_rubric_context = self.rag_service.retrieve_context(
-                query="Project evaluation criteria scoring rubric",
-                document_type="project_scoring_rubric",
-                top_k=2,
-            )
+                if not cv_text or not project_text:
+                    raise ValueError(
+                        "Failed to extract text from one or both documents"
+                    )
 
-            # Stage 1: Evaluate CV and Project
-            cv_evaluation, project_evaluation = await asyncio.gather(
-                self.llm_service.evaluate_cv(
-                    cv_text=cv_text,
-                    job_description=job_desc_context,
-                    scoring_rubric=cv_rubric_context,
-                ),
-                self.llm_service.evaluate_project(
-                    project_text=project_text,
-                    case_study_brief=case_study_context,
-                    scoring_rubric=project_rubric_context,
-                ),
-            )
+                # Retrieve relevant context from RAG in one batched call
+                contexts = checkpoint.get(STAGE_CONTEXTS)
+                if contexts is None:
+                    await self.publish_progress(evaluation_id, STAGE_CONTEXTS)
+                    contexts = await self.rag_service.retrieve_contexts(
+                        [
+                            # Use CV snippet as query
+                            ContextQuery(cv_text[:500], "job_description", top_k=3),
+                            CV_RUBRIC_QUERY,
+                            ContextQuery(
+                                project_text[:500], "case_study_brief", top_k=3
+                            ),
+                            PROJECT_RUBRIC_QUERY,
+                        ]
+                    )
+                    await asyncio.to_thread(
+                        eval_repo.save_checkpoint, evaluation, STAGE_CONTEXTS, contexts
+                    )
+
+                (
+                    job_desc_context,
+                    cv_rubric_context,
+                    case_study_context,
+                    project_rubric_context,
+                ) = contexts
+
+                # Stage 1: Evaluate CV and Project, whichever are still pending
+                stages = {}
+                if cv_evaluation is None:
+                    stages[STAGE_CV_EVALUATION] = self.llm_service.evaluate_cv(
+                        cv_text=cv_text,
+                        job_description=job_desc_context,
+                        scoring_rubric=cv_rubric_context,
+                    )
+                if project_evaluation is None:
+                    stages[STAGE_PROJECT_EVALUATION] = (
+                        self.llm_service.evaluate_project(
+                            project_text=project_text,
+                            case_study_brief=case_study_context,
+                            scoring_rubric=project_rubric_context,
+                        )
+                    )
+
+                await self.publish_progress(evaluation_id, ", ".join(stages))
+
+                # Let both calls finish so a success is kept even if the other fails
+                outputs = await asyncio.gather(*stages.values(), return_exceptions=True)
+                for stage, output in zip(stages, outputs):
+                    if not isinstance(output, BaseException):
+                        await asyncio.to_thread(
+                            eval_repo.save_checkpoint, evaluation, stage, output
+                        )
+                for output in outputs:
+                    if isinstance(output, BaseException):
+                        raise output
+
+                checkpoint = evaluation.stage_outputs
+                cv_evaluation = checkpoint[STAGE_CV_EVALUATION]
+                project_evaluation = checkpoint[STAGE_PROJECT_EVALUATION]
 
             # Stage 3: Synthesize overall summary
+            await self.publish_progress(evaluation_id, STAGE_SUMMARY)
             overall_summary = await self.llm_service.synthesize_summary(
                 cv_evaluation=cv_evaluation,
                 project_evaluation=project_evaluation,
@@ -109,11 +247,13 @@ class EvaluationService:
             }
 
             # Save results
-            eval_repo.save_results(evaluation, results)
+            await asyncio.to_thread(eval_repo.save_results, evaluation, results)
+            await self.publish_status(evaluation)
 
             return results
 
         except Exception as e:
             # Update status to failed
-            eval_repo.update_failed_status(evaluation, str(e))
+            await asyncio.to_thread(eval_repo.update_failed_status, evaluation, str(e))
+            await self.publish_status(evaluation)
             raise
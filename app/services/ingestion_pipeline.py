@@ -0,0 +1,291 @@
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+)
+from app.config import settings
+from app.core.exceptions import RAGServiceException
+from app.utils.pdf_parser import extract_pdf_text
+from app.utils.text_chunker import ChunkStats, TextChunker, chunk_stats
+
+if TYPE_CHECKING:
+    from app.services.rag_service import RAGService
+
+# Marks the end of a queue's items
+_DONE = None
+
+
+class IngestionJob(NamedTuple):
+    path: Path
+    document_type: str
+    document_id: str
+
+
+class ParsedDocument(NamedTuple):
+    job: IngestionJob
+    chunks: List[str]
+    pages: int
+    chunk_stats: Optional[ChunkStats] = None
+    error: Optional[Exception] = None
+
+
+class EmbeddedBatch(NamedTuple):
+    job: IngestionJob
+    start: int
+    chunks: List[str]
+    embeddings: List[Sequence[float]]
+    # Set on the document's last batch, or on its only item when it failed
+    total: Optional[int] = None
+    error: Optional[Exception] = None
+
+
+@dataclass
+class IngestionStats:
+    documents: int = 0
+    failed: int = 0
+    pages: int = 0
+    chunks: int = 0
+    # Token sizes of the chunks parsed
+    tokens: int = 0
+    max_chunk_tokens: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_chunk_tokens(self) -> float:
+        return self.tokens / self.chunks if self.chunks else 0.0
+
+
+def parse_document(job: IngestionJob, chunker: TextChunker) -> ParsedDocument:
+    """Process pool task: extract and chunk one PDF"""
+    # One process per document already, so no nested page-range pool
+    pdf = extract_pdf_text(str(job.path), workers=1)
+    if not pdf["text"]:
+        raise RAGServiceException("No text extracted from document")
+    chunks = chunker.chunk(pdf["text"])
+    return ParsedDocument(
+        job, chunks, pdf["page_count"], chunk_stats(chunks, chunker.count_tokens)
+    )
+
+
+class IngestionPipeline:
+    """
+    Staged reference document ingestion: parse, embed, write
+
+    PDFs are parsed and chunked in a process pool, chunks are embedded in
+    batches on one thread, and a single writer thread makes every vector
+    database write, so the database never sees concurrent writers. Stages
+    are joined by bounded queues: a stage that falls behind blocks the one
+    before it instead of letting parsed text or embeddings pile up.
+    """
+
+    def __init__(
+        self,
+        rag_service: "RAGService",
+        workers: int = 1,
+        batch_size: Optional[int] = None,
+        queue_size: int = 8,
+        on_document: Optional[Callable[[IngestionJob, int], None]] = None,
+        chunker: Optional[TextChunker] = None,
+        on_failure: Optional[Callable[[IngestionJob], None]] = None,
+    ):
+        """
+        Initialize ingestion pipeline
+
+        Args:
+            rag_service: Service whose collection receives the chunks
+            workers: Processes parsing PDFs
+            batch_size: Chunks per embedding call and write, defaults to
+                RAG_INGEST_BATCH_SIZE
+            queue_size: Items buffered between two stages
+            on_document: Called from the writer with the job and its chunk
+                count once all of a document's chunks are stored
+            chunker: Splits document text, defaults to the service's chunker
+            on_failure: Called from the writer with the job of a document
+                that could not be ingested, after its chunks are removed
+        """
+        self.rag_service = rag_service
+        self.workers = max(1, workers)
+        self.batch_size = batch_size or settings.RAG_INGEST_BATCH_SIZE
+        self.queue_size = queue_size
+        self.on_document = on_document
+        self.chunker = chunker or rag_service.chunker
+        self.on_failure = on_failure
+
+    def run(self, jobs: Sequence[IngestionJob]) -> IngestionStats:
+        """Ingest documents, replacing any chunks they had before"""
+        if self.rag_service.collection is None:
+            raise RAGServiceException("Collection not initialized")
+
+        stats = IngestionStats()
+        started_at = time.perf_counter()
+        parsed: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        embedded: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        # Documents whose stored chunks were deleted or written
+        changed: Set[str] = set()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            # Start the parse processes before the stage threads, so no
+            # thread is running when they are forked
+            pool.submit(int).result()
+
+            stages = [
+                threading.Thread(
+                    target=self._embed, args=(parsed, embedded), daemon=True
+                ),
+                threading.Thread(
+                    target=self._write,
+                    args=(embedded, stats, changed, started_at, len(jobs)),
+                    daemon=True,
+                ),
+            ]
+            for stage in stages:
+                stage.start()
+
+            try:
+                self._parse(pool, jobs, parsed, stats)
+            finally:
+                parsed.put(_DONE)
+                for stage in stages:
+                    stage.join()
+
+        if changed:
+            self.rag_service.bump_collection_version()
+        stats.elapsed = time.perf_counter() - started_at
+        return stats
+
+    def _parse(
+        self,
+        pool: ProcessPoolExecutor,
+        jobs: Sequence[IngestionJob],
+        parsed: queue.Queue,
+        stats: IngestionStats,
+    ) -> None:
+        """Keep at most queue_size documents parsing, in completion order"""
+        pending: Dict[Future, IngestionJob] = {}
+        for job in jobs:
+            pending[pool.submit(parse_document, job, self.chunker)] = job
+            if len(pending) >= self.queue_size:
+                self._collect(pending, parsed, stats)
+        while pending:
+            self._collect(pending, parsed, stats)
+
+    def _collect(
+        self,
+        pending: Dict[Future, IngestionJob],
+        parsed: queue.Queue,
+        stats: IngestionStats,
+    ) -> None:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            job = pending.pop(future)
+            try:
+                document = future.result()
+                stats.pages += document.pages
+                stats.tokens += document.chunk_stats.total_tokens
+                stats.max_chunk_tokens = max(
+                    stats.max_chunk_tokens, document.chunk_stats.max_tokens
+                )
+            except Exception as e:
+                # Reported by the writer, which counts every failure
+                document = ParsedDocument(job, [], 0, error=e)
+            parsed.put(document)
+
+    def _embed(self, parsed: queue.Queue, embedded: queue.Queue) -> None:
+        """Embed each document's chunks batch by batch"""
+        while (document := parsed.get()) is not _DONE:
+            chunks = document.chunks
+            try:
+                if document.error is not None:
+                    raise document.error
+                for start in range(0, len(chunks), self.batch_size):
+                    batch = chunks[start : start + self.batch_size]
+                    end = start + len(batch)
+                    embedded.put(
+                        EmbeddedBatch(
+                            document.job,
+                            start,
+                            batch,
+                            self.rag_service.embedding_function(batch),
+                            total=len(chunks) if end == len(chunks) else None,
+                        )
+                    )
+            except Exception as e:
+                embedded.put(EmbeddedBatch(document.job, 0, [], [], error=e))
+        embedded.put(_DONE)
+
+    def _write(
+        self,
+        embedded: queue.Queue,
+        stats: IngestionStats,
+        changed: Set[str],
+        started_at: float,
+        total_jobs: int,
+    ) -> None:
+        """Single writer: replace each document's chunks and report progress"""
+        failed = set()
+        while (batch := embedded.get()) is not _DONE:
+            job = batch.job
+            if job.document_id in failed:
+                continue
+            try:
+                if batch.error is not None:
+                    raise batch.error
+                if batch.start == 0:
+                    changed.add(job.document_id)
+                    self.rag_service.delete_chunks(job.document_id)
+                self.rag_service.add_chunks(
+                    batch.chunks,
+                    job.document_type,
+                    job.document_id,
+                    start=batch.start,
+                    embeddings=batch.embeddings,
+                )
+                stats.chunks += len(batch.chunks)
+                if batch.total is None:
+                    continue
+                if self.on_document:
+                    self.on_document(job, batch.total)
+            except Exception as e:
+                # Keep draining the queue, or the embedding stage would block
+                failed.add(job.document_id)
+                stats.failed += 1
+                print(f"   Failed to ingest {job.path.name}: {str(e)}")
+                self._discard(job, changed)
+                continue
+
+            stats.documents += 1
+            elapsed = time.perf_counter() - started_at
+            print(
+                f"   [{stats.documents + stats.failed}/{total_jobs}] "
+                f"{job.path.name}: {batch.total} chunks "
+                f"({stats.chunks / elapsed:.0f} chunks/s)"
+            )
+
+    def _discard(self, job: IngestionJob, changed: Set[str]) -> None:
+        """Remove what a failed document left, rather than half its chunks"""
+        try:
+            if job.document_id in changed:
+                self.rag_service.delete_chunks(job.document_id)
+            if self.on_failure:
+                self.on_failure(job)
+        except Exception as e:
+            print(f"   Failed to clean up {job.path.name}: {str(e)}")
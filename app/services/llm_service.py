@@ -1,18 +1,37 @@
 import ast
 import re
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Tuple
 import httpx
 import json
 from app.config import settings
 from app.utils.retry import retry_on_llm_error
 from app.core.exceptions import LLMServiceException
+from app.core.http_client import get_http_client
+from app.core.llm_cache import (
+    CachedCompletion,
+    CompletionCacheBackend,
+    create_completion_cache,
+    make_cache_key,
+)
 
 
 class LLMService:
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[CompletionCacheBackend] = None,
+    ):
         self.api_key = settings.OPENROUTER_API_KEY
         self.model = settings.OPENROUTER_MODEL
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self._http_client = http_client
+        self.cache = cache if cache is not None else create_completion_cache()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Injected client if any, otherwise the shared process-wide client"""
+        return self._http_client or get_http_client()
 
     def _extract_json_from_text(self, text: str) -> Optional[str]:
         text = text.strip()
@@ -88,32 +107,73 @@ class LLMService:
             f"Failed to extract valid JSON from response. First 500 chars: {response[:500]}"
         )
 
-    @retry_on_llm_error()
     async def generate_completion(
         self,
         prompt: str,
         temperature: float = 0.3,
         max_tokens: int = 2000,
     ) -> str:
-        """Generate LLM completion"""
+        """Generate LLM completion, served from the completion cache when possible"""
+        if self.cache is None:
+            completion, _ = await self._request_completion(
+                prompt, temperature, max_tokens
+            )
+            return completion
+
+        cache_key = make_cache_key(self.model, prompt, temperature, max_tokens)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached["completion"]
+
+        started_at = time.perf_counter()
+        completion, total_tokens = await self._request_completion(
+            prompt, temperature, max_tokens
+        )
+        await self.cache.set(
+            cache_key,
+            CachedCompletion(
+                completion=completion,
+                latency=time.perf_counter() - started_at,
+                total_tokens=total_tokens,
+            ),
+        )
+        return completion
+
+    async def _forget_completion(
+        self, prompt: str, temperature: float, max_tokens: int
+    ) -> None:
+        """Drop a cached completion whose content could not be used"""
+        if self.cache is not None:
+            await self.cache.delete(
+                make_cache_key(self.model, prompt, temperature, max_tokens)
+            )
+
+    @retry_on_llm_error()
+    async def _request_completion(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> Tuple[str, int]:
+        """Request a completion from OpenRouter, returning (content, total_tokens)"""
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    self.base_url,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": temperature,
-                        "max_tokens": max_tokens,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            response = await self.http_client.post(
+                self.base_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+            total_tokens = (data.get("usage") or {}).get("total_tokens", 0)
+            return data["choices"][0]["message"]["content"], total_tokens
         except httpx.HTTPStatusError as e:
             raise LLMServiceException(
                 f"OpenRouter API error: {e.response.status_code} - {e.response.text}"
@@ -153,7 +213,9 @@ Required JSON format:
 
 Respond with JSON only:"""
 
-        response = await self.generate_completion(prompt, temperature=0.2)
+        # Same parameters, hence cache key, when forgetting the completion
+        params = {"temperature": 0.2, "max_tokens": 2000}
+        response = await self.generate_completion(prompt, **params)
 
         try:
             result = self._parse_json_response(response)
@@ -170,6 +232,7 @@ Respond with JSON only:"""
                     raise LLMServiceException(f"Missing required field: {field}")
             return result
         except Exception as e:
+            await self._forget_completion(prompt, **params)
             raise LLMServiceException(f"Failed to parse CV evaluation: {str(e)}")
 
     async def evaluate_project(
@@ -205,7 +268,9 @@ Required JSON format:
 
 Respond with JSON only:"""
 
-        response = await self.generate_completion(prompt, temperature=0.2)
+        # Same parameters, hence cache key, when forgetting the completion
+        params = {"temperature": 0.2, "max_tokens": 2000}
+        response = await self.generate_completion(prompt, **params)
 
         try:
             result = self._parse_json_response(response)
@@ -224,6 +289,7 @@ Respond with JSON only:"""
             return result
         except Exception as e:
             print(f"[Project Evaluation] Failed to parse response: {response[:500]}")
+            await self._forget_completion(prompt, **params)
             raise LLMServiceException(f"Failed to parse project evaluation: {str(e)}")
 
     async def synthesize_summary(
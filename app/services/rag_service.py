@@ -1,11 +1,36 @@
-from typing import List
+import asyncio
+import re
+import uuid
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 import chromadb
+from chromadb.api.types import Embedding
 from chromadb.config import Settings as ChromaSettings
 from app.config import settings
+from app.core.embeddings import (
+    CachedEmbeddingFunction,
+    create_embedding_cache,
+    create_embedding_function,
+)
 from app.utils.pdf_parser import extract_text_from_pdf
+from app.utils.text_chunker import TextChunker
 from app.core.exceptions import RAGServiceException
 
 
+# Collection metadata flag: every chunk carries document_id metadata
+_DOCUMENT_IDS = "document_ids"
+# Chunk ids as written before document_id metadata existed
+_LEGACY_CHUNK_ID = re.compile(r"(.+)_chunk_\d+")
+_MIGRATION_BATCH = 1000
+
+
+class ContextQuery(NamedTuple):
+    query: str
+    document_type: str
+    top_k: int = 3
+    # Fixed queries whose results only change when reference docs are re-ingested
+    static: bool = False
+
+
 class RAGService:
     def __init__(self):
         self.client = chromadb.Client(
@@ -16,44 +41,184 @@ class RAGService:
                 anonymized_telemetry=False,
             )
         )
+        # The collection is configured with the model; every embedding the
+        # service sends to it goes through the cache when one is enabled
+        self.embedding_model = create_embedding_function()
+        cache = create_embedding_cache()
+        self.embedding_function = (
+            self.embedding_model
+            if cache is None
+            else CachedEmbeddingFunction(self.embedding_model, cache)
+        )
+        self.chunker = TextChunker.from_settings()
         self.collection = None
+        self._static_contexts: Dict[Tuple[str, str, int], str] = {}
+        self._static_contexts_version: Optional[str] = None
 
     def initialize_collection(self, collection_name: str = "reference_docs"):
         """Initialize or get existing collection"""
         try:
             self.collection = self.client.get_or_create_collection(
                 name=collection_name,
-                metadata={"description": "Reference documents for evaluation"},
+                metadata={
+                    "description": "Reference documents for evaluation",
+                    _DOCUMENT_IDS: True,
+                },
+                embedding_function=self.embedding_model,
             )
+            if not (self.collection.metadata or {}).get(_DOCUMENT_IDS):
+                self._migrate_document_ids()
+            self._static_contexts.clear()
+            self._static_contexts_version = None
         except Exception as e:
             raise RAGServiceException(f"Failed to initialize collection: {str(e)}")
 
+    def _migrate_document_ids(self) -> None:
+        """
+        Give chunks stored before document_id metadata existed the id of
+        their document, taken from the chunk id, so they can be deleted by
+        metadata; runs once per collection
+        """
+        offset = 0
+        while True:
+            batch = self.collection.get(
+                include=["metadatas"], limit=_MIGRATION_BATCH, offset=offset
+            )
+            ids, metadatas = [], []
+            for chunk_id, metadata in zip(batch["ids"], batch["metadatas"]):
+                match = _LEGACY_CHUNK_ID.fullmatch(chunk_id)
+                if match and "document_id" not in (metadata or {}):
+                    ids.append(chunk_id)
+                    metadatas.append({"document_id": match.group(1)})
+            if ids:
+                self.collection.update(ids=ids, metadatas=metadatas)
+            if len(batch["ids"]) < _MIGRATION_BATCH:
+                break
+            offset += _MIGRATION_BATCH
+
+        metadata = dict(self.collection.metadata or {})
+        metadata[_DOCUMENT_IDS] = True
+        self.collection.modify(metadata=metadata)
+
+    def get_collection_version(self) -> Optional[str]:
+        """
+        Fingerprint of the collection contents, changed on every ingestion
+
+        Read from storage rather than the local collection object so an
+        ingestion run by another process is noticed.
+        """
+        if self.collection is None:
+            raise RAGServiceException("Collection not initialized")
+
+        collection = self.client.get_collection(
+            name=self.collection.name, embedding_function=self.embedding_model
+        )
+        return (collection.metadata or {}).get("version")
+
+    def bump_collection_version(self) -> None:
+        """Mark the collection as changed, invalidating memoized contexts"""
+        metadata = dict(self.collection.metadata or {})
+        metadata["version"] = uuid.uuid4().hex
+        self.collection.modify(metadata=metadata)
+        self._static_contexts.clear()
+
+    def warm_up(self) -> None:
+        """Load the embedding model and open the collection's index"""
+        if self.collection is None:
+            raise RAGServiceException("Collection not initialized")
+
+        self.embedding_model(["warm up"])
+        self.collection.count()
+
     def ingest_document(
         self,
         document_path: str,
         document_type: str,
         document_id: str,
-    ):
-        """Ingest a document into vector database"""
+    ) -> int:
+        """
+        Ingest a document into vector database, replacing the chunks of any
+        earlier version of it
+
+        Returns:
+            Number of chunks stored
+        """
         try:
             text = extract_text_from_pdf(document_path)
             if not text:
                 raise RAGServiceException("No text extracted from document")
 
-            chunks = self._chunk_text(text, chunk_size=1000, overlap=100)
+            chunks = self._chunk_text(text)
 
             if self.collection is None:
                 raise RAGServiceException("Collection not initialized")
 
-            for i, chunk in enumerate(chunks):
-                self.collection.add(
-                    documents=[chunk],
-                    metadatas=[{"type": document_type, "chunk_index": i}],
-                    ids=[f"{document_id}_chunk_{i}"],
-                )
+            self.delete_chunks(document_id)
+            self.add_chunks(chunks, document_type, document_id)
+
+            self.bump_collection_version()
+            return len(chunks)
         except Exception as e:
             raise RAGServiceException(f"Failed to ingest document: {str(e)}")
 
+    def delete_document(self, document_id: str) -> None:
+        """Remove every chunk of a document from vector database"""
+        try:
+            if self.collection is None:
+                raise RAGServiceException("Collection not initialized")
+
+            self.delete_chunks(document_id)
+            self.bump_collection_version()
+        except Exception as e:
+            raise RAGServiceException(f"Failed to delete document: {str(e)}")
+
+    def delete_chunks(self, document_id: str) -> None:
+        """Remove a document's chunks without bumping the collection version"""
+        self.collection.delete(where={"document_id": document_id})
+
+    def add_chunks(
+        self,
+        chunks: Sequence[str],
+        document_type: str,
+        document_id: str,
+        start: int = 0,
+        embeddings: Optional[Sequence[Embedding]] = None,
+    ) -> None:
+        """
+        Add chunks in batches, so each batch is embedded and written at once
+
+        Written as upserts, so a chunk id left over from an earlier version
+        of the document is overwritten rather than silently kept.
+
+        Args:
+            chunks: Chunk texts
+            document_type: Reference document type used to filter queries
+            document_id: Document the chunks belong to
+            start: Index of the first chunk within the document
+            embeddings: Precomputed embeddings, one per chunk; computed
+                with the embedding function when omitted
+        """
+        batch_size = settings.RAG_INGEST_BATCH_SIZE
+        for offset in range(0, len(chunks), batch_size):
+            end = min(offset + batch_size, len(chunks))
+            indexes = range(start + offset, start + end)
+            batch = list(chunks[offset:end])
+            self.collection.upsert(
+                documents=batch,
+                embeddings=self.embedding_function(batch)
+                if embeddings is None
+                else list(embeddings[offset:end]),
+                metadatas=[
+                    {
+                        "type": document_type,
+                        "document_id": document_id,
+                        "chunk_index": i,
+                    }
+                    for i in indexes
+                ],
+                ids=[f"{document_id}_chunk_{i}" for i in indexes],
+            )
+
     def retrieve_context(
         self,
         query: str,
@@ -65,27 +230,87 @@ class RAGService:
             if self.collection is None:
                 raise RAGServiceException("Collection not initialized")
 
-            results = self.collection.query(
-                query_texts=[query], n_results=top_k, where={"type": document_type}
+            [embedding] = self.embedding_function([query])
+            return self._query_by_embedding(embedding, document_type, top_k)
+        except Exception as e:
+            raise RAGServiceException(f"Failed to retrieve context: {str(e)}")
+
+    async def retrieve_contexts(self, queries: Sequence[ContextQuery]) -> List[str]:
+        """
+        Retrieve several contexts at once
+
+        All query texts are embedded in a single batch, then the vector
+        lookups run concurrently in worker threads so the event loop stays
+        free. Results of static queries are memoized until the collection
+        version changes, so they skip embedding and search entirely.
+        Contexts are returned in the order of the queries.
+        """
+        try:
+            if self.collection is None:
+                raise RAGServiceException("Collection not initialized")
+
+            if any(query.static for query in queries):
+                version = await asyncio.to_thread(self.get_collection_version)
+                if version != self._static_contexts_version:
+                    self._static_contexts.clear()
+                    self._static_contexts_version = version
+
+            contexts: List[Optional[str]] = [
+                self._static_contexts.get(self._static_key(query))
+                if query.static
+                else None
+                for query in queries
+            ]
+            pending = [
+                (index, query)
+                for index, query in enumerate(queries)
+                if contexts[index] is None
+            ]
+            if not pending:
+                return contexts
+
+            embeddings = await asyncio.to_thread(
+                self.embedding_function, [query.query for _, query in pending]
             )
 
-            contexts = results["documents"][0] if results["documents"] else []
-            return "\n\n".join(contexts)
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self._query_by_embedding,
+                        embedding,
+                        query.document_type,
+                        query.top_k,
+                    )
+                    for (_, query), embedding in zip(pending, embeddings)
+                )
+            )
+
+            for (index, query), context in zip(pending, results):
+                contexts[index] = context
+                if query.static:
+                    self._static_contexts[self._static_key(query)] = context
+
+            return contexts
         except Exception as e:
-            raise RAGServiceException(f"Failed to retrieve context: {str(e)}")
+            raise RAGServiceException(f"Failed to retrieve contexts: {str(e)}")
+
+    async def precompute_contexts(self, queries: Sequence[ContextQuery]) -> None:
+        """Populate the static context cache ahead of the first evaluation"""
+        await self.retrieve_contexts([query for query in queries if query.static])
+
+    def _static_key(self, query: ContextQuery) -> Tuple[str, str, int]:
+        return (query.query, query.document_type, query.top_k)
+
+    def _query_by_embedding(
+        self, embedding: Embedding, document_type: str, top_k: int
+    ) -> str:
+        results = self.collection.query(
+            query_embeddings=[embedding], n_results=top_k, where={"type": document_type}
+        )
+
+        contexts = results["documents"][0] if results["documents"] else []
+        return "\n\n".join(contexts)
 
-    def _chunk_text(
-        self, text: str, chunk_size: int = 1000, overlap: int = 100
-    ) -> List[str]:
-        """Split text into overlapping chunks"""
-        chunks = []
-        start = 0
-        text_length = len(text)
-
-        while start < text_length:
-            end = start + chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
-            start += chunk_size - overlap
-
-        return chunks
+    def _chunk_text(self, text: str) -> List[str]:
+        """Split text into token-budgeted chunks on natural boundaries"""
+        return self.chunker.chunk(text)
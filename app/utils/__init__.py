@@ -1,11 +1,31 @@
-from app.utils.file_handler import save_upload_file, delete_file
-from app.utils.pdf_parser import extract_text_from_pdf, get_pdf_metadata
-from app.utils.retry import retry_on_llm_error
+from importlib import import_module
+
+# Submodules are imported on first access, so importing the file handler in
+# the API does not also load pypdf and tenacity
+_EXPORTS = {
+    "StoredFile": "file_handler",
+    "save_upload_file": "file_handler",
+    "delete_file": "file_handler",
+    "extract_pdf_text": "pdf_parser",
+    "extract_text_from_pdf": "pdf_parser",
+    "get_pdf_metadata": "pdf_parser",
+    "iter_pdf_pages": "pdf_parser",
+    "retry_on_llm_error": "retry",
+}
 
 __all__ = [
+    "StoredFile",
     "save_upload_file",
     "delete_file",
+    "extract_pdf_text",
     "extract_text_from_pdf",
     "get_pdf_metadata",
+    "iter_pdf_pages",
     "retry_on_llm_error",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"app.utils.{_EXPORTS[name]}"), name)
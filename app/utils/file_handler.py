@@ -1,7 +1,9 @@
+import asyncio
+import hashlib
 import os
 import uuid
 from pathlib import Path
-from typing import List, Tuple
+from typing import BinaryIO, Dict, List, NamedTuple
 from fastapi import UploadFile
 from app.config import settings
 from app.core.exceptions import FileSizeException, FileTypeException
@@ -10,23 +12,49 @@ from app.core.exceptions import FileSizeException, FileTypeException
 ALLOWED_MIME_TYPES = ["application/pdf"]
 ALLOWED_EXTENSIONS = [".pdf"]
 
+# Signatures sniffed from the first chunk; PDF readers accept the header
+# anywhere in the first 1024 bytes
+MAGIC_BYTES: Dict[str, bytes] = {".pdf": b"%PDF-"}
+MAGIC_SEARCH_WINDOW = 1024
+
+
+class StoredFile(NamedTuple):
+    filename: str
+    file_path: str
+    file_size: int
+    content_hash: str
+
+
+def get_blob_path(upload_dir: Path, content_hash: str, extension: str) -> Path:
+    """Sharded location of a content-addressed blob: ab/cd/abcd...<ext>"""
+    return (
+        upload_dir / content_hash[:2] / content_hash[2:4] / f"{content_hash}{extension}"
+    )
+
+
+def _write_chunk(file: BinaryIO, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    file.write(chunk)
+
 
 async def save_upload_file(
     upload_file: UploadFile,
     subdirectory: str,
     allowed_types: List[str] = ALLOWED_MIME_TYPES,
     allowed_extensions: List[str] = ALLOWED_EXTENSIONS,
-) -> Tuple[str, str, int]:
+) -> StoredFile:
     """
-    Save uploaded file to disk
-    Returns: (filename, file_path, file_size)
-    """
-    contents = await upload_file.read()
-    file_size = len(contents)
+    Stream uploaded file to content-addressed storage in fixed-size chunks
 
-    if file_size > settings.MAX_FILE_SIZE:
-        raise FileSizeException(settings.MAX_FILE_SIZE)
+    The declared type and extension are checked before anything is read,
+    the magic bytes are sniffed from the first chunk, and the copy aborts
+    (removing the partial file) as soon as the running size passes
+    MAX_FILE_SIZE. Disk writes and hashing run in a worker thread so large
+    uploads don't block the event loop.
 
+    The SHA-256 computed while streaming names the stored blob, so uploading
+    the same content again reuses the existing file instead of adding one.
+    """
     if upload_file.content_type not in allowed_types:
         raise FileTypeException(allowed_types)
 
@@ -35,16 +63,53 @@ async def save_upload_file(
     if original_ext not in allowed_extensions:
         raise FileTypeException(allowed_extensions)
 
-    unique_filename = f"{uuid.uuid4()}{original_ext}"
+    # Spooled multipart uploads already know their size
+    if upload_file.size is not None and upload_file.size > settings.MAX_FILE_SIZE:
+        raise FileSizeException(settings.MAX_FILE_SIZE)
+
+    magic = MAGIC_BYTES.get(original_ext)
 
     upload_dir = Path(settings.UPLOAD_DIR) / subdirectory
     upload_dir.mkdir(parents=True, exist_ok=True)
 
-    file_path = upload_dir / unique_filename
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    temp_path = upload_dir / f".{uuid.uuid4()}.part"
+    digest = hashlib.sha256()
+    file_size = 0
+    file = await asyncio.to_thread(open, temp_path, "wb")
+    try:
+        while chunk := await upload_file.read(settings.UPLOAD_CHUNK_SIZE):
+            if file_size == 0 and magic and magic not in chunk[:MAGIC_SEARCH_WINDOW]:
+                raise FileTypeException(allowed_types)
+
+            file_size += len(chunk)
+            if file_size > settings.MAX_FILE_SIZE:
+                raise FileSizeException(settings.MAX_FILE_SIZE)
+
+            await asyncio.to_thread(_write_chunk, file, digest, chunk)
+
+        if file_size == 0 and magic:
+            raise FileTypeException(allowed_types)
+    except BaseException:
+        await asyncio.to_thread(file.close)
+        delete_file(str(temp_path))
+        raise
+
+    await asyncio.to_thread(file.close)
+
+    content_hash = digest.hexdigest()
+    file_path = get_blob_path(upload_dir, content_hash, original_ext)
+    if file_path.exists():
+        delete_file(str(temp_path))
+    else:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_path, file_path)
 
-    return unique_filename, str(file_path), file_size
+    return StoredFile(
+        filename=file_path.name,
+        file_path=str(file_path),
+        file_size=file_size,
+        content_hash=content_hash,
+    )
 
 
 def delete_file(file_path: str) -> bool:
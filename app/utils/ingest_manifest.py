@@ -0,0 +1,84 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, TypedDict
+
+
+class ManifestEntry(TypedDict):
+    path: str
+    document_type: str
+    sha256: str
+    chunker: str
+    chunks: int
+
+
+def file_sha256(path: Path, chunk_size: int = 1048576) -> str:
+    """Hex SHA-256 of a file's contents, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IngestManifest:
+    """
+    Content hashes of the reference documents in the vector database
+
+    Kept as JSON next to the Chroma data, so deleting the database also
+    forgets what was ingested into it.
+    """
+
+    def __init__(self, path: Path, entries: Dict[str, ManifestEntry]):
+        self.path = path
+        self.entries = entries
+
+    @classmethod
+    def load(cls, path: Path) -> "IngestManifest":
+        """Read the manifest, or start an empty one if there is none"""
+        try:
+            entries = json.loads(path.read_text())
+        except FileNotFoundError:
+            entries = {}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable ingest manifest {path}: {str(e)}")
+            entries = {}
+        return cls(path, entries)
+
+    def is_current(self, document_id: str, sha256: str, chunker: str) -> bool:
+        """Whether the document was ingested from exactly this content, split
+        by the same chunker"""
+        entry = self.entries.get(document_id)
+        return (
+            entry is not None
+            and entry["sha256"] == sha256
+            and entry.get("chunker") == chunker
+        )
+
+    def record(
+        self,
+        document_id: str,
+        path: Path,
+        document_type: str,
+        sha256: str,
+        chunker: str,
+        chunks: int,
+    ) -> None:
+        self.entries[document_id] = ManifestEntry(
+            path=str(path),
+            document_type=document_type,
+            sha256=sha256,
+            chunker=chunker,
+            chunks=chunks,
+        )
+
+    def forget(self, document_id: str) -> None:
+        self.entries.pop(document_id, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically, so a crash never leaves half a file"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
+        os.replace(temp_path, self.path)
@@ -1,6 +1,12 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from traceback import print_exc
-from typing import Optional, TypedDict
+from typing import Iterator, List, Optional, TypedDict
 import pypdf
+from app.config import settings
+from app.core.exceptions import PDFParseException
 
 
 class PDFMetadata(TypedDict):
@@ -10,18 +16,142 @@ class PDFMetadata(TypedDict):
     subject: str
 
 
-def extract_text_from_pdf(file_path: str) -> Optional[str]:
-    """Extract text content from PDF file"""
+class PDFText(TypedDict):
+    text: str
+    page_count: int
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers = 0
+# Extraction runs in threads (asyncio.to_thread, Celery's threads pool)
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Reuse one process pool per process so large PDFs don't pay pool startup
+
+    The pool spawns its processes: forking the API or a worker, which run
+    other threads, could copy a lock held by one of them into the child.
+    """
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is None or _process_pool_workers != workers:
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=False)
+            _process_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _process_pool_workers = workers
+        return _process_pool
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        workers = settings.PDF_EXTRACT_WORKERS
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    # Daemonic processes (e.g. Celery prefork children) cannot have children
+    if multiprocessing.current_process().daemon:
+        return 1
+    return workers
+
+
+def _iter_reader_pages(
+    pdf_reader: pypdf.PdfReader, start: int = 0, stop: Optional[int] = None
+) -> Iterator[str]:
+    page_count = len(pdf_reader.pages)
+    stop = page_count if stop is None else min(stop, page_count)
+    for index in range(start, stop):
+        yield pdf_reader.pages[index].extract_text()
+
+
+def iter_pdf_pages(
+    file_path: str, start: int = 0, stop: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Yield the text of each page lazily so callers can stop early
+
+    Args:
+        file_path: Path to the PDF file
+        start: Index of the first page to yield
+        stop: Index after the last page to yield, defaults to the page count
+    """
+    try:
+        with open(file_path, "rb") as file:
+            yield from _iter_reader_pages(pypdf.PdfReader(file), start, stop)
+    except Exception as e:
+        print_exc()
+        raise PDFParseException(f"Failed to parse PDF: {str(e)}")
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Process pool task: extract a contiguous range of pages"""
+    return list(iter_pdf_pages(file_path, start, stop))
+
+
+def extract_pdf_text(
+    file_path: str,
+    max_chars: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> PDFText:
+    """
+    Extract text content and page count from PDF file
+
+    Page texts are collected in a list and joined once. PDFs with at least
+    PDF_PARALLEL_MIN_PAGES pages are split into page ranges parsed in a
+    process pool; when max_chars is given pages are streamed serially and
+    extraction stops as soon as enough text has been collected.
+
+    Args:
+        file_path: Path to the PDF file
+        max_chars: Only extract (and return) the first max_chars characters
+        workers: Process pool size, defaults to PDF_EXTRACT_WORKERS
+    """
     try:
         with open(file_path, "rb") as file:
             pdf_reader = pypdf.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            page_count = len(pdf_reader.pages)
+
+            if max_chars is not None:
+                pages: List[str] = []
+                collected = 0
+                for page_text in _iter_reader_pages(pdf_reader):
+                    pages.append(page_text)
+                    collected += len(page_text) + 1
+                    if collected >= max_chars:
+                        break
+                text = "\n".join(pages).strip()[:max_chars]
+                return PDFText(text=text, page_count=page_count)
+
+            workers = min(_resolve_workers(workers), page_count)
+            if workers <= 1 or page_count < settings.PDF_PARALLEL_MIN_PAGES:
+                pages = list(_iter_reader_pages(pdf_reader))
+                return PDFText(text="\n".join(pages).strip(), page_count=page_count)
+
+        step = -(-page_count // workers)
+        pool = _get_process_pool(workers)
+        futures = [
+            pool.submit(
+                _extract_page_range, file_path, start, min(start + step, page_count)
+            )
+            for start in range(0, page_count, step)
+        ]
+        pages = [page_text for future in futures for page_text in future.result()]
+        return PDFText(text="\n".join(pages).strip(), page_count=page_count)
+    except PDFParseException:
+        # Already reported by the page range that failed
+        raise
     except Exception as e:
         print_exc()
-        raise Exception(f"Failed to parse PDF: {str(e)}")
+        raise PDFParseException(f"Failed to parse PDF: {str(e)}")
+
+
+def extract_text_from_pdf(
+    file_path: str, max_chars: Optional[int] = None
+) -> Optional[str]:
+    """Extract text content from PDF file"""
+    return extract_pdf_text(file_path, max_chars=max_chars)["text"]
 
 
 def get_pdf_metadata(file_path: str) -> Optional[PDFMetadata]:
@@ -0,0 +1,243 @@
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, NamedTuple, Sequence, Tuple
+from app.config import settings
+
+# Words and punctuation marks, the units WordPiece starts from; estimating
+# from them avoids loading the model's tokenizer
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+# Characters per token counted in a word: common words are one WordPiece
+# token, long, rare and numeric ones several
+_CHARS_PER_TOKEN = 6
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Bullets and list numbers that PDF extraction leaves on lines of their own
+_MARKER_ONLY = re.compile(r"^(?:[•◦▪●*-]|\d+[.)])?$")
+_HEADING_MAX_WORDS = 8
+
+# Boundary before a piece, weakest to strongest
+SENTENCE, LINE, PARAGRAPH, HEADING = range(4)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate number of embedding model tokens in text
+
+    Each punctuation mark is one token and each word one per 6 characters,
+    which overcounts plain English a little to cover words the model splits
+    into several wordpieces. It is still an estimate, so budgets are kept
+    well below the model's input limit.
+    """
+    return sum(-(-len(token) // _CHARS_PER_TOKEN) for token in _TOKEN.findall(text))
+
+
+class _Piece(NamedTuple):
+    text: str
+    tokens: int
+    boundary: int
+
+
+@dataclass(frozen=True)
+class ChunkStats:
+    chunks: int
+    total_tokens: int
+    min_tokens: int
+    max_tokens: int
+
+    @property
+    def mean_tokens(self) -> float:
+        return self.total_tokens / self.chunks if self.chunks else 0.0
+
+
+def chunk_stats(
+    chunks: Sequence[str], count_tokens: Callable[[str], int] = estimate_tokens
+) -> ChunkStats:
+    """Chunk count and token sizes"""
+    sizes = [count_tokens(chunk) for chunk in chunks]
+    return ChunkStats(
+        chunks=len(sizes),
+        total_tokens=sum(sizes),
+        min_tokens=min(sizes, default=0),
+        max_tokens=max(sizes, default=0),
+    )
+
+
+class TextChunker:
+    """
+    Token-budgeted chunker that splits on headings, paragraphs, lines and
+    sentences rather than at fixed character offsets
+
+    Text is read once, line by line. Lines wrapped by PDF extraction (they
+    end in a space) are joined back, short unpunctuated lines are taken as
+    headings, and the rest is split into sentences. Whole sections are
+    packed into chunks of at most `max_tokens`, and a section too long for
+    one chunk is packed sentence by sentence, consecutive chunks sharing up
+    to `overlap_tokens` of whole sentences. Only a
+    sentence longer than the budget is cut, between words, and only a word
+    longer than the budget (a URL, a hash) between characters.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 210,
+        overlap_tokens: int = 30,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ):
+        """
+        Initialize text chunker
+
+        Args:
+            max_tokens: Token budget of a chunk; keep it below the embedding
+                model's input limit so nothing is truncated
+            overlap_tokens: Tokens of trailing sentences repeated at the
+                start of the next chunk in the same section
+            count_tokens: Token counter
+        """
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.count_tokens = count_tokens
+
+    @classmethod
+    def from_settings(cls) -> "TextChunker":
+        return cls(settings.RAG_CHUNK_MAX_TOKENS, settings.RAG_CHUNK_OVERLAP_TOKENS)
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifies the chunking, so documents are re-ingested when it changes"""
+        return f"section:{self.max_tokens}:{self.overlap_tokens}"
+
+    def chunk(self, text: str) -> List[str]:
+        """Split text into chunks"""
+        chunks: List[str] = []
+        current: List[_Piece] = []
+        current_tokens = 0
+
+        for section in self._sections(text):
+            # A section that fits joins the chunk, so short sections are
+            # merged; one that doesn't starts a chunk of its own
+            section_tokens = sum(piece.tokens for piece in section)
+            if current and current_tokens + section_tokens > self.max_tokens:
+                chunks.append(self._join(current))
+                current, current_tokens = [], 0
+
+            for piece in section:
+                if current and current_tokens + piece.tokens > self.max_tokens:
+                    chunks.append(self._join(current))
+                    current = self._overlap(current, piece.tokens)
+                    current_tokens = sum(carried.tokens for carried in current)
+                current.append(piece)
+                current_tokens += piece.tokens
+
+        if current:
+            chunks.append(self._join(current))
+        return chunks
+
+    def _sections(self, text: str) -> Iterator[List[_Piece]]:
+        """Pieces of text grouped under the heading that starts them"""
+        section: List[_Piece] = []
+        for piece in self._pieces(text):
+            if piece.boundary == HEADING and section:
+                yield section
+                section = []
+            section.append(piece)
+        if section:
+            yield section
+
+    def _pieces(self, text: str) -> Iterator[_Piece]:
+        """Sentences, headings and lines of text, each with the boundary
+        that precedes it, cut to fit the token budget"""
+        boundary = PARAGRAPH
+        wrapped = ""
+        for raw_line in text.splitlines():
+            if raw_line.endswith((" ", "\t")):
+                # Soft wrap: the line continues on the next one
+                wrapped += raw_line
+                continue
+            line = (wrapped + raw_line).strip()
+            wrapped = ""
+
+            if _MARKER_ONLY.match(line):
+                boundary = PARAGRAPH
+                continue
+
+            if self._is_heading(line):
+                yield from self._fit(line, HEADING)
+                boundary = LINE
+                continue
+
+            for sentence in _SENTENCE_END.split(line):
+                if sentence:
+                    yield from self._fit(sentence, boundary)
+                    boundary = SENTENCE
+            boundary = LINE
+
+        line = wrapped.strip()
+        if line:
+            yield from self._fit(line, boundary)
+
+    def _is_heading(self, line: str) -> bool:
+        words = line.split()
+        return (
+            len(words) <= _HEADING_MAX_WORDS
+            and line[0].isupper()
+            and not line.endswith((".", ",", ";", ":", "!", "?"))
+            and "=" not in line
+        )
+
+    def _fit(self, text: str, boundary: int) -> Iterator[_Piece]:
+        """Yield text as one piece, or between words if over the budget"""
+        tokens = self.count_tokens(text)
+        if tokens <= self.max_tokens:
+            yield _Piece(text, tokens, boundary)
+            return
+
+        words: List[str] = []
+        words_tokens = 0
+        for word, word_tokens in self._words(text):
+            if words and words_tokens + word_tokens > self.max_tokens:
+                yield _Piece(" ".join(words), words_tokens, boundary)
+                boundary = SENTENCE
+                words, words_tokens = [], 0
+            words.append(word)
+            words_tokens += word_tokens
+        if words:
+            yield _Piece(" ".join(words), words_tokens, boundary)
+
+    def _words(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Words of text with their tokens, words over the budget cut into
+        runs of characters that fit"""
+        for word in text.split():
+            tokens = self.count_tokens(word)
+            if tokens <= self.max_tokens:
+                yield word, tokens
+                continue
+
+            start = 0
+            # Tokens grow about linearly with characters, so start from a
+            # proportional cut and shorten it until it fits
+            size = max(1, len(word) * self.max_tokens // tokens)
+            while start < len(word):
+                end = min(start + size, len(word))
+                part_tokens = self.count_tokens(word[start:end])
+                while part_tokens > self.max_tokens and end - start > 1:
+                    end -= 1
+                    part_tokens = self.count_tokens(word[start:end])
+                yield word[start:end], part_tokens
+                start = end
+
+    def _overlap(self, pieces: List[_Piece], next_tokens: int) -> List[_Piece]:
+        """Trailing sentences of a chunk to repeat at the start of the next"""
+        budget = min(self.overlap_tokens, self.max_tokens - next_tokens)
+        carried: List[_Piece] = []
+        for piece in reversed(pieces):
+            if piece.boundary == HEADING or piece.tokens > budget:
+                break
+            carried.insert(0, piece)
+            budget -= piece.tokens
+        return carried
+
+    def _join(self, pieces: List[_Piece]) -> str:
+        parts = [pieces[0].text]
+        for piece in pieces[1:]:
+            parts.append(" " if piece.boundary == SENTENCE else "\n")
+            parts.append(piece.text)
+        return "".join(parts)
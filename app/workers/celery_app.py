@@ -0,0 +1,19 @@
+from celery import Celery
+from app.config import settings
+
+# Task names shared by the API, which enqueues by name, and the worker
+PROCESS_EVALUATION_TASK = "process_evaluation"
+
+celery_app = Celery(
+    "evaluation_worker",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    result_serializer="json",
+    timezone="UTC",
+    enable_utc=True,
+)
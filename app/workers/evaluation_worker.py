@@ -1,35 +1,123 @@
-import asyncio
-from celery import Celery
-from app.config import settings
+import threading
+import time
+from typing import Optional
+from celery.concurrency import get_implementation, prefork
+from celery.signals import (
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
+from app.core.http_client import close_http_client
 from app.database.session import SessionLocal
 from app.repositories.document import DocumentRepository
 from app.repositories.evaluation import EvaluationRepository
 from app.services.evaluation_service import EvaluationService
+from app.workers.celery_app import PROCESS_EVALUATION_TASK, celery_app
+from app.workers.loop import run_in_worker_loop, worker_loop
+from app.workers.metrics import worker_metrics
 
-celery_app = Celery(
-    "evaluation_worker",
-    broker=settings.CELERY_BROKER_URL,
-    backend=settings.CELERY_RESULT_BACKEND,
-)
 
-celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="UTC",
-    enable_utc=True,
-)
+_evaluation_service: Optional[EvaluationService] = None
+_evaluation_service_lock = threading.Lock()
+_warm_up_thread: Optional[threading.Thread] = None
+
+
+def get_evaluation_service() -> EvaluationService:
+    """Service graph shared by every task in this worker process"""
+    global _evaluation_service
+    with _evaluation_service_lock:
+        if _evaluation_service is None:
+            _evaluation_service = EvaluationService()
+    return _evaluation_service
+
+
+def llm_cache_stats() -> Optional[dict]:
+    """Completion cache hits, misses and savings of this process so far"""
+    service = _evaluation_service
+    if service is None or service.llm_service.cache is None:
+        return None
+    return service.llm_service.cache.stats.as_dict()
+
+
+def warm_up_worker_process() -> None:
+    """Build and warm the evaluation service"""
+    started_at = time.perf_counter()
+    try:
+        run_in_worker_loop(get_evaluation_service().warm_up())
+        worker_metrics.warm_up_seconds = time.perf_counter() - started_at
+        print(f"Worker warmed up in {worker_metrics.warm_up_seconds:.2f}s")
+    except Exception as e:
+        print(f"Worker warm-up failed: {str(e)}")
+
+
+def wait_for_warm_up() -> None:
+    """Block until a background warm-up started at process init finishes"""
+    if _warm_up_thread is not None:
+        _warm_up_thread.join()
+
+
+def _uses_prefork_pool(worker) -> bool:
+    pool_cls = get_implementation(getattr(worker, "pool_cls", "prefork"))
+    return issubclass(pool_cls, prefork.TaskPool)
 
 
-@celery_app.task(name="process_evaluation", bind=True, max_retries=3)
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """
+    Start warming the evaluation service before the first task arrives
+
+    Celery kills a prefork child whose init signal outlasts
+    worker_proc_alive_timeout (4s by default), and a cold embedding model
+    load can take longer, so the warm-up runs in a background thread and
+    the first task waits for it instead.
+    """
+    global _warm_up_thread
+    _warm_up_thread = threading.Thread(
+        target=warm_up_worker_process, name="worker-warm-up", daemon=True
+    )
+    _warm_up_thread.start()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Release pooled LLM connections when the worker process exits"""
+    print(f"Worker metrics: {worker_metrics.as_dict()}")
+    print(f"LLM cache: {llm_cache_stats()}")
+    try:
+        run_in_worker_loop(close_http_client())
+    except Exception as e:
+        print(f"Failed to close HTTP client: {str(e)}")
+    worker_loop.stop()
+
+
+@worker_init.connect
+def init_worker(sender=None, **kwargs):
+    """Threads and solo pools run tasks in the main process, which gets no
+    worker_process_init; prefork children are warmed after the fork instead"""
+    if not _uses_prefork_pool(sender):
+        init_worker_process()
+
+
+@worker_shutdown.connect
+def shutdown_worker(sender=None, **kwargs):
+    if not _uses_prefork_pool(sender):
+        shutdown_worker_process()
+
+
+@celery_app.task(name=PROCESS_EVALUATION_TASK, bind=True, max_retries=3)
 def process_evaluation_task(self, evaluation_id: str):
-    db = SessionLocal()
+    started_at = time.perf_counter()
+    # Repositories refresh what they commit, so loaded attributes stay valid
+    # and reading them on the event loop never triggers a query
+    db = SessionLocal(expire_on_commit=False)
     try:
         doc_repo = DocumentRepository(db)
         eval_repo = EvaluationRepository(db)
 
-        evaluation_service = EvaluationService()
-        results = asyncio.run(
+        wait_for_warm_up()
+        evaluation_service = get_evaluation_service()
+        results = run_in_worker_loop(
             evaluation_service.process_evaluation(
                 evaluation_id=evaluation_id,
                 doc_repo=doc_repo,
@@ -37,10 +125,29 @@ def process_evaluation_task(self, evaluation_id: str):
             )
         )
 
+        latency = time.perf_counter() - started_at
+        cold_start = worker_metrics.record_task(latency)
+        cache_stats = llm_cache_stats()
+        print(
+            f"Evaluation {evaluation_id} took {latency:.2f}s"
+            f" ({'cold' if cold_start else 'warm'})"
+        )
+        if cache_stats is not None:
+            print(
+                f"LLM cache: {cache_stats['hits']} hits, "
+                f"{cache_stats['misses']} misses, "
+                f"{cache_stats['saved_seconds']:.1f}s and "
+                f"{cache_stats['saved_tokens']} tokens saved"
+            )
+
         return {
             "evaluation_id": evaluation_id,
             "status": "completed",
             "results": results,
+            "latency": latency,
+            "cold_start": cold_start,
+            # Totals of this worker process, not just this task
+            "llm_cache": cache_stats,
         }
 
     except Exception as e:
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from typing import Awaitable, Optional, TypeVar
+from app.config import settings
+from app.core.http_client import close_http_client
+from app.core.redis_client import reset_redis_client
+
+T = TypeVar("T")
+
+
+class WorkerEventLoop:
+    """
+    Long-lived event loop running in a background thread of a worker process
+
+    Tasks submit coroutines from their own threads and block on the result,
+    so pooled async resources (HTTP client, async Redis) bound to this loop
+    are reused across tasks. Coroutines submitted concurrently, e.g. from a
+    threads pool, interleave on the same loop while waiting on I/O.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if it is not running yet"""
+        with self._lock:
+            if not self.running:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_forever,
+                    args=(loop,),
+                    name="worker-event-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _run_forever(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and wait for its result"""
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def stop(self) -> None:
+        """Stop the loop and wait for its thread to exit"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+worker_loop = WorkerEventLoop()
+
+
+async def _run_and_reset(coro: Awaitable[T]) -> T:
+    try:
+        return await coro
+    finally:
+        # Shared clients must not carry this loop's connections into the
+        # next asyncio.run, nor leave them open
+        await close_http_client()
+        await reset_redis_client()
+
+
+def run_in_worker_loop(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the persistent worker loop, or a fresh one if disabled"""
+    if settings.CELERY_PERSISTENT_EVENT_LOOP:
+        return worker_loop.run(coro)
+    return asyncio.run(_run_and_reset(coro))
@@ -0,0 +1,42 @@
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+@dataclass
+class WorkerMetrics:
+    """Per-process task latency, split into the first (cold) task and the rest"""
+
+    warm_up_seconds: Optional[float] = None
+    cold_start_seconds: Optional[float] = None
+    warm_tasks: int = 0
+    warm_total_seconds: float = 0.0
+    warm_max_seconds: float = 0.0
+
+    @property
+    def warm_mean_seconds(self) -> float:
+        return self.warm_total_seconds / self.warm_tasks if self.warm_tasks else 0.0
+
+    @property
+    def tasks(self) -> int:
+        return self.warm_tasks + (self.cold_start_seconds is not None)
+
+    def record_task(self, duration: float) -> bool:
+        """Record a task latency; returns True if it was the process's cold start"""
+        if self.cold_start_seconds is None:
+            self.cold_start_seconds = duration
+            return True
+
+        self.warm_tasks += 1
+        self.warm_total_seconds += duration
+        self.warm_max_seconds = max(self.warm_max_seconds, duration)
+        return False
+
+    def as_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "tasks": self.tasks,
+            "warm_mean_seconds": self.warm_mean_seconds,
+        }
+
+
+worker_metrics = WorkerMetrics()
@@ -0,0 +1,12 @@
+from celery.result import AsyncResult
+from app.workers.celery_app import PROCESS_EVALUATION_TASK, celery_app
+
+
+def enqueue_evaluation(evaluation_id: str) -> AsyncResult:
+    """
+    Queue an evaluation for the worker by task name
+
+    Sending by name keeps the worker module, and with it the evaluation
+    service, ChromaDB and the PDF parser, out of the API process.
+    """
+    return celery_app.send_task(PROCESS_EVALUATION_TASK, args=[evaluation_id])
@@ -0,0 +1,198 @@
+"""
+Benchmark chunking of the reference documents
+
+Compares the previous fixed 1000-character slicing with the token-aware
+chunker: chunk count and token sizes, time to chunk, and retrieval hit rate,
+the share of probe queries whose top results contain the expected passage
+intact, along with the tokens those results would add to a prompt.
+
+Usage:
+    uv run python benchmarks/bench_chunking.py
+    uv run python benchmarks/bench_chunking.py --max-tokens 150 --top-k 2
+    uv run python benchmarks/bench_chunking.py --embedding hashing
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import chromadb  # noqa: E402
+from chromadb.config import Settings as ChromaSettings  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.core.embeddings import create_embedding_function  # noqa: E402
+from app.utils.pdf_parser import extract_text_from_pdf  # noqa: E402
+from app.utils.text_chunker import TextChunker, chunk_stats, estimate_tokens  # noqa: E402
+
+
+class Probe(NamedTuple):
+    query: str
+    document: str
+    # Passage a useful result must contain without being cut
+    expected: str
+
+
+PROBES = [
+    Probe(
+        "How is technical skills match scored?",
+        "cv_rubric",
+        "1 = Irrelevant skills, 2 = Few overlaps, 3 = Partial match, "
+        "4 = Strong match, 5 = Excellent match + AI/LLM exposure",
+    ),
+    Probe(
+        "How is experience level scored?",
+        "cv_rubric",
+        "Years of experience and project complexity.",
+    ),
+    Probe(
+        "What counts as relevant achievements?",
+        "cv_rubric",
+        "Impact of past work (scaling, performance, adoption).",
+    ),
+    Probe(
+        "How is code quality and structure scored?",
+        "project_rubric",
+        "Clean, modular, reusable, tested.",
+    ),
+    Probe(
+        "How is resilience and error handling evaluated?",
+        "project_rubric",
+        "Handles long jobs, retries, randomness, API failures.",
+    ),
+    Probe(
+        "What is the weight of documentation?",
+        "project_rubric",
+        "Documentation & Explanation (Weight: 15%)",
+    ),
+    Probe(
+        "Which backend frameworks should candidates know?",
+        "backend_developer",
+        "You should have experience with backend languages and frameworks "
+        "(Node.js, Django, Rails)",
+    ),
+    Probe(
+        "Does the role involve retrieval augmented generation?",
+        "backend_developer",
+        "Implementing Retrieval-Augmented Generation (RAG) by embedding and "
+        "retrieving context from vector databases",
+    ),
+    Probe(
+        "What should the evaluate endpoint return?",
+        "case_study_brief",
+        "Immediately returns a job ID to track the evaluation process.",
+    ),
+    Probe(
+        "What is the objective of the case study?",
+        "case_study_brief",
+        "Your mission is to build a backend service that automates the initial "
+        "screening of a job application.",
+    ),
+]
+
+
+def fixed_chunks(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[str]:
+    """Previous implementation, kept here as the baseline"""
+    chunks = []
+    start = 0
+    while start < len(text):
+        chunks.append(text[start : start + chunk_size])
+        start += chunk_size - overlap
+    return chunks
+
+
+def normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def hit_rate(
+    name: str,
+    chunks: Dict[str, List[str]],
+    embedding_function,
+    top_k: int,
+) -> Tuple[float, float]:
+    """Share of probes answered intact, and mean tokens retrieved per probe"""
+    client = chromadb.Client(ChromaSettings(anonymized_telemetry=False))
+    collection = client.create_collection(name, embedding_function=embedding_function)
+    for document, document_chunks in chunks.items():
+        collection.add(
+            ids=[f"{document}_{i}" for i in range(len(document_chunks))],
+            documents=document_chunks,
+            metadatas=[{"document": document}] * len(document_chunks),
+        )
+
+    hits = 0
+    tokens = 0
+    for probe in PROBES:
+        results = collection.query(
+            query_texts=[probe.query],
+            n_results=top_k,
+            where={"document": probe.document},
+        )["documents"][0]
+        hits += any(normalize(probe.expected) in normalize(r) for r in results)
+        tokens += sum(estimate_tokens(result) for result in results)
+    client.delete_collection(name)
+    return hits / len(PROBES), tokens / len(PROBES)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-tokens", type=int, default=settings.RAG_CHUNK_MAX_TOKENS)
+    parser.add_argument(
+        "--overlap-tokens", type=int, default=settings.RAG_CHUNK_OVERLAP_TOKENS
+    )
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--embedding",
+        choices=["default", "hashing"],
+        default=settings.RAG_EMBEDDING_FUNCTION,
+        help="Embedding function; hashing runs offline but only matches words",
+    )
+    args = parser.parse_args()
+
+    settings.RAG_EMBEDDING_FUNCTION = args.embedding
+
+    texts = {
+        path.stem: extract_text_from_pdf(str(path))
+        for path in sorted(Path(settings.REFERENCE_DOCS_DIR).rglob("*.pdf"))
+    }
+    missing = {probe.document for probe in PROBES} - set(texts)
+    if missing:
+        sys.exit(f"Reference documents not found: {', '.join(sorted(missing))}")
+
+    chunker = TextChunker(args.max_tokens, args.overlap_tokens)
+    chunkers: Dict[str, Callable[[str], List[str]]] = {
+        "fixed 1000 chars": fixed_chunks,
+        f"token {args.max_tokens}/{args.overlap_tokens}": chunker.chunk,
+    }
+    embedding_function = create_embedding_function()
+
+    print(
+        f"{'chunker':<18} {'chunks':>7} {'mean tok':>9} {'max tok':>8} "
+        f"{'chunk time':>11} {'hit rate':>9} {'tok/probe':>10}"
+    )
+    for index, (name, chunk) in enumerate(chunkers.items()):
+        started_at = time.perf_counter()
+        for _ in range(args.repeat):
+            chunks = {document: chunk(text) for document, text in texts.items()}
+        elapsed = (time.perf_counter() - started_at) / args.repeat
+
+        stats = chunk_stats([c for document in chunks.values() for c in document])
+        rate, tokens = hit_rate(
+            f"bench_chunking_{index}", chunks, embedding_function, args.top_k
+        )
+        print(
+            f"{name:<18} {stats.chunks:>7} {stats.mean_tokens:>9.0f} "
+            f"{stats.max_tokens:>8} {elapsed * 1000:>9.2f}ms "
+            f"{rate:>8.0%} {tokens:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
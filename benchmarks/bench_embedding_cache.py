@@ -0,0 +1,95 @@
+"""
+Benchmark the embedding cache on the reference documents
+
+Embeds every chunk of the reference documents and a set of queries
+directly with the model, then through the disk cache when it is empty
+(cold) and when it holds every text (warm), as on a repeated ingest or a
+hot query.
+
+Usage:
+    uv run python benchmarks/bench_embedding_cache.py
+    uv run python benchmarks/bench_embedding_cache.py --embedding hashing
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.core.embeddings import (  # noqa: E402
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    create_embedding_function,
+)
+from app.utils.pdf_parser import extract_text_from_pdf  # noqa: E402
+from app.utils.text_chunker import TextChunker  # noqa: E402
+
+QUERIES = [
+    "CV evaluation criteria scoring rubric",
+    "Project evaluation criteria scoring rubric",
+    "Backend developer with Python, FastAPI and PostgreSQL experience",
+    "Built a RAG pipeline with LLM chaining and retries",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--embedding",
+        choices=["default", "hashing"],
+        default=settings.RAG_EMBEDDING_FUNCTION,
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.RAG_INGEST_BATCH_SIZE
+    )
+    args = parser.parse_args()
+
+    settings.RAG_EMBEDDING_FUNCTION = args.embedding
+    model = create_embedding_function()
+    # Load the model before timing
+    model(["warm up"])
+
+    chunker = TextChunker.from_settings()
+    chunks = [
+        chunk
+        for path in sorted(Path(settings.REFERENCE_DOCS_DIR).rglob("*.pdf"))
+        for chunk in chunker.chunk(extract_text_from_pdf(str(path)))
+    ]
+    if not chunks:
+        sys.exit(f"No reference documents found in {settings.REFERENCE_DOCS_DIR}")
+
+    def ingest(embed) -> float:
+        started_at = time.perf_counter()
+        for start in range(0, len(chunks), args.batch_size):
+            embed(chunks[start : start + args.batch_size])
+        return time.perf_counter() - started_at
+
+    def query(embed) -> float:
+        started_at = time.perf_counter()
+        for text in QUERIES:
+            embed([text])
+        return (time.perf_counter() - started_at) / len(QUERIES)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cached = CachedEmbeddingFunction(
+            model, EmbeddingCache(Path(temp_dir) / "embeddings.sqlite3")
+        )
+        results = {
+            "model": (ingest(model), query(model)),
+            "cache cold": (ingest(cached), query(cached)),
+            "cache warm": (ingest(cached), query(cached)),
+        }
+
+    print(f"{args.embedding} embeddings, {len(chunks)} chunks, {len(QUERIES)} queries")
+    print(f"{'':<11} {'ingest':>10} {'per query':>10}")
+    for name, (ingest_time, query_time) in results.items():
+        print(f"{name:<11} {ingest_time * 1000:>8.2f}ms {query_time * 1000:>8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark requests per second through the rate limit middleware
+
+Drives a minimal FastAPI app in-process over ASGI with no rate limiting,
+the previous BaseHTTPMiddleware implementation, and the pure ASGI
+middleware, all on the in-memory backend with a limit that is never hit.
+
+Usage:
+    uv run python benchmarks/bench_rate_limit_middleware.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.core.rate_limiter import (  # noqa: E402
+    InMemoryRateLimiter,
+    RateLimit,
+    RateLimitMiddleware,
+)
+
+LIMITS = [RateLimit(10**9, 60), RateLimit(10**9, 3600)]
+
+
+class BaseHTTPRateLimitMiddleware(BaseHTTPMiddleware):
+    """Previous implementation, kept here as the baseline"""
+
+    def __init__(self, app, backend):
+        super().__init__(app)
+        self.backend = backend
+
+    async def dispatch(self, request: Request, call_next):
+        key = request.client.host if request.client else "unknown"
+        limit = LIMITS[0]
+        await self.backend.is_allowed(key, limit.limit, limit.window)
+        remaining = await self.backend.get_remaining(key, limit.limit)
+
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(limit.limit)
+        response.headers["X-RateLimit-Remaining"] = str(remaining - 1)
+        response.headers["X-RateLimit-Window"] = str(limit.window)
+        return response
+
+
+def build_app(middleware: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if middleware == "base_http":
+        app.add_middleware(BaseHTTPRateLimitMiddleware, backend=InMemoryRateLimiter())
+    elif middleware == "asgi":
+        app.add_middleware(
+            RateLimitMiddleware, backend=InMemoryRateLimiter(), limits=LIMITS
+        )
+    return app
+
+
+async def requests_per_second(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker(count: int):
+            for _ in range(count):
+                response = await client.get("/ping")
+                response.raise_for_status()
+
+        # Warm up routing and the backend key
+        await worker(100)
+
+        started_at = time.perf_counter()
+        await asyncio.gather(
+            *[worker(requests // concurrency) for _ in range(concurrency)]
+        )
+        elapsed = time.perf_counter() - started_at
+    return (requests // concurrency) * concurrency / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'middleware':<12} {'req/s':>9}")
+    for middleware in ["none", "base_http", "asgi"]:
+        best = max(
+            [
+                await requests_per_second(
+                    build_app(middleware), args.requests, args.concurrency
+                )
+                for _ in range(args.repeat)
+            ]
+        )
+        print(f"{middleware:<12} {best:>9.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+"""
+Benchmark rate limiter backends at high limits
+
+Fills one key up to the limit, then measures the cost of each further check
+and the state kept for that key. The sliding window stores one timestamp per
+request, GCRA a constant-size state. Redis backends, including the hybrid
+one that leases quota and decides locally, are included when a server URL
+is given.
+
+Usage:
+    uv run python benchmarks/bench_rate_limiter.py --limits 60 1000 10000
+    uv run python benchmarks/bench_rate_limiter.py --redis-url redis://localhost:6502/3
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import deque
+from collections.abc import Mapping
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from redis.asyncio import Redis  # noqa: E402
+
+from app.core.rate_limiter import (  # noqa: E402
+    HybridRateLimiter,
+    InMemoryGCRARateLimiter,
+    InMemoryRateLimiter,
+    RedisGCRARateLimiter,
+    RedisRateLimiter,
+)
+
+WINDOW = 3600
+
+
+async def fill(limiter, key: str, limit: int) -> None:
+    for _ in range(limit):
+        await limiter.is_allowed(key, limit, WINDOW)
+
+
+async def time_checks(limiter, key: str, limit: int, checks: int) -> float:
+    """Mean seconds per check on a key that is already at its limit"""
+    started_at = time.perf_counter()
+    for _ in range(checks):
+        await limiter.is_allowed(key, limit, WINDOW)
+    return (time.perf_counter() - started_at) / checks
+
+
+def deep_size(obj) -> int:
+    """Bytes held by containers and numbers reachable from obj"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, Mapping):
+        size += sum(deep_size(k) + deep_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, deque)):
+        size += sum(deep_size(item) for item in obj)
+    return size
+
+
+def state_size(limiter) -> int:
+    """Bytes of per-key state, excluding locks and other fixed members"""
+    return sum(
+        deep_size(value)
+        for value in vars(limiter).values()
+        if isinstance(value, Mapping)
+    )
+
+
+async def bench_memory(limiter, limit: int, checks: int) -> tuple[float, int]:
+    empty_bytes = state_size(limiter)
+    await fill(limiter, "bench", limit)
+    state_bytes = state_size(limiter) - empty_bytes
+    return await time_checks(limiter, "bench", limit, checks), state_bytes
+
+
+async def bench_redis(limiter, redis_key: str, limit: int, checks: int):
+    await limiter.reset("bench")
+    await limiter.load_scripts()
+    await fill(limiter, "bench", limit)
+    state_bytes = await limiter.redis.memory_usage(redis_key) or 0
+    mean = await time_checks(limiter, "bench", limit, checks)
+    await limiter.reset("bench")
+    return mean, state_bytes
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limits", type=int, nargs="+", default=[60, 1000, 10000])
+    parser.add_argument("--checks", type=int, default=2000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    redis = Redis.from_url(args.redis_url) if args.redis_url else None
+
+    print(f"{'backend':<24} {'limit':>6} {'per check':>11} {'state':>10}")
+    for limit in args.limits:
+        rows = [
+            (
+                "memory sliding window",
+                await bench_memory(InMemoryRateLimiter(), limit, args.checks),
+            ),
+            (
+                "memory gcra",
+                await bench_memory(InMemoryGCRARateLimiter(), limit, args.checks),
+            ),
+        ]
+        if redis is not None:
+            rows += [
+                (
+                    "redis sliding window",
+                    await bench_redis(
+                        RedisRateLimiter(redis), "rate_limit:bench", limit, args.checks
+                    ),
+                ),
+                (
+                    "redis gcra",
+                    await bench_redis(
+                        RedisGCRARateLimiter(redis),
+                        "rate_limit_gcra:bench",
+                        limit,
+                        args.checks,
+                    ),
+                ),
+                (
+                    "redis hybrid",
+                    await bench_redis(
+                        HybridRateLimiter(redis),
+                        "rate_limit_lease:bench",
+                        limit,
+                        args.checks,
+                    ),
+                ),
+            ]
+
+        for name, (mean, state_bytes) in rows:
+            print(f"{name:<24} {limit:>6} {mean * 1_000_000:>9.1f}us {state_bytes:>9}B")
+
+    if redis is not None:
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
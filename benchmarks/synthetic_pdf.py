@@ -0,0 +1,71 @@
+"""Minimal PDF writer used by the benchmarks to build large synthetic reports"""
+
+from pathlib import Path
+from typing import List
+
+WORDS = (
+    "backend api database queue worker retry latency throughput cache index "
+    "python fastapi postgres redis celery docker testing deployment rubric "
+    "evaluation candidate project design resilience documentation feedback"
+).split()
+
+
+def _line(page: int, line: int, words_per_line: int) -> str:
+    offset = page * 31 + line * 7
+    return (
+        " ".join(
+            WORDS[(offset + i) % len(WORDS)] for i in range(words_per_line)
+        ).capitalize()
+        + "."
+    )
+
+
+def build_synthetic_pdf(
+    path: Path, pages: int, lines_per_page: int = 45, words_per_line: int = 12
+) -> Path:
+    """Write a text-only PDF with the given number of pages"""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # pages tree, filled in once the page ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+
+    for page in range(pages):
+        lines = [_line(page, line, words_per_line) for line in range(lines_per_page)]
+        body = (
+            "BT /F1 10 Tf 12 TL 50 800 Td "
+            + " ".join(f"({text}) Tj T*" for text in lines)
+            + " ET"
+        )
+        content = body.encode("latin-1")
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+        )
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+
+    path.write_bytes(bytes(output))
+    return path
@@ -1,33 +1,46 @@
+"""
+Ingest reference documents into the vector database
+
+Only documents whose contents changed since the last run are re-ingested;
+their old chunks are replaced, and chunks of deleted files are removed.
+Changed documents go through a pipeline that parses PDFs in a process pool,
+embeds chunks in batches and writes them from a single writer.
+
+Usage:
+    uv run python scripts/ingest_reference_docs.py
+    uv run python scripts/ingest_reference_docs.py --force --workers 8
+"""
+
+import argparse
+import os
 import sys
+import time
 from pathlib import Path
+from typing import List
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.services.rag_service import RAGService
-from app.config import settings
-
+from app.config import settings  # noqa: E402
+from app.services.ingestion_pipeline import IngestionJob, IngestionPipeline  # noqa: E402
+from app.utils.ingest_manifest import IngestManifest, file_sha256  # noqa: E402
+from app.utils.text_chunker import TextChunker  # noqa: E402
 
-def main():
-    print("Starting reference documents ingestion...\n")
+MANIFEST_FILE = "ingest_manifest.json"
 
-    rag_service = RAGService()
-    rag_service.initialize_collection()
 
-    reference_dir = Path(settings.REFERENCE_DOCS_DIR)
+def find_documents(reference_dir: Path) -> List[IngestionJob]:
+    documents = []
 
     job_desc_dir = reference_dir / "job_descriptions"
     if job_desc_dir.exists() and job_desc_dir.is_dir():
-        pdf_files = list(job_desc_dir.glob("*.pdf"))
+        pdf_files = sorted(job_desc_dir.glob("*.pdf"))
         if pdf_files:
             print(f"Found {len(pdf_files)} job description(s)")
-            for pdf_file in pdf_files:
-                print(f"   Ingesting: {pdf_file.name}")
-                rag_service.ingest_document(
-                    document_path=str(pdf_file),
-                    document_type="job_description",
-                    document_id=f"job_desc_{pdf_file.stem}",
-                )
+            documents += [
+                IngestionJob(pdf_file, "job_description", f"job_desc_{pdf_file.stem}")
+                for pdf_file in pdf_files
+            ]
         else:
             print("No job descriptions found in reference_docs/job_descriptions/")
     else:
@@ -35,39 +48,140 @@ def main():
 
     case_study_file = reference_dir / "case_study_brief.pdf"
     if case_study_file.exists():
-        print(f"\nIngesting case study brief: {case_study_file.name}")
-        rag_service.ingest_document(
-            document_path=str(case_study_file),
-            document_type="case_study_brief",
-            document_id="case_study_brief",
+        print(f"Found case study brief: {case_study_file.name}")
+        documents.append(
+            IngestionJob(case_study_file, "case_study_brief", "case_study_brief")
         )
     else:
-        print("\nCase study brief not found: reference_docs/case_study_brief.pdf")
+        print("Case study brief not found: reference_docs/case_study_brief.pdf")
 
     rubrics_dir = reference_dir / "scoring_rubrics"
     if rubrics_dir.exists() and rubrics_dir.is_dir():
-        pdf_files = list(rubrics_dir.glob("*.pdf"))
+        pdf_files = sorted(rubrics_dir.glob("*.pdf"))
         if pdf_files:
-            print(f"\nFound {len(pdf_files)} scoring rubric(s)")
+            print(f"Found {len(pdf_files)} scoring rubric(s)")
             for pdf_file in pdf_files:
-                print(f"   Ingesting: {pdf_file.name}")
                 # Determine rubric type based on filename
                 doc_type = (
                     "cv_scoring_rubric"
                     if "cv" in pdf_file.stem.lower()
                     else "project_scoring_rubric"
                 )
-                rag_service.ingest_document(
-                    document_path=str(pdf_file),
-                    document_type=doc_type,
-                    document_id=f"rubric_{pdf_file.stem}",
+                documents.append(
+                    IngestionJob(pdf_file, doc_type, f"rubric_{pdf_file.stem}")
                 )
         else:
-            print("\nNo scoring rubrics found in reference_docs/scoring_rubrics/")
+            print("No scoring rubrics found in reference_docs/scoring_rubrics/")
     else:
-        print("\nScoring rubrics directory not found")
+        print("Scoring rubrics directory not found")
+
+    return documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--force", action="store_true", help="Re-ingest unchanged documents too"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processes parsing PDFs, 0 = one per CPU",
+    )
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    print("Starting reference documents ingestion...\n")
 
-    print("\nAll reference documents ingested successfully!")
+    documents = find_documents(Path(settings.REFERENCE_DOCS_DIR))
+    manifest = IngestManifest.load(Path(settings.CHROMA_PERSIST_DIR) / MANIFEST_FILE)
+
+    chunker = TextChunker.from_settings()
+    hashes = {doc.document_id: file_sha256(doc.path) for doc in documents}
+    changed = [
+        doc
+        for doc in documents
+        if args.force
+        or not manifest.is_current(
+            doc.document_id, hashes[doc.document_id], chunker.fingerprint
+        )
+    ]
+    removed = sorted(set(manifest.entries) - set(hashes))
+
+    if not changed and not removed:
+        elapsed = time.perf_counter() - started_at
+        print(f"\nAll reference documents are up to date ({elapsed * 1000:.0f}ms)")
+        return
+
+    # Loaded only when there is work, as ChromaDB is slow to import
+    from app.core.embeddings import CachedEmbeddingFunction
+    from app.services.rag_service import RAGService
+
+    rag_service = RAGService()
+    rag_service.initialize_collection()
+
+    def record(job: IngestionJob, chunks: int) -> None:
+        manifest.record(
+            job.document_id,
+            job.path,
+            job.document_type,
+            hashes[job.document_id],
+            chunker.fingerprint,
+            chunks,
+        )
+        manifest.save()
+
+    def forget(job: IngestionJob) -> None:
+        # Its chunks are gone, so the next run must ingest it again
+        if job.document_id in manifest.entries:
+            manifest.forget(job.document_id)
+            manifest.save()
+
+    stats = None
+    if changed:
+        workers = min(args.workers or os.cpu_count() or 1, len(changed))
+        print(f"\nIngesting {len(changed)} document(s) with {workers} worker(s)")
+        pipeline = IngestionPipeline(
+            rag_service,
+            workers=workers,
+            on_document=record,
+            chunker=chunker,
+            on_failure=forget,
+        )
+        stats = pipeline.run(changed)
+
+    for document_id in removed:
+        print(f"   Removing: {manifest.entries[document_id]['path']}")
+        rag_service.delete_document(document_id)
+        manifest.forget(document_id)
+        manifest.save()
+
+    elapsed = time.perf_counter() - started_at
+    if stats is not None:
+        print(
+            f"\nIngested {stats.documents} document(s), {stats.pages} page(s), "
+            f"{stats.chunks} chunk(s) in {stats.elapsed:.2f}s "
+            f"({stats.documents_per_second:.1f} docs/s, "
+            f"{stats.chunks_per_second:.0f} chunks/s)"
+        )
+        print(
+            f"Chunk size: {stats.mean_chunk_tokens:.0f} tokens on average, "
+            f"{stats.max_chunk_tokens} at most (budget {chunker.max_tokens})"
+        )
+        if isinstance(rag_service.embedding_function, CachedEmbeddingFunction):
+            cache_stats = rag_service.embedding_function.stats
+            print(
+                f"Embedding cache: {cache_stats.hits} hit(s), "
+                f"{cache_stats.misses} chunk(s) embedded "
+                f"({cache_stats.hit_rate:.0%} hit rate)"
+            )
+        if stats.failed:
+            print(f"Failed to ingest {stats.failed} document(s), rerun to retry")
+    print(
+        f"Removed {len(removed)}, skipped {len(documents) - len(changed)} "
+        f"unchanged document(s); total {elapsed:.2f}s"
+    )
     print(f"ChromaDB stored at: {settings.CHROMA_PERSIST_DIR}")
 
 
@@ -3,9 +3,12 @@ import shutil
 import sys
 import tempfile
 from typing import Generator
+from fakeredis import FakeAsyncRedis
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 from pathlib import Path
 
 import pytest
@@ -16,11 +19,16 @@ sys.path.insert(0, str(project_root))
 from app.config import settings  # noqa: E402
 
 settings.RATE_LIMIT_ENABLED = False
+settings.LLM_CACHE_BACKEND = "memory"
+settings.RESULT_CACHE_ENABLED = False
+settings.RAG_EMBEDDING_FUNCTION = "hashing"
+settings.RAG_EMBEDDING_CACHE_ENABLED = False
 
+from app.core.rate_limiter.base import RateLimitResult  # noqa: E402
 from app.core.rate_limiter.instance import get_rate_limiter  # noqa: E402
 from app.main import app  # noqa: E402
 from app.database.base import Base  # noqa: E402
-from app.database.session import get_db  # noqa: E402
+from app.database.session import get_async_db, get_db  # noqa: E402
 
 # Test database setup
 TEST_DATABASE_URL = f"postgresql+psycopg://{settings.POSTGRESQL_USER}:{settings.POSTGRESQL_PASSWORD}@{settings.POSTGRESQL_HOST}:{settings.POSTGRESQL_PORT}/cv_ai_test_db"
@@ -60,31 +68,46 @@ def engine():
 
 @pytest.fixture(scope="function")
 def db_session(engine):
-    connection = engine.connect()
-    transaction = connection.begin()
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=connection)
+    # Commits are real so the API's async sessions see the same data;
+    # tables are emptied after each test instead of rolling back
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     session = SessionLocal()
 
     yield session
 
     session.close()
-    transaction.rollback()
-    connection.close()
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
 
 
 @pytest.fixture(scope="function")
 def client(db_session: Session) -> Generator[TestClient, None, None]:
+    # NullPool: the TestClient runs the app on its own event loop, so
+    # connections must not outlive it
+    async_engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
     def override_get_db():
         try:
             yield db_session
         finally:
             pass
 
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
     def override_get_rate_limiter():
         class NoOpRateLimiter:
             async def is_allowed(self, *args, **kwargs):
                 return True, None
 
+            async def check(self, key, limits):
+                return RateLimitResult(True, limits[0].limit, limits[0].window, 999999)
+
             async def reset(self, *args, **kwargs):
                 pass
 
@@ -94,6 +117,7 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         return NoOpRateLimiter()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     app.dependency_overrides[get_rate_limiter] = override_get_rate_limiter
 
     with TestClient(app) as test_client:
@@ -127,6 +151,12 @@ def temp_chroma_dir():
     settings.CHROMA_PERSIST_DIR = original_chroma_dir
 
 
+@pytest.fixture
+def fake_redis() -> FakeAsyncRedis:
+    """In-memory Redis with the real command semantics, decoding like the app's client"""
+    return FakeAsyncRedis(decode_responses=True)
+
+
 @pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Get path to test fixtures directory"""
@@ -31,7 +31,7 @@ class TestEvaluateRoutes:
             "project_id": data["project_document"]["id"],
         }
 
-    @patch("app.workers.evaluation_worker.process_evaluation_task.delay")
+    @patch("app.routes.evaluate.enqueue_evaluation")
     def test_create_evaluation_success(
         self, mock_celery_task, client: TestClient, uploaded_documents
     ):
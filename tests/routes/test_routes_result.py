@@ -4,8 +4,13 @@ from io import BytesIO
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.core.evaluation_events import SSE_KEEP_ALIVE, format_sse
+from app.core.result_cache import EvaluationResultCache, get_result_cache
+from app.main import app
 from app.models.evaluation import Evaluation, EvaluationStatus
 from app.repositories.evaluation import EvaluationRepository
+from app.routes.result import stream_evaluation_events
+from app.schemas.evaluation import EvaluationEvent
 
 
 class TestResultRoutes:
@@ -139,3 +144,93 @@ class TestResultRoutes:
         response = client.get("/result/invalid-uuid/")
 
         assert response.status_code == 422
+
+    def test_get_evaluation_served_from_cache(
+        self,
+        client: TestClient,
+        created_evaluation: Evaluation,
+        db_session: Session,
+        fake_redis,
+    ):
+        cache = EvaluationResultCache(fake_redis)
+        app.dependency_overrides[get_result_cache] = lambda: cache
+
+        eval_repo = EvaluationRepository(db_session)
+        eval_repo.update_failed_status(created_evaluation, "LLM API timeout")
+
+        first = client.get(f"/result/{created_evaluation.id}/")
+        # Later reads never reach the database
+        db_session.delete(created_evaluation)
+        db_session.commit()
+        second = client.get(f"/result/{created_evaluation.id}/")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert second.json()["error_message"] == "LLM API timeout"
+
+    def test_stream_completed_evaluation(
+        self, client: TestClient, created_evaluation: Evaluation, db_session: Session
+    ):
+        eval_repo = EvaluationRepository(db_session)
+        eval_repo.save_results(created_evaluation, {"cv_match_rate": 0.82})
+
+        with client.stream(
+            "GET", f"/result/{created_evaluation.id}/stream"
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            body = "".join(response.iter_text())
+
+        assert body.count("event: status") == 1
+        assert '"status":"completed"' in body
+        assert '"cv_match_rate":0.82' in body
+
+    def test_stream_evaluation_not_found(self, client: TestClient):
+        fake_id = "0199b3f8-2757-7bee-b682-df515eaff6b0"  # Non-existent ID
+        response = client.get(f"/result/{fake_id}/stream")
+
+        assert response.status_code == 404
+
+
+class FakeSubscription:
+    def __init__(self, events):
+        self.events = list(events)
+
+    async def next_event(self, timeout: float):
+        return self.events.pop(0)
+
+
+class TestStreamEvaluationEvents:
+    @pytest.mark.asyncio
+    async def test_streams_until_final_event(self):
+        subscription = FakeSubscription(
+            [
+                EvaluationEvent(id="1", status="processing", stage="summary"),
+                None,
+                EvaluationEvent(id="1", status="completed"),
+                EvaluationEvent(id="1", status="processing"),  # Never read
+            ]
+        )
+        current = EvaluationEvent(id="1", status="queued")
+
+        messages = [
+            message async for message in stream_evaluation_events(current, subscription)
+        ]
+
+        assert len(messages) == 4
+        assert '"status":"queued"' in messages[0]
+        assert '"stage":"summary"' in messages[1]
+        assert messages[2] == SSE_KEEP_ALIVE
+        assert '"status":"completed"' in messages[3]
+        assert len(subscription.events) == 1
+
+    @pytest.mark.asyncio
+    async def test_final_status_closes_immediately(self):
+        current = EvaluationEvent(id="1", status="failed", error_message="timeout")
+
+        messages = [
+            message
+            async for message in stream_evaluation_events(current, FakeSubscription([]))
+        ]
+
+        assert messages == [format_sse(current)]
@@ -1,6 +1,9 @@
 from io import BytesIO
 from pathlib import Path
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.repositories.document import DocumentRepository
 
 
 class TestUploadRoutes:
@@ -107,9 +110,41 @@ class TestUploadRoutes:
         # Check CV file exists
         cv_dir = Path(temp_upload_dir) / "cv"
         assert cv_dir.exists()
-        assert len(list(cv_dir.glob("*.pdf"))) == 1
+        assert len(list(cv_dir.rglob("*.pdf"))) == 1
 
         # Check project file exists
         project_dir = Path(temp_upload_dir) / "reports"
         assert project_dir.exists()
-        assert len(list(project_dir.glob("*.pdf"))) == 1
+        assert len(list(project_dir.rglob("*.pdf"))) == 1
+
+    def test_upload_same_content_reuses_blob(
+        self,
+        client: TestClient,
+        sample_cv_pdf_content: bytes,
+        sample_project_pdf_content: bytes,
+        temp_upload_dir,
+        db_session: Session,
+    ):
+        document_ids = []
+        for _ in range(2):
+            response = client.post(
+                "/upload/",
+                files={
+                    "cv": ("cv.pdf", BytesIO(sample_cv_pdf_content), "application/pdf"),
+                    "project_report": (
+                        "project.pdf",
+                        BytesIO(sample_project_pdf_content),
+                        "application/pdf",
+                    ),
+                },
+            )
+            assert response.status_code == 200
+            document_ids.append(response.json()["cv_document"]["id"])
+
+        # Each upload keeps its own row, both pointing at one blob
+        doc_repo = DocumentRepository(db_session)
+        first, second = [doc_repo.get(document_id) for document_id in document_ids]
+        assert first.id != second.id
+        assert first.content_hash == second.content_hash
+        assert first.file_path == second.file_path
+        assert len(list((Path(temp_upload_dir) / "cv").rglob("*.pdf"))) == 1
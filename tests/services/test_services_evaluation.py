@@ -14,6 +14,7 @@ class TestEvaluationService:
     def evaluation_service(self):
         with patch("app.services.evaluation_service.RAGService"):
             service = EvaluationService()
+            service.events = MagicMock(publish=AsyncMock())
             return service
 
     @pytest.fixture
@@ -56,7 +57,7 @@ class TestEvaluationService:
         return evaluation
 
     @pytest.mark.asyncio
-    @patch("app.services.evaluation_service.extract_text_from_pdf")
+    @patch("app.services.evaluation_service.extract_pdf_text")
     async def test_process_evaluation_success(
         self,
         mock_extract_pdf,
@@ -66,11 +67,14 @@ class TestEvaluationService:
         db_session: Session,
     ):
         # Mock PDF extraction
-        mock_extract_pdf.side_effect = ["CV text content", "Project report content"]
+        mock_extract_pdf.side_effect = [
+            {"text": "CV text content", "page_count": 1},
+            {"text": "Project report content", "page_count": 2},
+        ]
 
         # Mock RAG service
-        evaluation_service.rag_service.retrieve_context = MagicMock(
-            return_value="Retrieved context"
+        evaluation_service.rag_service.retrieve_contexts = AsyncMock(
+            return_value=["Retrieved context"] * 4
         )
 
         # Mock LLM service responses
@@ -129,10 +133,146 @@ class TestEvaluationService:
                     assert results["project_score"] == 4.5
                     assert results["overall_summary"] == summary_response
 
+                    # All four retrievals go through one batched call
+                    evaluation_service.rag_service.retrieve_contexts.assert_awaited_once()
+                    queries = (
+                        evaluation_service.rag_service.retrieve_contexts.call_args.args[
+                            0
+                        ]
+                    )
+                    assert [query.document_type for query in queries] == [
+                        "job_description",
+                        "cv_scoring_rubric",
+                        "case_study_brief",
+                        "project_scoring_rubric",
+                    ]
+
                     # Verify evaluation status updated
                     db_session.refresh(mock_evaluation)
                     assert mock_evaluation.status == EvaluationStatus.COMPLETED.value
 
+    @pytest.mark.asyncio
+    @patch("app.services.evaluation_service.extract_pdf_text")
+    async def test_process_evaluation_reuses_extracted_text(
+        self,
+        mock_extract_pdf,
+        evaluation_service,
+        mock_evaluation,
+        mock_documents,
+        db_session: Session,
+    ):
+        mock_extract_pdf.side_effect = [
+            {"text": "CV text content", "page_count": 1},
+            {"text": "Project report content", "page_count": 3},
+        ]
+
+        evaluation_service.rag_service.retrieve_contexts = AsyncMock(
+            return_value=["Context"] * 4
+        )
+        evaluation_service.llm_service.evaluate_cv = AsyncMock(
+            return_value={"cv_match_rate": 0.8, "feedback": "Good"}
+        )
+        evaluation_service.llm_service.evaluate_project = AsyncMock(
+            return_value={"project_score": 4.0, "feedback": "Good"}
+        )
+        evaluation_service.llm_service.synthesize_summary = AsyncMock(
+            return_value="Summary"
+        )
+
+        doc_repo = DocumentRepository(db_session)
+        eval_repo = EvaluationRepository(db_session)
+
+        # Second run simulates a retry of the same evaluation
+        for _ in range(2):
+            await evaluation_service.process_evaluation(
+                evaluation_id=str(mock_evaluation.id),
+                doc_repo=doc_repo,
+                eval_repo=eval_repo,
+            )
+
+        assert mock_extract_pdf.call_count == 2
+        project_text = doc_repo.get_text(str(mock_documents["project"].id))
+        assert project_text.content == "Project report content"
+        assert project_text.page_count == 3
+
+        evaluation_service.llm_service.evaluate_cv.assert_awaited_with(
+            cv_text="CV text content",
+            job_description="Context",
+            scoring_rubric="Context",
+        )
+
+    @pytest.mark.asyncio
+    @patch("app.services.evaluation_service.extract_pdf_text")
+    async def test_process_evaluation_publishes_progress(
+        self, mock_extract_pdf, evaluation_service, mock_evaluation, db_session: Session
+    ):
+        mock_extract_pdf.side_effect = [
+            {"text": "CV text", "page_count": 1},
+            {"text": "Project text", "page_count": 1},
+        ]
+        evaluation_service.rag_service.retrieve_contexts = AsyncMock(
+            return_value=["Context"] * 4
+        )
+        evaluation_service.llm_service.evaluate_cv = AsyncMock(
+            return_value={"cv_match_rate": 0.8, "feedback": "Good"}
+        )
+        evaluation_service.llm_service.evaluate_project = AsyncMock(
+            return_value={"project_score": 4.0, "feedback": "Good"}
+        )
+        evaluation_service.llm_service.synthesize_summary = AsyncMock(
+            return_value="Summary"
+        )
+
+        await evaluation_service.process_evaluation(
+            evaluation_id=str(mock_evaluation.id),
+            doc_repo=DocumentRepository(db_session),
+            eval_repo=EvaluationRepository(db_session),
+        )
+
+        events = [
+            call.args[0] for call in evaluation_service.events.publish.await_args_list
+        ]
+        assert [(event.status, event.stage) for event in events] == [
+            (EvaluationStatus.PROCESSING, None),
+            (EvaluationStatus.PROCESSING, "text_extraction"),
+            (EvaluationStatus.PROCESSING, "contexts"),
+            (EvaluationStatus.PROCESSING, "cv_evaluation, project_evaluation"),
+            (EvaluationStatus.PROCESSING, "summary"),
+            (EvaluationStatus.COMPLETED, None),
+        ]
+        assert events[-1].result.overall_summary == "Summary"
+
+    @pytest.mark.asyncio
+    @patch("app.services.evaluation_service.extract_pdf_text")
+    async def test_load_document_text_reuses_same_content(
+        self, mock_extract_pdf, evaluation_service, db_session: Session
+    ):
+        mock_extract_pdf.return_value = {"text": "Shared CV text", "page_count": 1}
+
+        doc_repo = DocumentRepository(db_session)
+        documents = [
+            doc_repo.create(
+                {
+                    "filename": "abc.pdf",
+                    "original_filename": name,
+                    "file_path": "/tmp/abc.pdf",
+                    "file_size": 1024,
+                    "mime_type": "application/pdf",
+                    "document_type": DocumentType.CV,
+                    "content_hash": "ab" * 32,
+                }
+            )
+            for name in ["cv.pdf", "cv_again.pdf"]
+        ]
+
+        texts = [
+            await evaluation_service.load_document_text(document, doc_repo)
+            for document in documents
+        ]
+
+        assert texts == ["Shared CV text", "Shared CV text"]
+        mock_extract_pdf.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_process_evaluation_not_found(
         self, evaluation_service, db_session: Session
@@ -148,7 +288,7 @@ class TestEvaluationService:
             )
 
     @pytest.mark.asyncio
-    @patch("app.services.evaluation_service.extract_text_from_pdf")
+    @patch("app.services.evaluation_service.extract_pdf_text")
     async def test_process_evaluation_pdf_extraction_fails(
         self, mock_extract_pdf, evaluation_service, mock_evaluation, db_session: Session
     ):
@@ -170,21 +310,32 @@ class TestEvaluationService:
         assert mock_evaluation.status == EvaluationStatus.FAILED.value
 
     @pytest.mark.asyncio
-    @patch("app.services.evaluation_service.extract_text_from_pdf")
+    @patch("app.services.evaluation_service.extract_pdf_text")
     async def test_process_evaluation_llm_error(
         self, mock_extract_pdf, evaluation_service, mock_evaluation, db_session: Session
     ):
-        mock_extract_pdf.side_effect = ["CV text", "Project text"]
+        mock_extract_pdf.side_effect = [
+            {"text": "CV text", "page_count": 1},
+            {"text": "Project text", "page_count": 1},
+        ]
 
-        evaluation_service.rag_service.retrieve_context = MagicMock(
-            return_value="Context"
+        evaluation_service.rag_service.retrieve_contexts = AsyncMock(
+            return_value=["Context"] * 4
         )
 
         # Mock LLM service to raise exception
-        with patch.object(
-            evaluation_service.llm_service, "evaluate_cv", new_callable=AsyncMock
-        ) as mock_eval_cv:
+        with (
+            patch.object(
+                evaluation_service.llm_service, "evaluate_cv", new_callable=AsyncMock
+            ) as mock_eval_cv,
+            patch.object(
+                evaluation_service.llm_service,
+                "evaluate_project",
+                new_callable=AsyncMock,
+            ) as mock_eval_project,
+        ):
             mock_eval_cv.side_effect = Exception("LLM API error")
+            mock_eval_project.return_value = {"project_score": 4.0}
 
             doc_repo = DocumentRepository(db_session)
             eval_repo = EvaluationRepository(db_session)
@@ -200,3 +351,65 @@ class TestEvaluationService:
             db_session.refresh(mock_evaluation)
             assert mock_evaluation.status == EvaluationStatus.FAILED.value
             assert "LLM API error" in mock_evaluation.error_message
+
+            # Completed stages are kept for the retry
+            assert mock_evaluation.stage_outputs == {
+                "contexts": ["Context"] * 4,
+                "project_evaluation": {"project_score": 4.0},
+            }
+
+    @pytest.mark.asyncio
+    @patch("app.services.evaluation_service.extract_pdf_text")
+    async def test_process_evaluation_resumes_from_checkpoint(
+        self, mock_extract_pdf, evaluation_service, mock_evaluation, db_session: Session
+    ):
+        mock_extract_pdf.side_effect = [
+            {"text": "CV text", "page_count": 1},
+            {"text": "Project text", "page_count": 1},
+        ]
+        evaluation_service.rag_service.retrieve_contexts = AsyncMock()
+
+        eval_repo = EvaluationRepository(db_session)
+        eval_repo.save_checkpoint(mock_evaluation, "contexts", ["Context"] * 4)
+        eval_repo.save_checkpoint(
+            mock_evaluation, "cv_evaluation", {"cv_match_rate": 0.7, "feedback": "Ok"}
+        )
+
+        with (
+            patch.object(
+                evaluation_service.llm_service, "evaluate_cv", new_callable=AsyncMock
+            ) as mock_eval_cv,
+            patch.object(
+                evaluation_service.llm_service,
+                "evaluate_project",
+                new_callable=AsyncMock,
+            ) as mock_eval_project,
+            patch.object(
+                evaluation_service.llm_service,
+                "synthesize_summary",
+                new_callable=AsyncMock,
+            ) as mock_synthesize,
+        ):
+            mock_eval_project.return_value = {"project_score": 4.0}
+            mock_synthesize.return_value = "Summary"
+
+            results = await evaluation_service.process_evaluation(
+                evaluation_id=str(mock_evaluation.id),
+                doc_repo=DocumentRepository(db_session),
+                eval_repo=eval_repo,
+            )
+
+        # Only the missing stages ran
+        evaluation_service.rag_service.retrieve_contexts.assert_not_awaited()
+        mock_eval_cv.assert_not_awaited()
+        mock_eval_project.assert_awaited_once_with(
+            project_text="Project text",
+            case_study_brief="Context",
+            scoring_rubric="Context",
+        )
+        assert results["cv_match_rate"] == 0.7
+        assert results["project_score"] == 4.0
+
+        db_session.refresh(mock_evaluation)
+        assert mock_evaluation.status == EvaluationStatus.COMPLETED.value
+        assert mock_evaluation.stage_outputs is None
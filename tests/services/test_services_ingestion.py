@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.core.exceptions import RAGServiceException
+from app.services.ingestion_pipeline import IngestionJob, IngestionPipeline
+from app.services.rag_service import RAGService
+
+
+class TestIngestionPipeline:
+    @pytest.fixture
+    def rag_service(self, temp_chroma_dir):
+        rag_service = RAGService()
+        rag_service.initialize_collection()
+        rag_service.embedding_function = MagicMock(
+            side_effect=lambda texts: [[0.1, 0.2, 0.3] for _ in texts]
+        )
+        return rag_service
+
+    @pytest.fixture
+    def jobs(self, tmp_path, sample_cv_pdf_content):
+        jobs = []
+        for name in ["first", "second", "third"]:
+            pdf_file = tmp_path / f"{name}.pdf"
+            pdf_file.write_bytes(sample_cv_pdf_content)
+            jobs.append(IngestionJob(pdf_file, "job_description", f"job_desc_{name}"))
+        return jobs
+
+    def test_ingests_every_document(self, rag_service, jobs):
+        ingested = {}
+        pipeline = IngestionPipeline(
+            rag_service,
+            workers=2,
+            batch_size=2,
+            queue_size=1,
+            on_document=lambda job, chunks: ingested.update({job.document_id: chunks}),
+        )
+
+        stats = pipeline.run(jobs)
+
+        assert sorted(ingested) == [
+            "job_desc_first",
+            "job_desc_second",
+            "job_desc_third",
+        ]
+        assert stats.documents == 3
+        assert stats.failed == 0
+        assert stats.chunks == sum(ingested.values()) == rag_service.collection.count()
+        assert stats.pages > 0
+        # Every embedding call gets at most one batch
+        for call in rag_service.embedding_function.call_args_list:
+            assert len(call.args[0]) <= 2
+
+    def test_rerun_replaces_chunks(self, rag_service, jobs):
+        pipeline = IngestionPipeline(rag_service, workers=1)
+        first = pipeline.run(jobs)
+        version = rag_service.collection.metadata["version"]
+
+        second = pipeline.run(jobs[:1])
+
+        assert rag_service.collection.count() == first.chunks
+        assert second.documents == 1
+        assert rag_service.collection.metadata["version"] != version
+
+    def test_failed_document_is_skipped(self, rag_service, jobs, tmp_path):
+        invalid_file = tmp_path / "invalid.pdf"
+        invalid_file.write_bytes(b"not a pdf")
+        ingested = []
+        pipeline = IngestionPipeline(
+            rag_service,
+            workers=1,
+            on_document=lambda job, chunks: ingested.append(job.document_id),
+        )
+
+        stats = pipeline.run(
+            [IngestionJob(invalid_file, "job_description", "invalid"), *jobs]
+        )
+
+        assert stats.documents == 3
+        assert stats.failed == 1
+        assert "invalid" not in ingested
+        assert rag_service.collection.get(where={"document_id": "invalid"})["ids"] == []
+
+    def test_document_failing_after_a_write_is_removed(self, rag_service, jobs):
+        pipeline = IngestionPipeline(rag_service, workers=1, batch_size=1)
+        pipeline.run(jobs[:1])
+        version = rag_service.collection.metadata["version"]
+        add_chunks = rag_service.add_chunks
+        calls = []
+
+        def fail_second_batch(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                raise RuntimeError("write failed")
+            add_chunks(*args, **kwargs)
+
+        rag_service.add_chunks = fail_second_batch
+        failures = []
+        pipeline = IngestionPipeline(
+            rag_service,
+            workers=1,
+            batch_size=1,
+            on_failure=lambda job: failures.append(job.document_id),
+        )
+
+        stats = pipeline.run(jobs[:1])
+
+        assert (stats.documents, stats.failed) == (0, 1)
+        assert failures == ["job_desc_first"]
+        assert rag_service.collection.count() == 0
+        # Contexts memoized from the old chunks are invalidated
+        assert rag_service.collection.metadata["version"] != version
+
+    def test_requires_collection(self, temp_chroma_dir, jobs):
+        with pytest.raises(RAGServiceException, match="Collection not initialized"):
+            IngestionPipeline(RAGService()).run(jobs)
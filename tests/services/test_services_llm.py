@@ -5,6 +5,7 @@ import httpx
 
 from app.services.llm_service import LLMService
 from app.core.exceptions import LLMServiceException
+from app.core.http_client import close_http_client
 
 
 class TestLLMService:
@@ -75,6 +76,70 @@ That's all."""
             assert '{"result": "success"}' in result
             mock_post.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_generate_completion_reuses_shared_client(self, llm_service):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            first_client = llm_service.http_client
+            await llm_service.generate_completion("First prompt")
+            await llm_service.generate_completion("Second prompt")
+
+            assert mock_post.call_count == 2
+            assert llm_service.http_client is first_client
+            assert LLMService().http_client is first_client
+
+        await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_generate_completion_served_from_cache(self, llm_service):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "cached answer"}}],
+            "usage": {"total_tokens": 42},
+        }
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            first = await llm_service.generate_completion("Same prompt")
+            second = await llm_service.generate_completion("Same prompt")
+
+            assert first == second == "cached answer"
+            mock_post.assert_called_once()
+            assert llm_service.cache.stats.hits == 1
+            assert llm_service.cache.stats.saved_tokens == 42
+
+            # Different sampling params are a different request
+            await llm_service.generate_completion("Same prompt", temperature=0.9)
+            assert mock_post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_completion_not_kept_in_cache(self, llm_service):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "not json"}}]
+        }
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            for _ in range(2):
+                with pytest.raises(LLMServiceException):
+                    await llm_service.evaluate_cv(
+                        cv_text="Sample CV",
+                        job_description="Job desc",
+                        scoring_rubric="Rubric",
+                    )
+
+            assert mock_post.call_count == 2
+
     @pytest.mark.asyncio
     async def test_generate_completion_api_error(self, llm_service):
         mock_response = MagicMock()
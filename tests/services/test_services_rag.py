@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import patch
 
-from app.services.rag_service import RAGService
+from app.config import settings
+from app.services.rag_service import ContextQuery, RAGService
+from app.utils.text_chunker import estimate_tokens
 from app.core.exceptions import RAGServiceException
 
 
@@ -32,29 +34,24 @@ class TestRAGService:
         assert first_collection.name == second_collection.name
 
     def test_chunk_text_basic(self, rag_service):
-        text = "a" * 2500
-        chunks = rag_service._chunk_text(text, chunk_size=1000, overlap=100)
+        text = " ".join(f"Requirement {i} is Python experience." for i in range(200))
+        chunks = rag_service._chunk_text(text)
 
         assert len(chunks) > 1
-        assert len(chunks[0]) == 1000
+        assert all(
+            estimate_tokens(chunk) <= settings.RAG_CHUNK_MAX_TOKENS for chunk in chunks
+        )
 
-        # Check overlap
-        assert chunks[0][-100:] == chunks[1][:100]
+        # Consecutive chunks overlap by whole sentences
+        assert chunks[0].rsplit(". ", 1)[-1] in chunks[1]
 
     def test_chunk_text_small_text(self, rag_service):
         text = "Short text"
-        chunks = rag_service._chunk_text(text, chunk_size=1000)
+        chunks = rag_service._chunk_text(text)
 
         assert len(chunks) == 1
         assert chunks[0] == text
 
-    def test_chunk_text_custom_parameters(self, rag_service):
-        text = "x" * 3000
-        chunks = rag_service._chunk_text(text, chunk_size=500, overlap=50)
-
-        assert len(chunks) > 0
-        assert len(chunks[0]) == 500
-
     @patch("app.services.rag_service.extract_text_from_pdf")
     def test_ingest_document_success(self, mock_extract, rag_service, sample_pdf_file):
         mock_extract.return_value = "Sample document text for testing"
@@ -72,6 +69,123 @@ class TestRAGService:
         result = rag_service.collection.get(ids=["test_doc_1_chunk_0"])
         assert len(result["ids"]) > 0
 
+    @patch("app.services.rag_service.extract_text_from_pdf")
+    def test_ingest_document_batches_chunks(
+        self, mock_extract, rag_service, sample_pdf_file
+    ):
+        mock_extract.return_value = " ".join(["word"] * 900)  # Five chunks
+
+        rag_service.initialize_collection()
+        with (
+            patch.object(settings, "RAG_INGEST_BATCH_SIZE", 2),
+            patch.object(
+                rag_service.collection, "upsert", wraps=rag_service.collection.upsert
+            ) as mock_upsert,
+        ):
+            chunks = rag_service.ingest_document(
+                document_path=sample_pdf_file,
+                document_type="job_description",
+                document_id="batched_doc",
+            )
+
+        assert chunks == 5
+        assert [len(call.kwargs["ids"]) for call in mock_upsert.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+        assert rag_service.collection.count() == 5
+
+    @patch("app.services.rag_service.extract_text_from_pdf")
+    def test_reingest_replaces_stale_chunks(
+        self, mock_extract, rag_service, sample_pdf_file
+    ):
+        rag_service.initialize_collection()
+        mock_extract.return_value = " ".join(["word"] * 500)  # Three chunks
+        rag_service.ingest_document(sample_pdf_file, "job_description", "doc")
+
+        mock_extract.return_value = "Updated job description"
+        chunks = rag_service.ingest_document(sample_pdf_file, "job_description", "doc")
+
+        result = rag_service.collection.get(where={"document_id": "doc"})
+        assert chunks == 1
+        assert result["documents"] == ["Updated job description"]
+
+    @patch("app.services.rag_service.extract_text_from_pdf")
+    def test_reingest_replaces_chunks_without_document_id(
+        self, mock_extract, rag_service, sample_pdf_file
+    ):
+        # A collection from before chunks carried document_id metadata
+        legacy = rag_service.client.create_collection(
+            "reference_docs",
+            metadata={"description": "Reference documents for evaluation"},
+            embedding_function=rag_service.embedding_model,
+        )
+        legacy.add(
+            documents=[f"Old chunk {i}" for i in range(12)],
+            metadatas=[
+                {"type": "cv_scoring_rubric", "chunk_index": i} for i in range(12)
+            ],
+            ids=[f"rubric_cv_chunk_{i}" for i in range(12)],
+        )
+        legacy.add(
+            documents=["Other document"],
+            metadatas=[{"type": "job_description", "chunk_index": 0}],
+            ids=["rubric_cv_v2_chunk_0"],
+        )
+        # Migrated in several batches when the collection is opened
+        with patch("app.services.rag_service._MIGRATION_BATCH", 5):
+            rag_service.initialize_collection()
+        assert rag_service.collection.metadata["document_ids"] is True
+        mock_extract.return_value = " ".join(f"w{i}" for i in range(500))
+
+        chunks = rag_service.ingest_document(
+            sample_pdf_file, "cv_scoring_rubric", "rubric_cv"
+        )
+
+        result = rag_service.collection.get(where={"type": "cv_scoring_rubric"})
+        assert len(result["ids"]) == chunks == 3
+        assert all(m["document_id"] == "rubric_cv" for m in result["metadatas"])
+        assert not any(doc.startswith("Old chunk") for doc in result["documents"])
+        assert rag_service.collection.get(ids=["rubric_cv_v2_chunk_0"])["ids"] == [
+            "rubric_cv_v2_chunk_0"
+        ]
+
+    @patch("app.services.rag_service.extract_text_from_pdf")
+    def test_reingest_reuses_cached_embeddings(
+        self, mock_extract, temp_chroma_dir, sample_pdf_file, tmp_path
+    ):
+        settings.RAG_EMBEDDING_CACHE_ENABLED = True
+        settings.RAG_EMBEDDING_CACHE_PATH = str(tmp_path / "embeddings.sqlite3")
+        try:
+            rag_service = RAGService()
+        finally:
+            settings.RAG_EMBEDDING_CACHE_ENABLED = False
+        rag_service.initialize_collection()
+        # Three chunks
+        mock_extract.return_value = " ".join(f"w{i}" for i in range(500))
+
+        rag_service.ingest_document(sample_pdf_file, "job_description", "doc")
+        rag_service.ingest_document(sample_pdf_file, "job_description", "doc")
+        rag_service.retrieve_context("word1", "job_description")
+        rag_service.retrieve_context("word1", "job_description")
+
+        assert rag_service.embedding_function.stats.misses == 4
+        assert rag_service.embedding_function.stats.hits == 4
+        assert rag_service.collection.count() == 3
+
+    @patch("app.services.rag_service.extract_text_from_pdf")
+    def test_delete_document(self, mock_extract, rag_service, sample_pdf_file):
+        rag_service.initialize_collection()
+        mock_extract.return_value = "First document text"
+        rag_service.ingest_document(sample_pdf_file, "job_description", "doc_1")
+        mock_extract.return_value = "Second document text"
+        rag_service.ingest_document(sample_pdf_file, "job_description", "doc_2")
+
+        rag_service.delete_document("doc_1")
+
+        assert rag_service.collection.get()["ids"] == ["doc_2_chunk_0"]
+
     @patch("app.services.rag_service.extract_text_from_pdf")
     def test_ingest_document_no_text(self, mock_extract, rag_service, sample_pdf_file):
         mock_extract.return_value = ""
@@ -115,6 +229,92 @@ class TestRAGService:
         assert isinstance(context, str)
         assert len(context) > 0
 
+    @pytest.mark.asyncio
+    @patch("app.services.rag_service.extract_text_from_pdf")
+    async def test_retrieve_contexts_batch(
+        self, mock_extract, rag_service, sample_pdf_file
+    ):
+        rag_service.initialize_collection()
+
+        mock_extract.return_value = "Backend developer with Python and FastAPI"
+        rag_service.ingest_document(
+            document_path=sample_pdf_file,
+            document_type="job_description",
+            document_id="job_doc",
+        )
+        mock_extract.return_value = "CV rubric: technical skills weighted 40%"
+        rag_service.ingest_document(
+            document_path=sample_pdf_file,
+            document_type="cv_scoring_rubric",
+            document_id="rubric_doc",
+        )
+
+        contexts = await rag_service.retrieve_contexts(
+            [
+                ContextQuery("Python developer", "job_description", top_k=2),
+                ContextQuery("scoring rubric", "cv_scoring_rubric", top_k=2),
+                ContextQuery("anything", "case_study_brief", top_k=2),
+            ]
+        )
+
+        assert contexts == [
+            "Backend developer with Python and FastAPI",
+            "CV rubric: technical skills weighted 40%",
+            "",
+        ]
+
+    @pytest.mark.asyncio
+    @patch("app.services.rag_service.extract_text_from_pdf")
+    async def test_retrieve_contexts_memoizes_static_queries(
+        self, mock_extract, rag_service, sample_pdf_file
+    ):
+        rag_service.initialize_collection()
+        mock_extract.return_value = "CV rubric: technical skills weighted 40%"
+        rag_service.ingest_document(
+            document_path=sample_pdf_file,
+            document_type="cv_scoring_rubric",
+            document_id="rubric_doc",
+        )
+        query = ContextQuery("scoring rubric", "cv_scoring_rubric", 2, static=True)
+
+        first = await rag_service.retrieve_contexts([query])
+        with patch.object(
+            rag_service, "_query_by_embedding", side_effect=AssertionError
+        ):
+            second = await rag_service.retrieve_contexts([query])
+
+        assert first == second == ["CV rubric: technical skills weighted 40%"]
+
+    @pytest.mark.asyncio
+    @patch("app.services.rag_service.extract_text_from_pdf")
+    async def test_static_contexts_invalidated_on_ingest(
+        self, mock_extract, rag_service, sample_pdf_file
+    ):
+        rag_service.initialize_collection()
+        query = ContextQuery("scoring rubric", "cv_scoring_rubric", 2, static=True)
+        await rag_service.precompute_contexts([query])
+        assert await rag_service.retrieve_contexts([query]) == [""]
+
+        version = rag_service.get_collection_version()
+        mock_extract.return_value = "CV rubric: technical skills weighted 40%"
+        rag_service.ingest_document(
+            document_path=sample_pdf_file,
+            document_type="cv_scoring_rubric",
+            document_id="rubric_doc",
+        )
+
+        assert rag_service.get_collection_version() != version
+        assert await rag_service.retrieve_contexts([query]) == [
+            "CV rubric: technical skills weighted 40%"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_contexts_without_collection(self, rag_service):
+        with pytest.raises(RAGServiceException):
+            await rag_service.retrieve_contexts(
+                [ContextQuery("test query", "job_description")]
+            )
+
     def test_retrieve_context_without_collection(self, rag_service):
         with pytest.raises(RAGServiceException):
             rag_service.retrieve_context(
@@ -10,7 +10,7 @@ from app.repositories.evaluation import EvaluationRepository
 
 class TestEndToEndWorkflow:
     @pytest.mark.asyncio
-    @patch("app.workers.evaluation_worker.process_evaluation_task.delay")
+    @patch("app.routes.evaluate.enqueue_evaluation")
     @patch("app.utils.pdf_parser.extract_text_from_pdf")
     async def test_complete_evaluation_workflow(
         self,
@@ -103,7 +103,7 @@ class TestEndToEndWorkflow:
         assert final_data["result"]["cv_match_rate"] == 0.85
         assert final_data["result"]["project_score"] == 4.7
 
-    @patch("app.workers.evaluation_worker.process_evaluation_task.delay")
+    @patch("app.routes.evaluate.enqueue_evaluation")
     def test_workflow_with_invalid_documents(
         self,
         mock_celery_task,
@@ -136,7 +136,7 @@ class TestEndToEndWorkflow:
         eval_response = client.post("/evaluate/", json=eval_payload)
         assert eval_response.status_code == 404
 
-    @patch("app.workers.evaluation_worker.process_evaluation_task.delay")
+    @patch("app.routes.evaluate.enqueue_evaluation")
     def test_workflow_multiple_evaluations(
         self,
         mock_celery_task,
@@ -209,7 +209,7 @@ class TestEndToEndWorkflow:
         response = client.post("/upload/", files={"cv": cv_file})
         assert response.status_code == 422
 
-    @patch("app.workers.evaluation_worker.process_evaluation_task.delay")
+    @patch("app.routes.evaluate.enqueue_evaluation")
     def test_workflow_evaluation_failure(
         self,
         mock_celery_task,
@@ -0,0 +1,171 @@
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from app.config import settings
+from app.core.embeddings import (
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    HashingEmbeddingFunction,
+    create_embedding_cache,
+    create_embedding_function,
+    model_key,
+    text_key,
+)
+
+
+class TestHashingEmbeddingFunction:
+    def test_deterministic_unit_vectors(self):
+        embedder = HashingEmbeddingFunction(dimensions=64)
+
+        first, second = embedder(["Backend developer", "Backend developer"])
+
+        assert first.shape == (64,)
+        assert np.array_equal(first, second)
+        assert np.linalg.norm(first) == pytest.approx(1.0)
+        assert np.array_equal(
+            first, HashingEmbeddingFunction(64)(["backend DEVELOPER"])[0]
+        )
+
+    def test_shared_words_are_closer(self):
+        query, related, unrelated = HashingEmbeddingFunction()(
+            [
+                "Python backend developer",
+                "Senior Python backend engineer",
+                "Weekly grocery shopping list",
+            ]
+        )
+
+        assert np.dot(query, related) > np.dot(query, unrelated)
+
+    def test_config_round_trip(self):
+        embedder = HashingEmbeddingFunction(dimensions=32)
+
+        rebuilt = HashingEmbeddingFunction.build_from_config(embedder.get_config())
+
+        assert rebuilt.dimensions == 32
+        assert model_key(embedder) == 'hashing:{"dimensions": 32}'
+
+
+class TestEmbeddingCache:
+    def test_store_and_load(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.sqlite3")
+        key = text_key("hello")
+
+        cache.set_many("model-a", [(key, [0.5, 0.25])])
+
+        assert cache.get_many("model-b", [key]) == {}
+        found = cache.get_many("model-a", [key, text_key("other")])
+        assert list(found) == [key]
+        assert found[key].tolist() == [0.5, 0.25]
+
+    def test_survives_reopening(self, tmp_path):
+        path = tmp_path / "embeddings.sqlite3"
+        cache = EmbeddingCache(path)
+        cache.set_many("model", [(text_key("hello"), [1.0])])
+        cache.close()
+
+        reopened = EmbeddingCache(path)
+
+        assert len(reopened) == 1
+        reopened.clear()
+        assert len(reopened) == 0
+
+    def test_lookup_larger_than_one_query(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.sqlite3")
+        keys = [text_key(str(i)) for i in range(1200)]
+        cache.set_many("model", [(key, [float(i)]) for i, key in enumerate(keys)])
+
+        assert len(cache.get_many("model", keys)) == 1200
+
+
+class TestCachedEmbeddingFunction:
+    @pytest.fixture
+    def inner(self):
+        return MagicMock(wraps=HashingEmbeddingFunction(dimensions=16))
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return EmbeddingCache(tmp_path / "embeddings.sqlite3")
+
+    def test_embeds_only_missing_texts(self, inner, cache):
+        embedder = CachedEmbeddingFunction(inner, cache)
+
+        first = embedder(["one", "two"])
+        second = embedder(["two", "three", "one"])
+
+        assert [call.args[0] for call in inner.call_args_list] == [
+            ["one", "two"],
+            ["three"],
+        ]
+        assert np.array_equal(second[0], first[1])
+        assert np.array_equal(second[2], first[0])
+        assert embedder.stats.as_dict() == {"hits": 2, "misses": 3, "hit_rate": 0.4}
+
+    def test_duplicates_embedded_once(self, inner, cache):
+        embedder = CachedEmbeddingFunction(inner, cache)
+
+        first, second = embedder(["same", "same"])
+
+        inner.assert_called_once_with(["same"])
+        assert np.array_equal(first, second)
+
+    def test_shared_between_processes_through_file(self, inner, cache, tmp_path):
+        CachedEmbeddingFunction(inner, cache)(["text"])
+
+        other = CachedEmbeddingFunction(
+            inner, EmbeddingCache(tmp_path / "embeddings.sqlite3")
+        )
+        other(["text"])
+
+        assert inner.call_count == 1
+        assert other.stats.hits == 1
+
+
+class TestCreateEmbeddingFunction:
+    @pytest.fixture(autouse=True)
+    def restore_settings(self):
+        original = (
+            settings.RAG_EMBEDDING_FUNCTION,
+            settings.RAG_EMBEDDING_CACHE_ENABLED,
+            settings.RAG_EMBEDDING_CACHE_PATH,
+        )
+        yield
+        (
+            settings.RAG_EMBEDDING_FUNCTION,
+            settings.RAG_EMBEDDING_CACHE_ENABLED,
+            settings.RAG_EMBEDDING_CACHE_PATH,
+        ) = original
+
+    def test_configured_function(self):
+        settings.RAG_EMBEDDING_FUNCTION = "hashing"
+
+        assert isinstance(create_embedding_function(), HashingEmbeddingFunction)
+
+    def test_cache(self, tmp_path):
+        settings.RAG_EMBEDDING_CACHE_ENABLED = True
+        settings.RAG_EMBEDDING_CACHE_PATH = str(tmp_path / "cache" / "embeddings.db")
+
+        assert isinstance(create_embedding_cache(), EmbeddingCache)
+        assert (tmp_path / "cache" / "embeddings.db").exists()
+
+    def test_cache_defaults_to_chroma_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "CHROMA_PERSIST_DIR", str(tmp_path))
+        settings.RAG_EMBEDDING_CACHE_ENABLED = True
+        settings.RAG_EMBEDDING_CACHE_PATH = None
+
+        cache = create_embedding_cache()
+
+        assert cache.path == tmp_path / "embedding_cache.sqlite3"
+        assert cache.path.exists()
+
+    def test_cache_disabled(self):
+        settings.RAG_EMBEDDING_CACHE_ENABLED = False
+
+        assert create_embedding_cache() is None
+
+    def test_unknown_function(self):
+        settings.RAG_EMBEDDING_FUNCTION = "unknown"
+
+        with pytest.raises(ValueError, match="Unknown embedding function"):
+            create_embedding_function()
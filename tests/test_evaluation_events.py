@@ -0,0 +1,38 @@
+import pytest
+from app.core.evaluation_events import EvaluationEvents
+from app.schemas.evaluation import EvaluationEvent
+
+
+@pytest.mark.asyncio
+class TestEvaluationEvents:
+    async def test_subscribers_share_one_connection(self, fake_redis):
+        events = EvaluationEvents(fake_redis)
+        try:
+            first = await events.subscribe("1")
+            second = await events.subscribe("1")
+            other = await events.subscribe("2")
+
+            await events.publish(EvaluationEvent(id="1", status="processing"))
+
+            for subscription in (first, second):
+                event = await subscription.next_event(timeout=1.0)
+                assert event.status == "processing"
+            assert await other.next_event(timeout=0.1) is None
+            assert len(events._pubsub.channels) == 2
+        finally:
+            await events.close()
+
+    async def test_channel_kept_until_last_subscriber_closes(self, fake_redis):
+        events = EvaluationEvents(fake_redis)
+        try:
+            first = await events.subscribe("1")
+            second = await events.subscribe("1")
+
+            await first.close()
+            await events.publish(EvaluationEvent(id="1", status="completed"))
+
+            assert (await second.next_event(timeout=1.0)).status == "completed"
+            await second.close()
+            assert events._subscriptions == {}
+        finally:
+            await events.close()
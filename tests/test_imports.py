@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+
+# Worker-only dependencies the API must never load
+WORKER_ONLY_MODULES = ["chromadb", "pypdf", "tenacity", "app.services.rag_service"]
+
+# Cumulative import time of app.main; loading the worker graph took ~2.6s
+IMPORT_BUDGET_SECONDS = 2.0
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module loaded by module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestApiImports:
+    @pytest.fixture(scope="class")
+    def times(self):
+        return import_times("app.main")
+
+    def test_worker_graph_not_imported(self, times):
+        assert [module for module in WORKER_ONLY_MODULES if module in times] == []
+        assert "app.workers.evaluation_worker" not in times
+
+    def test_import_time_budget(self, times):
+        assert times["app.main"] / 1_000_000 < IMPORT_BUDGET_SECONDS
+
+    def test_worker_still_registers_task(self):
+        from app.workers.celery_app import PROCESS_EVALUATION_TASK, celery_app
+        from app.workers import evaluation_worker
+
+        assert evaluation_worker.process_evaluation_task.name == PROCESS_EVALUATION_TASK
+        assert PROCESS_EVALUATION_TASK in celery_app.tasks
@@ -0,0 +1,103 @@
+import pytest
+import asyncio
+from app.core.llm_cache import (
+    CachedCompletion,
+    InMemoryCompletionCache,
+    TieredCompletionCache,
+    make_cache_key,
+)
+
+
+def _entry(text: str) -> CachedCompletion:
+    return CachedCompletion(completion=text, latency=1.5, total_tokens=100)
+
+
+class TestCacheKey:
+    def test_same_request_same_key(self):
+        key1 = make_cache_key("model-a", "prompt", 0.2, 2000)
+        key2 = make_cache_key("model-a", "prompt", 0.2, 2000)
+        assert key1 == key2
+
+    def test_sampling_params_change_key(self):
+        base = make_cache_key("model-a", "prompt", 0.2, 2000)
+        assert make_cache_key("model-b", "prompt", 0.2, 2000) != base
+        assert make_cache_key("model-a", "prompt!", 0.2, 2000) != base
+        assert make_cache_key("model-a", "prompt", 0.3, 2000) != base
+        assert make_cache_key("model-a", "prompt", 0.2, 500) != base
+
+
+@pytest.mark.asyncio
+class TestInMemoryCompletionCache:
+    async def test_hit_and_miss_counters(self):
+        cache = InMemoryCompletionCache()
+
+        assert await cache.get("key") is None
+        await cache.set("key", _entry("cached"))
+        entry = await cache.get("key")
+
+        assert entry["completion"] == "cached"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.saved_seconds == 1.5
+        assert cache.stats.saved_tokens == 100
+        assert cache.stats.hit_rate == 0.5
+
+    async def test_lru_eviction(self):
+        cache = InMemoryCompletionCache(max_entries=2)
+
+        await cache.set("key1", _entry("1"))
+        await cache.set("key2", _entry("2"))
+        # Touch key1 so key2 becomes least recently used
+        await cache.get("key1")
+        await cache.set("key3", _entry("3"))
+
+        assert len(cache) == 2
+        assert await cache.get("key1") is not None
+        assert await cache.get("key2") is None
+        assert await cache.get("key3") is not None
+
+    async def test_ttl_expiry(self):
+        cache = InMemoryCompletionCache(ttl=1)
+
+        await cache.set("key", _entry("cached"))
+        await asyncio.sleep(1.1)
+
+        assert await cache.get("key") is None
+        assert len(cache) == 0
+
+    async def test_delete(self):
+        cache = InMemoryCompletionCache()
+
+        await cache.set("key", _entry("cached"))
+        await cache.delete("key")
+
+        assert await cache.get("key") is None
+
+
+@pytest.mark.asyncio
+class TestTieredCompletionCache:
+    async def test_shared_hit_promotes_to_local(self):
+        local = InMemoryCompletionCache()
+        shared = InMemoryCompletionCache()
+        cache = TieredCompletionCache(local=local, shared=shared)
+
+        await shared.set("key", _entry("from shared"))
+
+        entry = await cache.get("key")
+        assert entry["completion"] == "from shared"
+        assert len(local) == 1
+
+        await cache.get("key")
+        assert shared.stats.hits == 1
+        assert local.stats.hits == 1
+        assert cache.stats.hits == 2
+
+    async def test_set_writes_both_tiers(self):
+        local = InMemoryCompletionCache()
+        shared = InMemoryCompletionCache()
+        cache = TieredCompletionCache(local=local, shared=shared)
+
+        await cache.set("key", _entry("cached"))
+
+        assert len(local) == 1
+        assert len(shared) == 1
@@ -1,6 +1,21 @@
 import pytest
 import asyncio
-from app.core.rate_limiter import InMemoryRateLimiter
+import time
+from collections import deque
+from unittest.mock import AsyncMock
+from fakeredis import FakeAsyncRedis
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from app.core.rate_limiter import (
+    HybridRateLimiter,
+    InMemoryGCRARateLimiter,
+    InMemoryRateLimiter,
+    RateLimit,
+    RedisGCRARateLimiter,
+    RedisRateLimiter,
+    RateLimitMiddleware,
+)
 
 
 @pytest.mark.asyncio
@@ -112,15 +127,15 @@ class TestInMemoryRateLimiter:
 
     async def test_cleanup_expired(self):
         limiter = InMemoryRateLimiter()
+        now = time.monotonic()
 
         # Add some entries
-        async with limiter._lock:
-            limiter._requests["key1"].append(1000.0)  # Old timestamp
-            limiter._requests["key2"].append(9999999999.0)  # Future timestamp
-            limiter._requests["key3"].append(1000.0)  # Old timestamp
+        limiter._requests["key1"] = deque([now - 1000])  # Old timestamp
+        limiter._requests["key2"] = deque([now + 1000])  # Future timestamp
+        limiter._requests["key3"] = deque([now - 1000])  # Old timestamp
 
         # Cleanup with window of 60 seconds
-        await limiter.cleanup_expired(window=60)
+        await limiter.cleanup_expired(window=60, batch_size=2)
 
         # Old entries should be removed
         assert "key1" not in limiter._requests
@@ -128,6 +143,41 @@ class TestInMemoryRateLimiter:
         # Recent entry should remain
         assert "key2" in limiter._requests
 
+    async def test_evicts_least_recently_used_keys(self):
+        limiter = InMemoryRateLimiter(max_keys=3)
+
+        for key in ["a", "b", "c"]:
+            await limiter.is_allowed(key, 5, 60)
+        await limiter.is_allowed("a", 5, 60)  # Most recently used again
+        await limiter.is_allowed("d", 5, 60)
+
+        assert len(limiter._requests) == 3
+        assert list(limiter._requests) == ["c", "a", "d"]
+        assert await limiter.get_remaining("a", 5) == 3
+
+    async def test_sweeper_drops_expired_keys(self):
+        limiter = InMemoryRateLimiter(sweep_interval=0.05)
+        await limiter.is_allowed("key", 5, 1)
+
+        limiter.start_sweeper()
+        await asyncio.sleep(1.2)
+        await limiter.stop_sweeper()
+
+        assert len(limiter._requests) == 0
+        assert limiter._sweeper is None
+
+    async def test_retry_after_with_shorter_tier(self):
+        limiter = InMemoryRateLimiter()
+        limits = [RateLimit(2, 10), RateLimit(100, 3600)]
+
+        await limiter.check("key", limits)
+        await limiter.check("key", limits)
+        result = await limiter.check("key", limits)
+
+        assert result.allowed is False
+        assert (result.limit, result.window) == (2, 10)
+        assert 0 < result.retry_after <= 10
+
     async def test_concurrent_requests(self):
         limiter = InMemoryRateLimiter()
         key = "test_key"
@@ -158,3 +208,392 @@ class TestInMemoryRateLimiter:
         assert is_allowed is False
         assert retry_after is not None
         assert 0 < retry_after <= window + 1
+
+
+@pytest.mark.asyncio
+class TestRedisRateLimiter:
+    @pytest.fixture
+    def limiter(self):
+        return RedisRateLimiter(FakeAsyncRedis(decode_responses=True))
+
+    async def test_blocks_requests_over_limit(self, limiter):
+        limit = 3
+        window = 60
+
+        for _ in range(limit):
+            is_allowed, retry_after = await limiter.is_allowed("key", limit, window)
+            assert is_allowed is True
+            assert retry_after is None
+
+        is_allowed, retry_after = await limiter.is_allowed("key", limit, window)
+        assert is_allowed is False
+        assert 0 < retry_after <= window + 1
+        assert await limiter.get_remaining("key", limit) == 0
+
+    async def test_key_expires_with_window(self, limiter):
+        await limiter.is_allowed("key", 5, 30)
+
+        assert 0 < await limiter.redis.ttl("rate_limit:key") <= 30
+
+    async def test_concurrent_requests(self, limiter):
+        results = await asyncio.gather(
+            *[limiter.is_allowed("key", 10, 60) for _ in range(15)]
+        )
+
+        assert sum(1 for is_allowed, _ in results if is_allowed) == 10
+
+    async def test_reloads_flushed_script(self, limiter):
+        await limiter.load_scripts()
+        await limiter.redis.script_flush()
+
+        is_allowed, _ = await limiter.is_allowed("key", 1, 60)
+        assert is_allowed is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "make_limiter",
+    [
+        InMemoryGCRARateLimiter,
+        lambda: RedisGCRARateLimiter(FakeAsyncRedis(decode_responses=True)),
+    ],
+    ids=["memory", "redis"],
+)
+class TestGCRARateLimiter:
+    async def test_allows_burst_up_to_limit(self, make_limiter):
+        limiter = make_limiter()
+        limit = 5
+        window = 60
+
+        for expected_remaining in range(limit - 1, -1, -1):
+            is_allowed, retry_after = await limiter.is_allowed("key", limit, window)
+            assert is_allowed is True
+            assert retry_after is None
+            assert await limiter.get_remaining("key", limit) == expected_remaining
+
+        is_allowed, retry_after = await limiter.is_allowed("key", limit, window)
+        assert is_allowed is False
+        # One request is freed every window / limit seconds
+        assert 0 < retry_after <= window // limit
+
+    async def test_requests_freed_over_time(self, make_limiter):
+        limiter = make_limiter()
+        limit = 4
+        window = 2  # One request freed every 0.5 seconds
+
+        for _ in range(limit):
+            await limiter.is_allowed("key", limit, window)
+        is_allowed, _ = await limiter.is_allowed("key", limit, window)
+        assert is_allowed is False
+
+        await asyncio.sleep(0.6)
+
+        is_allowed, _ = await limiter.is_allowed("key", limit, window)
+        assert is_allowed is True
+        is_allowed, _ = await limiter.is_allowed("key", limit, window)
+        assert is_allowed is False
+
+    async def test_reset(self, make_limiter):
+        limiter = make_limiter()
+
+        await limiter.is_allowed("key", 1, 60)
+        is_allowed, _ = await limiter.is_allowed("key", 1, 60)
+        assert is_allowed is False
+
+        await limiter.reset("key")
+
+        is_allowed, _ = await limiter.is_allowed("key", 1, 60)
+        assert is_allowed is True
+        assert await limiter.get_remaining("other", 1) == 1
+
+    async def test_concurrent_requests(self, make_limiter):
+        limiter = make_limiter()
+
+        results = await asyncio.gather(
+            *[limiter.is_allowed("key", 10, 60) for _ in range(15)]
+        )
+
+        assert sum(1 for is_allowed, _ in results if is_allowed) == 10
+
+
+@pytest.mark.asyncio
+class TestInMemoryGCRARateLimiter:
+    async def test_state_is_constant_per_key(self):
+        limiter = InMemoryGCRARateLimiter()
+
+        for _ in range(1000):
+            await limiter.is_allowed("key", 1000, 3600)
+
+        assert len(limiter._state) == 1
+        assert await limiter.get_remaining("key", 1000) == 0
+
+    async def test_cleanup_expired(self):
+        limiter = InMemoryGCRARateLimiter()
+        limiter._state["old"] = {RateLimit(1, 1): 0.0}
+        await limiter.is_allowed("recent", 1, 60)
+
+        await limiter.cleanup_expired()
+
+        assert "old" not in limiter._state
+        assert "recent" in limiter._state
+
+    async def test_evicts_least_recently_used_key(self):
+        limiter = InMemoryGCRARateLimiter(max_keys=3)
+
+        for key in ["a", "b", "c"]:
+            await limiter.is_allowed(key, 5, 60)
+        await limiter.is_allowed("a", 5, 60)  # Most recently used again
+        await limiter.is_allowed("d", 5, 60)
+
+        assert list(limiter._state) == ["c", "a", "d"]
+        assert await limiter.get_remaining("a", 5) == 3
+
+    async def test_sweeper_drops_expired_keys(self):
+        limiter = InMemoryGCRARateLimiter(sweep_interval=0.05)
+        await limiter.is_allowed("key", 5, 1)
+
+        limiter.start_sweeper()
+        await asyncio.sleep(0.5)
+        await limiter.stop_sweeper()
+
+        assert len(limiter._state) == 0
+        assert limiter._sweeper is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "make_limiter",
+    [
+        InMemoryRateLimiter,
+        lambda: RedisRateLimiter(FakeAsyncRedis(decode_responses=True)),
+        InMemoryGCRARateLimiter,
+        lambda: RedisGCRARateLimiter(FakeAsyncRedis(decode_responses=True)),
+    ],
+    ids=["memory", "redis", "memory-gcra", "redis-gcra"],
+)
+class TestMultiTierLimits:
+    async def test_reports_tightest_allowed_tier(self, make_limiter):
+        limiter = make_limiter()
+
+        result = await limiter.check("a", [RateLimit(2, 60), RateLimit(100, 3600)])
+        assert result.allowed is True
+        assert (result.limit, result.window, result.remaining) == (2, 60, 1)
+
+        result = await limiter.check("b", [RateLimit(5, 60), RateLimit(3, 3600)])
+        assert result.allowed is True
+        assert (result.limit, result.window, result.remaining) == (3, 3600, 2)
+
+    async def test_longer_window_binds(self, make_limiter):
+        limiter = make_limiter()
+        limits = [RateLimit(10, 60), RateLimit(3, 3600)]
+
+        for _ in range(3):
+            result = await limiter.check("key", limits)
+            assert result.allowed is True
+
+        result = await limiter.check("key", limits)
+        assert result.allowed is False
+        assert (result.limit, result.window, result.remaining) == (3, 3600, 0)
+        assert 60 < result.retry_after <= 3600 + 1
+
+    async def test_rejected_request_not_counted(self, make_limiter):
+        limiter = make_limiter()
+        limits = [RateLimit(2, 60), RateLimit(10, 3600)]
+
+        for _ in range(5):
+            await limiter.check("key", limits)
+
+        result = await limiter.check("key", [RateLimit(10, 3600)])
+        # Only the two allowed requests used the hourly quota
+        assert result.remaining == 7
+
+
+@pytest.mark.asyncio
+class TestHybridRateLimiter:
+    @pytest.fixture
+    def redis(self):
+        return FakeAsyncRedis(decode_responses=True)
+
+    def counting(self, limiter):
+        script = limiter._lease
+
+        async def lease(**kwargs):
+            return await script(**kwargs)
+
+        limiter._lease = AsyncMock(side_effect=lease)
+        return limiter._lease
+
+    async def test_spends_lease_locally(self, redis):
+        limiter = HybridRateLimiter(redis, lease_size=5)
+        lease = self.counting(limiter)
+
+        for expected_remaining in range(9, 4, -1):
+            result = await limiter.check("key", [RateLimit(10, 60)])
+            assert result.allowed is True
+            assert result.remaining == expected_remaining
+
+        assert lease.await_count == 1
+        await limiter.check("key", [RateLimit(10, 60)])
+        assert lease.await_count == 2
+
+    async def test_concurrent_first_requests_share_leases(self, redis):
+        limiter = HybridRateLimiter(redis, lease_size=10)
+        script = limiter._lease
+
+        async def slow_lease(**kwargs):
+            await asyncio.sleep(0.01)
+            return await script(**kwargs)
+
+        limiter._lease = slow_lease
+        limits = [RateLimit(25, 60), RateLimit(1000, 3600)]
+
+        burst = await asyncio.gather(*[limiter.check("key", limits) for _ in range(8)])
+        sequential = [await limiter.check("key", limits) for _ in range(20)]
+
+        # No lease taken by the burst is left unspendable
+        assert sum(result.allowed for result in burst + sequential) == 25
+
+    async def test_replicas_share_limit(self, redis):
+        replicas = [HybridRateLimiter(redis, lease_size=3) for _ in range(3)]
+
+        results = await asyncio.gather(
+            *[replicas[i % 3].is_allowed("key", 10, 60) for i in range(30)]
+        )
+
+        assert sum(1 for is_allowed, _ in results if is_allowed) == 10
+
+    async def test_used_up_window_rejected_locally(self, redis):
+        limiter = HybridRateLimiter(redis, lease_size=2)
+        lease = self.counting(limiter)
+
+        for _ in range(3):
+            await limiter.is_allowed("key", 3, 60)
+        for _ in range(3):
+            is_allowed, retry_after = await limiter.is_allowed("key", 3, 60)
+            assert is_allowed is False
+            assert 0 < retry_after <= 60
+
+        # Two leases cover the window; rejections need no Redis call
+        assert lease.await_count == 2
+
+    async def test_new_window_leases_again(self, redis):
+        limiter = HybridRateLimiter(redis, lease_size=5)
+
+        await limiter.is_allowed("key", 1, 1)
+        is_allowed, _ = await limiter.is_allowed("key", 1, 1)
+        assert is_allowed is False
+
+        await asyncio.sleep(1.1)
+
+        is_allowed, _ = await limiter.is_allowed("key", 1, 1)
+        assert is_allowed is True
+
+    async def test_reset(self, redis):
+        limiter = HybridRateLimiter(redis)
+
+        await limiter.is_allowed("key", 1, 60)
+        await limiter.reset("key")
+
+        is_allowed, _ = await limiter.is_allowed("key", 1, 60)
+        assert is_allowed is True
+        assert await limiter.get_remaining("key", 1) == 0
+        assert await limiter.get_remaining("other", 1) == 1
+
+    async def test_evicts_least_recently_used_keys(self, redis):
+        limiter = HybridRateLimiter(redis, max_keys=2)
+
+        for key in ["a", "b", "a", "c"]:
+            await limiter.is_allowed(key, 10, 60)
+
+        assert list(limiter._leases) == ["a", "c"]
+
+
+class CountingRateLimiter(InMemoryRateLimiter):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def check(self, key, limits):
+        self.calls += 1
+        return await super().check(key, limits)
+
+    async def get_remaining(self, key, limit):
+        self.calls += 1
+        return await super().get_remaining(key, limit)
+
+
+class TestRateLimitMiddleware:
+    @pytest.fixture
+    def backend(self):
+        return CountingRateLimiter()
+
+    @pytest.fixture
+    def client(self, backend):
+        app = FastAPI()
+
+        @app.get("/items")
+        async def items():
+            return {"ok": True}
+
+        @app.get("/stream")
+        async def stream():
+            async def chunks():
+                for chunk in ["a", "b", "c"]:
+                    yield chunk
+
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        @app.get("/health")
+        async def health():
+            return {"status": "healthy"}
+
+        app.add_middleware(
+            RateLimitMiddleware,
+            backend=lambda: backend,
+            limits=[RateLimit(3, 60), RateLimit(10, 3600)],
+            exclude_paths=["/health"],
+        )
+        return TestClient(app)
+
+    def test_headers_from_single_backend_call(self, client, backend):
+        response = client.get("/items")
+
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "3"
+        assert response.headers["X-RateLimit-Remaining"] == "2"
+        assert response.headers["X-RateLimit-Window"] == "60"
+        assert backend.calls == 1
+
+    def test_blocks_requests_over_limit(self, client):
+        for _ in range(3):
+            assert client.get("/items").status_code == 200
+
+        response = client.get("/items")
+
+        assert response.status_code == 429
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+        assert int(response.headers["Retry-After"]) > 0
+        assert response.json()["detail"] == "Rate limit exceeded"
+
+    def test_streaming_response_passes_through(self, client):
+        response = client.get("/stream")
+
+        assert response.text == "abc"
+        assert response.headers["X-RateLimit-Remaining"] == "2"
+
+    def test_excluded_paths_skip_backend(self, client, backend):
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert "X-RateLimit-Limit" not in response.headers
+        assert backend.calls == 0
+
+    def test_forwarded_for_is_the_key(self, client):
+        for _ in range(3):
+            client.get("/items", headers={"X-Forwarded-For": "1.1.1.1, 10.0.0.1"})
+
+        blocked = client.get("/items", headers={"X-Forwarded-For": "1.1.1.1"})
+        other = client.get("/items", headers={"X-Forwarded-For": "2.2.2.2"})
+
+        assert blocked.status_code == 429
+        assert other.status_code == 200
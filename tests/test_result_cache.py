@@ -0,0 +1,54 @@
+import pytest
+from redis.exceptions import ConnectionError
+from app.core.result_cache import EvaluationResultCache
+from app.schemas.evaluation import EvaluationResponse, EvaluationResult
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise ConnectionError("Redis unavailable")
+
+    async def set(self, key, value, ex=None):
+        raise ConnectionError("Redis unavailable")
+
+
+@pytest.mark.asyncio
+class TestEvaluationResultCache:
+    async def test_final_results_use_long_ttl(self, fake_redis):
+        cache = EvaluationResultCache(fake_redis, ttl=3600, pending_ttl=2)
+
+        completed = EvaluationResponse(
+            id="completed",
+            status="completed",
+            result=EvaluationResult(cv_match_rate=0.82),
+        )
+        failed = EvaluationResponse(
+            id="failed", status="failed", error_message="LLM API timeout"
+        )
+        processing = EvaluationResponse(id="processing", status="processing")
+
+        for response in [completed, failed, processing]:
+            await cache.set(response)
+
+        assert await fake_redis.ttl("evaluation_result:completed") == 3600
+        assert await fake_redis.ttl("evaluation_result:failed") == 3600
+        assert await fake_redis.ttl("evaluation_result:processing") == 2
+
+    async def test_get_returns_serialized_response(self, fake_redis):
+        cache = EvaluationResultCache(fake_redis)
+        response = EvaluationResponse(
+            id="1", status="completed", result=EvaluationResult(project_score=4.5)
+        )
+
+        body = await cache.set(response)
+
+        assert await cache.get("1") == body
+        assert EvaluationResponse.model_validate_json(body) == response
+        assert await cache.get("2") is None
+
+    async def test_redis_errors_are_misses(self):
+        cache = EvaluationResultCache(BrokenRedis())
+        response = EvaluationResponse(id="1", status="queued")
+
+        assert await cache.set(response) == response.model_dump_json()
+        assert await cache.get("1") is None
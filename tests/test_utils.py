@@ -1,4 +1,7 @@
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 from fastapi.datastructures import Headers
 import httpx
 import pytest
@@ -11,8 +14,20 @@ import shutil
 from tenacity import RetryError
 
 from app.utils.file_handler import save_upload_file, delete_file
-from app.utils.pdf_parser import extract_text_from_pdf, get_pdf_metadata
-from app.core.exceptions import FileSizeException, FileTypeException
+from app.utils.ingest_manifest import IngestManifest, file_sha256
+from app.utils.text_chunker import TextChunker, chunk_stats, estimate_tokens
+from app.utils import pdf_parser
+from app.utils.pdf_parser import (
+    extract_pdf_text,
+    extract_text_from_pdf,
+    get_pdf_metadata,
+    iter_pdf_pages,
+)
+from app.core.exceptions import (
+    FileSizeException,
+    FileTypeException,
+    PDFParseException,
+)
 from app.config import settings
 from app.utils.retry import retry_on_llm_error
 
@@ -38,20 +53,52 @@ class TestFileHandler:
             headers=Headers({"content-type": "application/pdf"}),
         )
 
-        filename, file_path, file_size = await save_upload_file(
+        filename, file_path, file_size, content_hash = await save_upload_file(
             upload_file, "test_subdir"
         )
 
         assert filename.endswith(".pdf")
         assert Path(file_path).exists()
         assert file_size == len(sample_cv_pdf_content)
+        assert content_hash == hashlib.sha256(sample_cv_pdf_content).hexdigest()
+
+        settings.UPLOAD_DIR = original_dir
+
+    @pytest.mark.asyncio
+    async def test_save_upload_file_deduplicates_content(
+        self, sample_cv_pdf_content: bytes, temp_dir
+    ):
+        original_dir = settings.UPLOAD_DIR
+        settings.UPLOAD_DIR = temp_dir
+
+        stored_files = []
+        for name in ["first.pdf", "second.pdf"]:
+            upload_file = UploadFile(
+                filename=name,
+                file=BytesIO(sample_cv_pdf_content),
+                headers=Headers({"content-type": "application/pdf"}),
+            )
+            stored_files.append(await save_upload_file(upload_file, "test_subdir"))
+
+        first, second = stored_files
+        assert first.file_path == second.file_path
+        assert first.content_hash == second.content_hash
+
+        # Stored once, sharded by the leading hash characters
+        blobs = list((Path(temp_dir) / "test_subdir").rglob("*.pdf"))
+        assert blobs == [Path(first.file_path)]
+        assert blobs[0].parent.name == first.content_hash[2:4]
+        assert blobs[0].parent.parent.name == first.content_hash[:2]
 
         settings.UPLOAD_DIR = original_dir
 
     @pytest.mark.asyncio
     async def test_save_upload_file_too_large(self, temp_dir):
+        original_dir = settings.UPLOAD_DIR
+        settings.UPLOAD_DIR = temp_dir
+
         # Create file larger than MAX_FILE_SIZE
-        large_content = b"x" * (settings.MAX_FILE_SIZE + 1)
+        large_content = b"%PDF-" + b"x" * settings.MAX_FILE_SIZE
 
         upload_file = UploadFile(
             filename="large.pdf",
@@ -62,6 +109,8 @@ class TestFileHandler:
         with pytest.raises(FileSizeException):
             await save_upload_file(upload_file, "test_subdir")
 
+        settings.UPLOAD_DIR = original_dir
+
     @pytest.mark.asyncio
     async def test_save_upload_file_invalid_type(self, temp_dir):
         upload_file = UploadFile(
@@ -73,6 +122,50 @@ class TestFileHandler:
         with pytest.raises(FileTypeException):
             await save_upload_file(upload_file, "test_subdir")
 
+    @pytest.mark.asyncio
+    async def test_save_upload_file_too_large_removes_partial_file(self, temp_dir):
+        original_dir = settings.UPLOAD_DIR
+        original_chunk_size = settings.UPLOAD_CHUNK_SIZE
+        settings.UPLOAD_DIR = temp_dir
+        settings.UPLOAD_CHUNK_SIZE = 1024
+
+        large_content = b"%PDF-" + b"x" * settings.MAX_FILE_SIZE
+        upload_file = UploadFile(
+            filename="large.pdf",
+            file=BytesIO(large_content),
+            headers=Headers({"content-type": "application/pdf"}),
+        )
+
+        try:
+            with pytest.raises(FileSizeException):
+                await save_upload_file(upload_file, "test_subdir")
+
+            # Aborted mid-stream, well before reading the whole body
+            assert upload_file.file.tell() <= settings.MAX_FILE_SIZE + 1024
+            assert list((Path(temp_dir) / "test_subdir").iterdir()) == []
+        finally:
+            settings.UPLOAD_DIR = original_dir
+            settings.UPLOAD_CHUNK_SIZE = original_chunk_size
+
+    @pytest.mark.asyncio
+    async def test_save_upload_file_rejects_non_pdf_content(self, temp_dir):
+        original_dir = settings.UPLOAD_DIR
+        settings.UPLOAD_DIR = temp_dir
+
+        upload_file = UploadFile(
+            filename="fake.pdf",
+            file=BytesIO(b"MZ\x90\x00 definitely not a pdf"),
+            headers=Headers({"content-type": "application/pdf"}),
+        )
+
+        try:
+            with pytest.raises(FileTypeException):
+                await save_upload_file(upload_file, "test_subdir")
+
+            assert list((Path(temp_dir) / "test_subdir").iterdir()) == []
+        finally:
+            settings.UPLOAD_DIR = original_dir
+
     @pytest.mark.asyncio
     async def test_save_upload_file_invalid_extension(
         self, sample_cv_pdf_content: bytes, temp_dir
@@ -100,7 +193,7 @@ class TestFileHandler:
         )
 
         subdir = "new/nested/dir"
-        filename, file_path, file_size = await save_upload_file(upload_file, subdir)
+        filename, file_path, file_size, _ = await save_upload_file(upload_file, subdir)
 
         assert Path(temp_dir) / subdir in Path(file_path).parents
         assert Path(file_path).exists()
@@ -154,6 +247,95 @@ class TestPDFParser:
         assert isinstance(text, str)
         assert "Backend Developer" in text
 
+    def test_extract_pdf_text_page_count(self, sample_cv_pdf_content: bytes, tmp_path):
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(sample_cv_pdf_content)
+
+        pdf_text = extract_pdf_text(str(pdf_file))
+
+        assert pdf_text["page_count"] >= 1
+        assert pdf_text["text"] == extract_text_from_pdf(str(pdf_file))
+
+    def test_extract_pdf_text_parallel_matches_serial(
+        self, sample_project_pdf_content: bytes, tmp_path
+    ):
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(sample_project_pdf_content)
+
+        original_min_pages = settings.PDF_PARALLEL_MIN_PAGES
+        settings.PDF_PARALLEL_MIN_PAGES = 1
+        try:
+            serial = extract_pdf_text(str(pdf_file), workers=1)
+            parallel = extract_pdf_text(str(pdf_file), workers=3)
+        finally:
+            settings.PDF_PARALLEL_MIN_PAGES = original_min_pages
+
+        assert parallel == serial
+        assert serial["page_count"] > 1
+
+    def test_page_range_error_not_wrapped_twice(
+        self, sample_project_pdf_content: bytes, tmp_path
+    ):
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(sample_project_pdf_content)
+
+        original_min_pages = settings.PDF_PARALLEL_MIN_PAGES
+        settings.PDF_PARALLEL_MIN_PAGES = 1
+        try:
+            # Threads share the patched page reader, unlike processes
+            with (
+                ThreadPoolExecutor(max_workers=2) as pool,
+                patch("app.utils.pdf_parser._get_process_pool", return_value=pool),
+                patch(
+                    "app.utils.pdf_parser._iter_reader_pages",
+                    side_effect=ValueError("bad page"),
+                ),
+                pytest.raises(PDFParseException) as exc_info,
+            ):
+                extract_pdf_text(str(pdf_file), workers=2)
+        finally:
+            settings.PDF_PARALLEL_MIN_PAGES = original_min_pages
+
+        assert str(exc_info.value) == "Failed to parse PDF: bad page"
+
+    def test_process_pool_spawned_once(self):
+        with patch("app.utils.pdf_parser._process_pool", None):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                pools = list(
+                    executor.map(lambda _: pdf_parser._get_process_pool(2), range(8))
+                )
+            pool = pools[0]
+            pool.shutdown()
+
+        assert all(other is pool for other in pools)
+        # Never forked from a process running other threads
+        assert pool._mp_context.get_start_method() == "spawn"
+
+    def test_iter_pdf_pages_streams_pages(
+        self, sample_project_pdf_content: bytes, tmp_path
+    ):
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(sample_project_pdf_content)
+
+        pages = iter_pdf_pages(str(pdf_file))
+        first_page = next(pages)
+        pages.close()
+
+        assert first_page
+        assert extract_text_from_pdf(str(pdf_file)).startswith(first_page.strip())
+
+    def test_extract_text_from_pdf_max_chars(
+        self, sample_project_pdf_content: bytes, tmp_path
+    ):
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(sample_project_pdf_content)
+
+        full_text = extract_text_from_pdf(str(pdf_file))
+        text = extract_text_from_pdf(str(pdf_file), max_chars=500)
+
+        assert len(text) == 500
+        assert full_text.startswith(text)
+
     def test_extract_text_from_pdf_not_found(self):
         with pytest.raises(Exception):
             extract_text_from_pdf("/nonexistent/file.pdf")
@@ -235,3 +417,129 @@ class TestRetryDecorator:
 
         # Should try 3 times (initial + 2 retries)
         assert call_count == 3
+
+
+class TestIngestManifest:
+    def test_file_sha256(self, tmp_path):
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"x" * 3000)
+
+        assert (
+            file_sha256(path, chunk_size=1024)
+            == hashlib.sha256(b"x" * 3000).hexdigest()
+        )
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        manifest = IngestManifest.load(path)
+        manifest.record("doc", Path("doc.pdf"), "job_description", "abc", "v1", 3)
+        manifest.save()
+
+        loaded = IngestManifest.load(path)
+
+        assert loaded.is_current("doc", "abc", "v1") is True
+        assert loaded.is_current("doc", "def", "v1") is False
+        assert loaded.is_current("doc", "abc", "v2") is False
+        assert loaded.is_current("other", "abc", "v1") is False
+        assert loaded.entries["doc"]["chunks"] == 3
+
+    def test_forget(self, tmp_path):
+        manifest = IngestManifest.load(tmp_path / "manifest.json")
+        manifest.record("doc", Path("doc.pdf"), "job_description", "abc", "v1", 3)
+
+        manifest.forget("doc")
+
+        assert manifest.is_current("doc", "abc", "v1") is False
+
+    def test_unreadable_manifest_starts_empty(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json")
+
+        assert IngestManifest.load(path).entries == {}
+
+
+class TestTextChunker:
+    def test_chunks_stay_within_budget(self):
+        text = " ".join(f"Sentence number {i} is here." for i in range(200))
+        chunker = TextChunker(max_tokens=50, overlap_tokens=10)
+
+        chunks = chunker.chunk(text)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+        # Sentences are never cut
+        assert all(chunk.endswith("here.") for chunk in chunks)
+
+    def test_overlap_repeats_whole_sentences(self):
+        text = " ".join(f"Sentence number {i} is here." for i in range(20))
+        chunker = TextChunker(max_tokens=30, overlap_tokens=10)
+
+        first, second = chunker.chunk(text)[:2]
+
+        last_sentence = first.rsplit(". ", 1)[-1]
+        assert second.startswith(last_sentence)
+
+    def test_joins_soft_wrapped_lines(self):
+        text = (
+            "Technical Skills Match (Weight: \n40%)\nAlignment with job \nrequirements."
+        )
+
+        assert TextChunker().chunk(text) == [
+            "Technical Skills Match (Weight: 40%)\nAlignment with job requirements."
+        ]
+
+    def test_heading_starts_new_chunk(self):
+        section = " ".join(["Backend work with Python and FastAPI."] * 8)
+        text = f"About the Job\n{section}\nAbout You\n{section}"
+        # Too small for both sections
+        chunker = TextChunker(max_tokens=80, overlap_tokens=20)
+
+        chunks = chunker.chunk(text)
+
+        assert [chunk.splitlines()[0] for chunk in chunks] == [
+            "About the Job",
+            "About You",
+        ]
+
+    def test_short_sections_merged(self):
+        text = "Experience Level\nYears of experience.\nAchievements\nImpact of work."
+
+        assert TextChunker().chunk(text) == [text]
+
+    def test_drops_bullet_only_lines(self):
+        text = "First point.\n •\n ◦\n 1.\nSecond point."
+
+        assert TextChunker().chunk(text) == ["First point.\nSecond point."]
+
+    def test_long_sentence_split_between_words(self):
+        text = " ".join(["word"] * 120)
+
+        chunks = TextChunker(max_tokens=50, overlap_tokens=0).chunk(text)
+
+        assert [estimate_tokens(chunk) for chunk in chunks] == [50, 50, 20]
+
+    def test_long_word_split_between_characters(self):
+        url = "https://example.com/" + "a" * 600
+
+        chunks = TextChunker(max_tokens=50, overlap_tokens=0).chunk(f"See {url}")
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+        assert "".join(chunk.replace(" ", "") for chunk in chunks) == f"See{url}"
+
+    def test_estimate_counts_long_words_as_several_tokens(self):
+        assert estimate_tokens("the cat sat.") == 4
+        assert estimate_tokens("internationalization") == 4
+
+    def test_empty_text(self):
+        assert TextChunker().chunk("") == []
+
+    def test_chunk_stats(self):
+        stats = chunk_stats(["one two", "one two three four"])
+
+        assert (stats.chunks, stats.total_tokens) == (2, 6)
+        assert (stats.min_tokens, stats.max_tokens) == (2, 4)
+        assert stats.mean_tokens == 3.0
+
+    def test_fingerprint_follows_settings(self):
+        assert TextChunker(100, 10).fingerprint != TextChunker(200, 10).fingerprint
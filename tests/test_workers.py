@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.workers import evaluation_worker
+from app.core.http_client import get_http_client
+from app.core.llm_cache import CacheStats
+from app.core.redis_client import redis_client
+from app.workers.loop import WorkerEventLoop, run_in_worker_loop
+from app.workers.metrics import WorkerMetrics
+
+
+class TestWorkerMetrics:
+    def test_first_task_is_cold_start(self):
+        metrics = WorkerMetrics()
+
+        assert metrics.record_task(5.0) is True
+        assert metrics.record_task(1.0) is False
+        assert metrics.record_task(3.0) is False
+
+        assert metrics.cold_start_seconds == 5.0
+        assert metrics.warm_tasks == 2
+        assert metrics.warm_mean_seconds == 2.0
+        assert metrics.warm_max_seconds == 3.0
+        assert metrics.as_dict()["tasks"] == 3
+
+    def test_empty_metrics(self):
+        metrics = WorkerMetrics()
+
+        assert metrics.tasks == 0
+        assert metrics.warm_mean_seconds == 0.0
+        assert metrics.as_dict()["cold_start_seconds"] is None
+
+
+class TestEvaluationServiceSingleton:
+    def test_service_built_once_per_process(self):
+        with (
+            patch.object(evaluation_worker, "_evaluation_service", None),
+            patch.object(evaluation_worker, "EvaluationService") as mock_service,
+        ):
+            first = evaluation_worker.get_evaluation_service()
+            second = evaluation_worker.get_evaluation_service()
+
+        assert first is second
+        mock_service.assert_called_once_with()
+
+    def test_process_init_warms_up_in_background(self):
+        warm_up_started = threading.Event()
+        release = threading.Event()
+
+        def slow_warm_up():
+            warm_up_started.set()
+            release.wait()
+
+        with (
+            patch.object(evaluation_worker, "_warm_up_thread", None),
+            patch.object(
+                evaluation_worker, "warm_up_worker_process", side_effect=slow_warm_up
+            ),
+        ):
+            started_at = time.perf_counter()
+            evaluation_worker.init_worker_process()
+            init_seconds = time.perf_counter() - started_at
+
+            assert warm_up_started.wait(1)
+            assert evaluation_worker._warm_up_thread.is_alive()
+            release.set()
+            evaluation_worker.wait_for_warm_up()
+            assert not evaluation_worker._warm_up_thread.is_alive()
+
+        assert init_seconds < 0.5
+
+
+class TestLLMCacheStats:
+    def test_reports_cache_of_built_service(self):
+        service = MagicMock()
+        service.llm_service.cache.stats = CacheStats(hits=3, misses=1, saved_tokens=90)
+
+        with patch.object(evaluation_worker, "_evaluation_service", service):
+            stats = evaluation_worker.llm_cache_stats()
+
+        assert stats["hits"] == 3
+        assert stats["saved_tokens"] == 90
+        assert stats["hit_rate"] == 0.75
+
+    def test_none_without_cache(self):
+        service = MagicMock()
+        service.llm_service.cache = None
+
+        with patch.object(evaluation_worker, "_evaluation_service", service):
+            assert evaluation_worker.llm_cache_stats() is None
+        with patch.object(evaluation_worker, "_evaluation_service", None):
+            assert evaluation_worker.llm_cache_stats() is None
+
+
+class TestWorkerEventLoop:
+    def test_loop_reused_across_tasks(self):
+        worker_loop = WorkerEventLoop()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        try:
+            first = worker_loop.run(current_loop())
+            second = worker_loop.run(current_loop())
+        finally:
+            worker_loop.stop()
+
+        assert first is second
+        assert first.is_closed()
+        assert not worker_loop.running
+
+    def test_concurrent_tasks_share_loop(self):
+        worker_loop = WorkerEventLoop()
+
+        async def wait_on_io():
+            await asyncio.sleep(0.2)
+            return True
+
+        started_at = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                results = list(
+                    executor.map(lambda _: worker_loop.run(wait_on_io()), range(5))
+                )
+        finally:
+            worker_loop.stop()
+
+        assert results == [True] * 5
+        assert time.perf_counter() - started_at < 0.8
+
+    def test_exceptions_propagate(self):
+        worker_loop = WorkerEventLoop()
+
+        async def fail():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                worker_loop.run(fail())
+        finally:
+            worker_loop.stop()
+
+    def test_fresh_loops_close_http_client(self):
+        async def current_client():
+            return get_http_client()
+
+        with patch("app.workers.loop.settings.CELERY_PERSISTENT_EVENT_LOOP", False):
+            first = run_in_worker_loop(current_client())
+            second = run_in_worker_loop(current_client())
+
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+    def test_fresh_loops_reset_redis_pool(self):
+        async def current_pool():
+            return redis_client.connection_pool
+
+        with patch("app.workers.loop.settings.CELERY_PERSISTENT_EVENT_LOOP", False):
+            first = run_in_worker_loop(current_pool())
+            second = run_in_worker_loop(current_pool())
+
+        # Each asyncio.run leaves an unused pool for the next loop
+        assert first is not second
+        assert second is not redis_client.connection_pool
+        assert redis_client.connection_pool.connection_kwargs == (
+            first.connection_kwargs
+        )